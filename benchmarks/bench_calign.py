@@ -0,0 +1,60 @@
+"""
+Compare the compiled and the pure-Python alignment kernels.
+
+The script runs LexStat scoring and cognate detection as well as the alignment
+of all cognate sets on the test wordlists with both versions of
+`lingpy.algorithm.cython.calign` and `lingpy.algorithm.cython.misc` and checks
+that they yield identical results.
+"""
+import pathlib
+import random
+import time
+
+import lingpy.align.multiple
+import lingpy.compare.lexstat
+from lingpy import LexStat, Alignments
+from lingpy.algorithm.cython import _calign, _misc
+
+try:
+    from lingpy.algorithm.cython import calign, misc
+except ImportError:
+    calign, misc = None, None
+
+TEST_DATA = pathlib.Path(__file__).parent.parent / 'tests' / 'test_data'
+WORDLISTS = ['KSL.qlc', 'KSL2.qlc', 'KSL3.qlc']
+
+
+def run(filename, backend, scorer_backend):
+    lingpy.compare.lexstat.calign = backend
+    lingpy.compare.lexstat.misc = scorer_backend
+    lingpy.align.multiple.calign = backend
+    random.seed(1234)
+    start = time.time()
+    lex = LexStat(str(TEST_DATA / filename))
+    lex.get_scorer(runs=100)
+    lex.cluster(method='lexstat', threshold=0.6, ref='benchid')
+    columns = ['doculect', 'concept', 'ipa', 'tokens', 'benchid']
+    alm = {0: columns}
+    for idx in lex:
+        alm[idx] = [lex[idx, column] for column in columns]
+    alm = Alignments(alm, ref='benchid')
+    alm.align()
+    return time.time() - start, (
+        lex.get_entries('benchid'), alm.get_entries('alignment'))
+
+
+def main():
+    if not calign:
+        print('The compiled alignment kernels are not available.')
+        return
+    print('{0:12} {1:>10} {2:>10} {3:>8}  {4}'.format(
+        'wordlist', 'python', 'compiled', 'speedup', 'identical'))
+    for filename in WORDLISTS:
+        tpy, rpy = run(filename, _calign, _misc)
+        tc, rc = run(filename, calign, misc)
+        print('{0:12} {1:9.2f}s {2:9.2f}s {3:7.2f}x  {4}'.format(
+            filename, tpy, tc, tpy / tc, rpy == rc))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Time the coverage checks of `lingpy.compare.sanity` on large word lists.
+
+The script creates word lists with a growing number of doculects, each of
+which lacks a random share of the concepts, and reports the time needed by
+`mutual_coverage_check`, `average_coverage` and `mutual_coverage_subset`,
+along with the size of the largest subset of doculects with the required
+mutual coverage.
+"""
+import random
+import sys
+import time
+
+from lingpy import Wordlist
+from lingpy.compare import sanity
+
+SIZES = [int(x) for x in sys.argv[1:]] or [100, 500, 2000]
+CONCEPTS = 200
+THRESHOLD = 150
+
+
+def wordlist(ntaxa, nconcepts):
+    data = {0: ['doculect', 'concept']}
+    for taxon in range(ntaxa):
+        coverage = random.uniform(0.7, 1.0)
+        for concept in range(nconcepts):
+            if random.random() < coverage:
+                data[len(data)] = ['L{0}'.format(taxon), 'c{0}'.format(concept)]
+    return Wordlist(data)
+
+
+def main():
+    random.seed(1234)
+    for size in SIZES:
+        wl = wordlist(size, CONCEPTS)
+        times = []
+        start = time.time()
+        sanity.mutual_coverage_check(wl, THRESHOLD)
+        times.append(time.time() - start)
+        start = time.time()
+        sanity.average_coverage(wl)
+        times.append(time.time() - start)
+        start = time.time()
+        best, subsets = sanity.mutual_coverage_subset(wl, THRESHOLD)
+        times.append(time.time() - start)
+        print('{0:6} doculects  check {1:6.2f}s  average {2:6.2f}s  '
+              'subset {3:6.2f}s  ({4} doculects)'.format(size, *times, best))
+
+
+if __name__ == '__main__':
+    main()
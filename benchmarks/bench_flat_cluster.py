@@ -0,0 +1,60 @@
+"""
+Time flat cluster analyses of large distance matrices.
+
+The script creates distance matrices in which the items fall into groups of
+similar items, with distances rounded to two digits in order to produce ties,
+as well as matrices whose distances are drawn from five values only, so that
+most clusters share their minimal distance, and reports the time needed by
+`clustering.flat_cluster` for UPGMA, single linkage, and complete linkage,
+along with the number of clusters.
+"""
+import random
+import sys
+import time
+
+from lingpy.algorithm.clustering import flat_cluster
+
+SIZES = [int(x) for x in sys.argv[1:]] or [100, 300, 1000]
+GROUP = 8
+
+
+def distances(size):
+    matrix = [[0.0 for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1, size):
+            if i // GROUP == j // GROUP:
+                score = random.uniform(0.05, 0.4)
+            else:
+                score = random.uniform(0.5, 1.0)
+            matrix[i][j] = matrix[j][i] = round(score, 2)
+    return matrix
+
+
+def tied_distances(size):
+    matrix = [[0.0 for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1, size):
+            matrix[i][j] = matrix[j][i] = round(random.randint(1, 5) * 0.2, 1)
+    return matrix
+
+
+def main():
+    random.seed(1234)
+    for name, create, threshold in [
+            ('grouped', distances, 0.45),
+            ('tied', tied_distances, 0.6)]:
+        print('{0:>6} {1:>10} {2:>10} {3:>10}  ({4})'.format(
+            'size', 'upgma', 'single', 'complete', name))
+        for size in SIZES:
+            matrix = create(size)
+            timings = []
+            for method in ['upgma', 'single', 'complete']:
+                start = time.time()
+                clusters = flat_cluster(method, threshold, matrix)
+                timings.append('{0:.3f} ({1})'.format(
+                    time.time() - start, len(clusters)))
+            print('{0:6} {1:>10} {2:>10} {3:>10}'.format(size, *timings))
+
+
+if __name__ == '__main__':
+    main()
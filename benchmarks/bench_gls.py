@@ -0,0 +1,69 @@
+"""
+Time gain-loss mapping on a large reference tree.
+
+The script creates a word list for a random reference tree in which cognate
+sets are inherited along the branches and are replaced by new ones at random,
+and reports the time needed by `PhyBo.get_GLS` in all three modes.
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from lingpy.compare.phylogeny import PhyBo
+
+TAXA = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+CONCEPTS = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+
+def newick(node):
+    if isinstance(node, str):
+        return node
+    return '(' + ','.join(newick(child) for child in node) + ')'
+
+
+def write_wordlist(filename, ntaxa, nconcepts):
+    taxa = ['L{0}'.format(i) for i in range(ntaxa)]
+    nodes = list(taxa)
+    while len(nodes) > 1:
+        picked = random.sample(range(len(nodes)), 2 if len(nodes) < 3 or
+                               random.random() < 0.7 else 3)
+        nodes = [n for i, n in enumerate(nodes) if i not in picked] + [
+            tuple(nodes[i] for i in picked)]
+
+    lines = ['@tree: ' + newick(nodes[0]) + ';', 'ID\tDOCULECT\tCONCEPT\tIPA\tCOGID']
+    cogid = 0
+    for concept in range(nconcepts):
+        cognates, queue = {}, [(nodes[0], None)]
+        while queue:
+            node, cog = queue.pop()
+            if cog is None or random.random() < 0.05:
+                cogid += 1
+                cog = cogid
+            if isinstance(node, str):
+                cognates[node] = cog
+            else:
+                queue.extend((child, cog) for child in node)
+        for taxon in taxa:
+            if random.random() > 0.05:
+                lines.append('{0}\t{1}\tc{2}\tipa\t{3}'.format(
+                    len(lines) - 1, taxon, concept, cognates[taxon]))
+    Path(filename).write_text('\n'.join(lines), encoding='utf8')
+
+
+def main():
+    random.seed(1234)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = str(Path(tmp) / 'gls.qlc')
+        write_wordlist(filename, TAXA, CONCEPTS)
+        phy = PhyBo(filename, output_dir=tmp)
+        print('{0} taxa, {1} cognate sets'.format(len(phy.taxa), len(phy.cogs)))
+        for mode in ['weighted', 'restriction', 'topdown']:
+            start = time.time()
+            phy.get_GLS(mode=mode)
+            print('{0:12} {1:8.2f}s'.format(mode, time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Time library-based multiple alignments of large cognate sets.
+
+The script creates synthetic cognate sets by mutating words of the KSL test
+data and aligns them with `Multiple.lib_align`, once with the full library and
+once with a library which is only extended through a limited number of anchor
+sequences. It reports the time of both analyses and the sum-of-pairs scores
+of the resulting alignments, computed with the sound-class scorer.
+"""
+import pathlib
+import random
+import sys
+import time
+
+from lingpy import Wordlist
+from lingpy.align.multiple import Multiple
+
+TEST_DATA = pathlib.Path(__file__).parent.parent / 'tests' / 'test_data'
+SIZES = [int(x) for x in sys.argv[1:]] or [25, 50, 100]
+ANCHORS = 10
+
+
+def cognate_set(word, size, inventory):
+    seqs = []
+    for _ in range(size):
+        seq = []
+        for token in word:
+            r = random.random()
+            if r < 0.1:
+                continue
+            if r < 0.3:
+                token = random.choice(inventory)
+            seq.append(token)
+            if random.random() < 0.05:
+                seq.append(random.choice(inventory))
+        seqs.append(seq or word)
+    return seqs
+
+
+def timed(seqs, **kw):
+    msa = Multiple(seqs)
+    start = time.time()
+    msa.lib_align(**kw)
+    duration = time.time() - start
+    msa._set_scorer('classes')
+    return msa.sum_of_pairs(), duration
+
+
+def main():
+    random.seed(1234)
+    wl = Wordlist(str(TEST_DATA / 'KSL.qlc'))
+    words = [wl[idx, 'tokens'] for idx in wl if len(wl[idx, 'tokens']) >= 5]
+    inventory = sorted(set(token for word in words for token in word))
+
+    print('{0:>6} {1:>10} {2:>10} {3:>10} {4:>10}'.format(
+        'size', 'full', 'anchored', 'SP full', 'SP anch.'))
+    for size in SIZES:
+        seqs = cognate_set(random.choice(words), size, inventory)
+        sp_full, t_full = timed(seqs)
+        sp_anchored, t_anchored = timed(seqs, anchors=ANCHORS)
+        print('{0:6} {1:10.3f} {2:10.3f} {3:10.1f} {4:10.1f}'.format(
+            size, t_full, t_anchored, sp_full, sp_anchored))
+
+
+if __name__ == '__main__':
+    main()
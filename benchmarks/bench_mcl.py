@@ -0,0 +1,51 @@
+"""
+Time the MCL algorithm on large sparse graphs.
+
+The script creates distance matrices with a block structure, in which only a
+small number of items is close to each other, and reports the time needed by
+`clustering.mcl` with dense matrices and with sparse matrices and pruning,
+along with the number of clusters that were found.
+"""
+import random
+import sys
+import time
+
+from lingpy.algorithm.clustering import mcl
+
+SIZES = [int(x) for x in sys.argv[1:]] or [100, 300, 1000]
+BLOCK = 8
+
+
+def distances(size):
+    matrix = [[0.0 for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1, size):
+            if i // BLOCK == j // BLOCK:
+                score = random.uniform(0.05, 0.4)
+            else:
+                score = random.uniform(0.6, 1.0)
+            matrix[i][j] = matrix[j][i] = score
+    return matrix
+
+
+def timed(matrix, **kw):
+    start = time.time()
+    clusters = mcl(0.5, [row[:] for row in matrix], list(range(len(matrix))),
+                   **kw)
+    return len(clusters), time.time() - start
+
+
+def main():
+    random.seed(1234)
+    print('{0:>6} {1:>10} {2:>10} {3:>8} {4:>8}'.format(
+        'size', 'dense', 'sparse', 'n dense', 'n sparse'))
+    for size in SIZES:
+        matrix = distances(size)
+        n_dense, t_dense = timed(matrix)
+        n_sparse, t_sparse = timed(matrix, sparse=True, prune=1e-5)
+        print('{0:6} {1:10.3f} {2:10.3f} {3:8} {4:8}'.format(
+            size, t_dense, t_sparse, n_dense, n_sparse))
+
+
+if __name__ == '__main__':
+    main()
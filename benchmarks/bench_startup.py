@@ -0,0 +1,43 @@
+"""
+Time the import of LingPy and the first access of the sound-class models.
+
+Each measurement is taken in a fresh interpreter, since modules and models are
+only loaded once per session. The compiled models are taken from the cache,
+which is filled by an initial run.
+"""
+import subprocess
+import sys
+
+REPEATS = 5
+MODELS = ['sca', 'dolgo', 'asjp', 'art', 'cv', 'jaeger', '_color']
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import lingpy
+imported = time.perf_counter()
+from lingpy.settings import rcParams
+for name in {0!r}:
+    rcParams[name].converter
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def run(models):
+    out = subprocess.check_output(
+        [sys.executable, '-c', SCRIPT.format(models)])
+    return [float(x) for x in out.split()]
+
+
+def main():
+    # fill the cache of compiled models
+    run(MODELS)
+    print('{0:8} {1:>10} {2:>10}'.format('models', 'import', 'models'))
+    for label, models in [('none', []), ('dolgo', ['dolgo']), ('all', MODELS)]:
+        timings = sorted(run(models) for _ in range(REPEATS))
+        imported, loaded = timings[REPEATS // 2]
+        print('{0:8} {1:9.3f}s {2:9.3f}s'.format(label, imported, loaded))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare row and column storage of word lists.
+
+The script writes a large word list by repeating the doculects of the KSL test
+data, loads it with both storage types and reports the memory retained by the
+Wordlist objects and the time needed for typical ways to access the data.
+"""
+import gc
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from lingpy import Wordlist
+
+TEST_DATA = pathlib.Path(__file__).parent.parent / 'tests' / 'test_data'
+COPIES = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+
+def write_wordlist(filename, copies):
+    wl = Wordlist(str(TEST_DATA / 'KSL.qlc'))
+    columns = ['doculect', 'concept', 'ipa', 'tokens', 'cogid']
+    lines = ['ID\t' + '\t'.join(columns)]
+    idx = 1
+    for copy in range(copies):
+        for key in wl:
+            row = [wl[key, c] for c in columns]
+            row[0] = '{0}_{1}'.format(row[0], copy)
+            lines.append('\t'.join([str(idx)] + [
+                ' '.join(v) if isinstance(v, list) else str(v) for v in row]))
+            idx += 1
+    pathlib.Path(filename).write_text('\n'.join(lines), encoding='utf8')
+
+
+def load(filename, storage):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    wl = Wordlist(filename, storage=storage)
+    duration = time.time() - start
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return wl, memory, duration
+
+
+def timed(function):
+    start = time.time()
+    function()
+    return time.time() - start
+
+
+def access(wl):
+    return [
+        ('cells', timed(lambda: [wl[key, 'ipa'] for key in wl])),
+        ('rows', timed(lambda: [wl[key] for key in wl])),
+        ('get_list', timed(lambda: [
+            wl.get_list(row=concept, entry='tokens', flat=True)
+            for concept in wl.rows])),
+        ('get_dict', timed(lambda: wl.get_dict(col=wl.cols[0], entry='ipa'))),
+        ('get_entries', timed(lambda: wl.get_entries('cogid'))),
+        ('add_entries', timed(lambda: wl.add_entries(
+            'length', 'tokens', len))),
+    ]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = str(pathlib.Path(tmp) / 'wordlist.tsv')
+        write_wordlist(filename, COPIES)
+        results = {}
+        for storage in ['rows', 'columns']:
+            wl, memory, duration = load(filename, storage)
+            results[storage] = [
+                ('memory (MB)', memory / 2 ** 20), ('load', duration)] + access(wl)
+            del wl
+
+    print('{0} entries'.format(COPIES * 1400))
+    print('{0:12} {1:>10} {2:>10} {3:>8}'.format(
+        '', 'rows', 'columns', 'ratio'))
+    for (name, r), (_, c) in zip(results['rows'], results['columns']):
+        print('{0:12} {1:10.3f} {2:10.3f} {3:8.2f}'.format(name, r, c, r / c))
+
+
+if __name__ == '__main__':
+    main()
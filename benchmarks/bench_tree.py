@@ -0,0 +1,54 @@
+"""
+Time the calculation of trees from large distance matrices.
+
+The script creates distance matrices for random points in a plane and in
+five dimensions, as well as non-metric matrices of uniformly distributed
+random distances, and reports the time needed by `clustering.upgma` and
+`clustering.neighbor` to compute the tree in Newick format.
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+from lingpy.algorithm.clustering import neighbor, upgma
+
+SIZES = [int(x) for x in sys.argv[1:]] or [100, 500, 2000]
+
+
+def distances(size, dimensions=2):
+    points = np.array([[random.random() for _ in range(dimensions)]
+                       for _ in range(size)])
+    return np.sqrt(((points[:, None] - points[None, :]) ** 2).sum(axis=2))
+
+
+def uniform_distances(size):
+    matrix = np.zeros((size, size))
+    for i in range(size):
+        for j in range(i + 1, size):
+            matrix[i, j] = matrix[j, i] = random.random()
+    return matrix
+
+
+def main():
+    random.seed(1234)
+    for name, create in [
+            ('plane', distances),
+            ('5-D', lambda size: distances(size, 5)),
+            ('uniform', uniform_distances)]:
+        print('{0:>6} {1:>10} {2:>10}  ({3})'.format(
+            'size', 'upgma', 'neighbor', name))
+        for size in SIZES:
+            matrix = create(size)
+            taxa = ['t{0}'.format(i) for i in range(size)]
+            timings = []
+            for algorithm in [upgma, neighbor]:
+                start = time.time()
+                algorithm(matrix, taxa)
+                timings.append(time.time() - start)
+            print('{0:6} {1:10.3f} {2:10.3f}'.format(size, *timings))
+
+
+if __name__ == '__main__':
+    main()
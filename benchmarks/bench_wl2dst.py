@@ -0,0 +1,48 @@
+"""
+Time the computation of language distances from large word lists.
+
+The script creates word lists with a growing number of doculects, in which
+the words of each concept are drawn from a small number of cognate sets, some
+words are missing and some concepts have synonyms, and reports the time needed
+by `wl2dst` in all three modes.
+"""
+import random
+import sys
+import time
+
+from lingpy import Wordlist
+from lingpy.basic.ops import wl2dst
+
+SIZES = [int(x) for x in sys.argv[1:]] or [100, 300, 1000]
+CONCEPTS = 200
+
+
+def wordlist(ntaxa, nconcepts):
+    data, idx = {0: ['doculect', 'concept', 'ipa', 'cogid']}, 1
+    for concept in range(nconcepts):
+        cognates = random.randint(1, 20)
+        for taxon in range(ntaxa):
+            if random.random() < 0.05:
+                continue
+            for _ in range(2 if random.random() < 0.1 else 1):
+                data[idx] = ['L{0}'.format(taxon), 'c{0}'.format(concept),
+                             'ipa', concept * 100 + random.randint(1, cognates)]
+                idx += 1
+    return Wordlist(data)
+
+
+def main():
+    random.seed(1234)
+    for size in SIZES:
+        wl = wordlist(size, CONCEPTS)
+        times = []
+        for mode in ['swadesh', 'jaccard', 'shared']:
+            start = time.time()
+            wl2dst(wl, mode=mode)
+            times.append(time.time() - start)
+        print('{0:6} doculects  swadesh {1:8.2f}s  jaccard {2:8.2f}s  '
+              'shared {3:8.2f}s'.format(size, *times))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,26 @@
 """
 Setup-Script for LingPy
 """
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
+# The alignment kernels can optionally be compiled with Cython. If Cython is not
+# available, or if compilation fails, lingpy falls back to the pure-Python
+# modules in lingpy.algorithm.cython.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [
+            Extension(
+                "lingpy.algorithm.cython." + name,
+                ["src/lingpy/algorithm/cython/{0}.pyx".format(name)],
+                optional=True,
+            )
+            for name in ["calign", "misc"]
+        ],
+        language_level=3,
+    )
+except ImportError:  # pragma: no cover
+    ext_modules = []
 
 setup(
     name="lingpy",
@@ -28,6 +46,7 @@ setup(
         ],
     ),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     install_requires=[
         "numpy",
         "appdirs",
@@ -41,7 +60,7 @@ setup(
         "borrowing": ["matplotlib", "scipy"],
         "cluster": ["python-igraph", "scikit-learn"],
         "test": ["pytest", "coverage", "pytest-mock", "pytest-cov"],
-        "dev": ["wheel", "twine", "sphinx", "tox"],
+        "dev": ["wheel", "twine", "sphinx", "tox", "cython"],
     },
     entry_points={"console_scripts": ["lingpy=lingpy.cli:main"]},
     keywords=[
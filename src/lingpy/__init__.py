@@ -48,8 +48,8 @@ from lingpy.data import Model
 from lingpy.read.csv import csv2list, csv2dict
 
 # import sequence routines
-from lingpy.sequence.sound_classes import ipa2tokens, tokens2class, prosodic_string, \
-        prosodic_weights, class2tokens, pid, sampa2uni
+from lingpy.sequence.sound_classes import ipa2tokens, tokens2class, tokens2class_many, \
+        prosodic_string, prosodic_weights, class2tokens, pid, sampa2uni
 from clldutils.text import strip_chars
 
 # import lexstat
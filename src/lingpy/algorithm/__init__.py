@@ -6,12 +6,20 @@ from lingpy.settings import rcParams
 from lingpy.algorithm.clustering import *
 from lingpy.algorithm._tree import _TreeDist as TreeDist
 
-from .cython import _calign as calign
+# use the compiled alignment kernels if they were built, otherwise fall back
+# to the pure-Python versions which yield identical results
+try:
+    from .cython import calign
+    rcParams['cmodules'] = True
+except ImportError:
+    from .cython import _calign as calign
+    rcParams['cmodules'] = False
+try:
+    from .cython import misc
+except ImportError:
+    from .cython import _misc as misc
 from .cython import _malign as malign
 from .cython import _talign as talign
-from .cython import _misc as misc
-
-rcParams['cmodules'] = False
 
 # define squareform for global lingpy-applications
 squareform = misc.squareform
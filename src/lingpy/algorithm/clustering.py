@@ -778,45 +778,108 @@ def _normalize_matrix(matrix):
     """
     Normalize the matrix.
     """
-    return matrix / sum(matrix)
+    if not isinstance(matrix, np.ndarray):
+        sums = np.asarray(matrix.sum(axis=0)).ravel()
+        matrix.data /= np.repeat(sums, np.diff(matrix.indptr))
+        return matrix
+    return matrix / matrix.sum(axis=0)
+
+
+def _prune_matrix(matrix, prune):
+    """
+    Remove values below the pruning threshold from the matrix.
+    """
+    if not isinstance(matrix, np.ndarray):
+        matrix.data[matrix.data < prune] = 0
+        matrix.eliminate_zeros()
+        return _normalize_matrix(matrix)
+    return _normalize_matrix(np.where(matrix < prune, 0, matrix))
+
+
+def _expand_matrix(matrix, expansion):
+    """
+    Raise the matrix to the power of the expansion parameter.
+    """
+    if not isinstance(matrix, np.ndarray):
+        expanded = matrix
+        for i in range(expansion - 1):
+            expanded = expanded @ matrix
+        return expanded
+    return np.linalg.matrix_power(matrix, expansion)
+
+
+def _inflate_matrix(matrix, inflation):
+    """
+    Raise the values of the matrix to the power of the inflation parameter.
+    """
+    if not isinstance(matrix, np.ndarray):
+        matrix = matrix.power(inflation)
+        matrix.eliminate_zeros()
+        return matrix
+    return matrix ** inflation
 
 
 def _is_idempotent(matrix):
     """
     Check whether the matrix is idempotent.
-    """
 
-    for line in matrix:
-        if len([x for x in set(line) if x != 0]) > 1:
-            return False
-    return True
+    Notes
+    -----
+    The matrix is considered idempotent if all non-zero values in each of its
+    rows are identical.
+    """
+    if not isinstance(matrix, np.ndarray):
+        matrix = matrix.tocsr()
+        starts = matrix.indptr[:-1][np.diff(matrix.indptr) > 0]
+        return bool(np.all(
+            np.maximum.reduceat(matrix.data, starts) ==
+            np.minimum.reduceat(matrix.data, starts))) if len(starts) else True
+    first = matrix[np.arange(len(matrix)), (matrix != 0).argmax(axis=1)]
+    return bool(np.all((matrix == 0) | (matrix == first[:, None])))
 
 
 def _interprete_matrix(matrix):
     """
     Look for attracting nodes in the matrix.
     """
+    if not isinstance(matrix, np.ndarray):
+        matrix = matrix.tocsr()
+        rows = [
+            matrix.indices[start:stop][matrix.data[start:stop] > 0]
+            for start, stop in zip(matrix.indptr, matrix.indptr[1:])]
+    else:
+        rows = [np.flatnonzero(row > 0) for row in matrix]
+
     clusters = []
-    flags = len(matrix) * [False]
-    for i in range(len(matrix)):
-        clr = []
-        for j in range(len(matrix)):
-            if not flags[j] and matrix[i][j] > 0:
-                clr += [j]
-                flags[j] = True
-        if clr:
+    flags = np.zeros(len(rows), dtype=bool)
+    for row in rows:
+        clr = row[~flags[row]]
+        if len(clr):
+            flags[clr] = True
             clusters += [clr]
 
     # make a converter for length
-    out = [0 for i in range(len(matrix))]
+    out = np.zeros(len(rows), dtype=int)
     for idx, clr in enumerate(clusters):
-        for i in clr:
-            out[i] = idx + 1
+        out[clr] = idx + 1
 
-    if sum(out) == 0:
+    if out.sum() == 0:
         return list(range(len(out)))
 
-    return out
+    return out.tolist()
+
+
+def _apply_to_array(function, values):
+    """
+    Apply a function to an array, calling it for each value if needed.
+    """
+    try:
+        result = np.asarray(function(values), dtype=float)
+        if result.shape == values.shape:
+            return result
+    except (TypeError, ValueError):
+        pass
+    return np.array([function(value) for value in values], dtype=float)
 
 
 def mcl(
@@ -829,7 +892,9 @@ def mcl(
         add_self_loops=True,
         revert=False,
         logs=True,
-        matrix_type="distances"):
+        matrix_type="distances",
+        prune=0,
+        sparse=False):
     """
     Carry out a clustering using the MCL algorithm (:evobib:`Dongen2000`).
 
@@ -873,6 +938,16 @@ def mcl(
         it will be adapted to similarity data. If it contains "similarities",
         no adaptation is needed.
 
+    prune : float (default=0)
+        Values of the matrix which are lower than this threshold are set to
+        zero after each iteration, which keeps the matrix sparse and speeds up
+        the convergence of large matrices.
+
+    sparse : bool (default=False)
+        If set to c{True}, the iterations are carried out with sparse
+        matrices, which requires `scipy`. Use this option along with *prune*
+        for large graphs with few links.
+
     Examples
     --------
 
@@ -909,13 +984,13 @@ def mcl(
 
     # check for matrix type and decide how to handle logs
     if matrix_type == 'distances':
-        evaluate = lambda x: True if x < threshold else False
+        evaluate = lambda x: x < threshold
         if logs == True:
             logs = lambda x: -np.log2((1 - x) ** 2)
         elif logs == False:
             logs = lambda x: x
     elif matrix_type == 'similarities':
-        evaluate = lambda x: True if x > threshold else False
+        evaluate = lambda x: x > threshold
         if logs == True:
             logs = lambda x: -np.log(x ** 2)
         else:
@@ -925,11 +1000,14 @@ def mcl(
 
     # check for threshold
     if threshold:
-        for i, j in util.combinations2(range(len(imatrix))):
-            score = imatrix[i][j]
-            evaluation = logs(score) if evaluate(score) else 0
-            imatrix[i][j] = evaluation
-            imatrix[j][i] = evaluation
+        rows, cols = np.triu_indices(len(imatrix), 1)
+        scores = imatrix[rows, cols]
+        selected = evaluate(scores)
+        evaluations = np.zeros(len(scores))
+        if selected.any():
+            evaluations[selected] = _apply_to_array(logs, scores[selected])
+        imatrix[rows, cols] = evaluations
+        imatrix[cols, rows] = evaluations
 
     # check for self_loops
     if add_self_loops == True:
@@ -941,6 +1019,14 @@ def mcl(
         for i in range(len(imatrix)):
             imatrix[i][i] = add_self_loops(imatrix[:, i])
 
+    if sparse:
+        try:
+            from scipy import sparse as sps
+        except ImportError:  # pragma: no cover
+            raise ImportError('The package `scipy` is needed for sparse MCL.')
+        imatrix = sps.csc_matrix(imatrix, dtype=float)
+        imatrix.eliminate_zeros()
+
     # normalize the matrix
     imatrix = _normalize_matrix(imatrix)
 
@@ -948,14 +1034,18 @@ def mcl(
     steps = 0
     while True:
         # expansion
-        imatrix = np.linalg.matrix_power(imatrix, expansion)
+        imatrix = _expand_matrix(imatrix, expansion)
 
         # inflation
-        imatrix = imatrix ** inflation
+        imatrix = _inflate_matrix(imatrix, inflation)
 
         # normalization
         imatrix = _normalize_matrix(imatrix)
 
+        # pruning
+        if prune:
+            imatrix = _prune_matrix(imatrix, prune)
+
         # increase steps
         steps += 1
 
@@ -2005,6 +2005,196 @@ def align_pairwise(
 
     return alignments
     
+def pair_distances(
+        seqs,
+        gops,
+        pros,
+        pairs,
+        gop,
+        scale,
+        factor,
+        scorer,
+        mode,
+        restricted_chars,
+        groups = None,
+        sims = None
+        ):
+    """
+    Calculate the distances between pairs of sequences.
+
+    Parameters
+    ----------
+    seqs : list
+        The sequences.
+    gops : list
+        The gap opening penalties for each sequence. If groups are passed, the
+        penalties of each sequence are passed as a dictionary with the groups
+        of the sequences it is compared with as keys.
+    pros : list
+        The prosodic strings which have the same length as the sequences.
+    pairs : list
+        The pairs of sequences, passed as tuples of their indices.
+    gop : int
+        The factor by which all gap opening penalties are multiplied.
+    scale : float
+        The gap extension scale by which consecutive gaps are reduced. LingPy
+        uses a scale rather than a constant gap extension penalty. 
+    factor : float
+        The factor by which matches are increased when two segments occur in
+        the same prosodic position of an alignment.
+    scorer : { dict, :py:class:`lingpy.algorithm.cython.misc.ScoreDict` }
+        The scoring function which needs to provide scores for all
+        segments in the sequences.
+    mode : { "global", "local", "overlap", "dialign" }
+        Select one of the four basic modes for alignment analyses.
+    restricted_chars : str
+        The string containing restricted characters. Restricted characters
+        occur, as a rule, in the prosodic strings, not in the normal sequence.
+    groups : list (default=None)
+        The groups of the sequences (e.g., the languages), used to select the
+        gap opening penalties of a sequence.
+    sims : list (default=None)
+        The self-similarities of the sequences, if they have already been
+        computed.
+
+    Returns
+    -------
+    distances : list
+        The normalized distance for each pair of sequences, or None if the
+        self-similarities of both sequences sum up to zero.
+
+    Notes
+    -----
+    The distances are the same as the ones computed by
+    :py:class:`lingpy.algorithm.cython.calign.align_pair`, but the
+    self-similarities and the gap opening penalties are computed only once for
+    each sequence. The function is basically used in LingPy's module for
+    cognate detection (:py:class:`lingpy.compare.lexstat.LexStat`) to compute
+    all distances for a concept at once.
+
+    See also
+    --------
+    ~lingpy.algorithm.cython.calign.align_pair
+    ~lingpy.algorithm.cython.calign.align_pairwise
+
+    """
+    # define basic types
+# [autouncomment]     cdef int i,j,k,M,N,lS
+# [autouncomment]     cdef list almA,almB,lens,secondary,distances
+# [autouncomment]     cdef float sim,dist,simA,simB
+
+    lS = len(seqs)
+
+    # get self-scores, gap costs, and secondary structures
+    if sims is None:
+        sims = [None for i in range(lS)]
+    else:
+        sims = list(sims)
+    lens = [0 for i in range(lS)]
+    secondary = [False for i in range(lS)]
+    costs = [None for i in range(lS)]
+    for i in range(lS):
+        seqA = seqs[i]
+        k = len(seqA)
+        if sims[i] is None:
+            sims[i] = sum([(1.0 + factor) * scorer[seqA[j],seqA[j]] for j in range(k)])
+        lens[i] = k
+        secondary[i] = bool(set(restricted_chars).intersection(set(pros[i])))
+        if groups is None:
+            costs[i] = [gop * gops[i][j] for j in range(k)]
+        else:
+            costs[i] = {}
+            for key, value in gops[i].items():
+                costs[i][key] = [gop * value[j] for j in range(k)]
+
+    distances = []
+    for i, j in pairs:
+        seqA,seqB = seqs[i],seqs[j]
+        proA,proB = pros[i],pros[j]
+        M,N = lens[i],lens[j]
+        if groups is None:
+            gopA,gopB = costs[i],costs[j]
+        else:
+            gopA,gopB = costs[i][groups[j]],costs[j][groups[i]]
+
+        if mode == "dialign":
+            if secondary[i] or secondary[j]:
+                almA,almB,sim = secondary_dialign(
+                        seqA,
+                        seqB,
+                        proA,
+                        proB,
+                        M,
+                        N,
+                        scale,
+                        factor,
+                        scorer,
+                        restricted_chars
+                        )
+            else:
+                almA,almB,sim = dialign(
+                        seqA,
+                        seqB,
+                        proA,
+                        proB,
+                        M,
+                        N,
+                        scale,
+                        factor,
+                        scorer
+                        )
+        elif secondary[i] or secondary[j]:
+            if mode == "global":
+                function = secondary_globalign
+            elif mode == "local":
+                function = secondary_localign
+            elif mode == "overlap":
+                function = secondary_semi_globalign
+            almA,almB,sim = function(
+                    seqA,
+                    seqB,
+                    gopA,
+                    gopB,
+                    proA,
+                    proB,
+                    M,
+                    N,
+                    scale,
+                    factor,
+                    scorer,
+                    restricted_chars
+                    )
+        else:
+            if mode == "global":
+                function = globalign
+            elif mode == "local":
+                function = localign
+            elif mode == "overlap":
+                function = semi_globalign
+            almA,almB,sim = function(
+                    seqA,
+                    seqB,
+                    gopA,
+                    gopB,
+                    proA,
+                    proB,
+                    M,
+                    N,
+                    scale,
+                    factor,
+                    scorer
+                    )
+
+        # calculate the distance
+        simA,simB = sims[i],sims[j]
+        if simA + simB == 0:
+            distances.append(None)
+        else:
+            dist = 1 - ( ( 2 * sim ) / ( simA + simB ) )
+            distances.append(dist)
+
+    return distances
+
 def align_pairs(
         seqs,
         gops,
@@ -1,4 +1,6 @@
-from ._misc import transpose,squareform
+import numpy as np
+
+from ._misc import transpose
 
 
 def flat_upgma(
@@ -184,38 +186,7 @@ def _flat_upgma(
     """
     Internal implementation of flat_upgma.
     """
-# [autouncomment]     cdef int i,j,vA,vB,idxA,idxB
-# [autouncomment]     cdef list score,valA,valB
-    
-    # terminate when the dictionary is of length 1
-    if len(clusters) == 1:
-        return
-
-    scores = []
-    indices = []
-
-    for i,valA in clusters.items():
-        for j,valB in clusters.items():
-            if i != j:
-                score = []
-                for vA in valA:
-                    for vB in valB:
-                        score += [matrix[vA][vB]]
-                scores.append(sum(score) / len(score))
-                indices.append((i,j))
-    
-    minimum = min(scores)
-    if minimum <= threshold:
-        idxA,idxB = indices[scores.index(minimum)]
-        clusters[idxA] += clusters[idxB]
-        del clusters[idxB]
-        return _flat_upgma(
-                clusters,
-                matrix,
-                threshold
-                )
-    else:
-        pass
+    _flat_linkage('upgma', clusters, matrix, threshold)
 
 def _flat_single_linkage(
         clusters,
@@ -223,40 +194,9 @@ def _flat_single_linkage(
         threshold
         ):
     """
-    Internal implementation of flat_upgma.
+    Internal implementation of flat single linkage clustering.
     """
-# [autouncomment]     cdef int i,j,vA,vB,idxA,idxB
-# [autouncomment]     cdef list score,valA,valB
-    
-    # terminate when the dictionary is of length 1
-    if len(clusters) == 1:
-        return
-
-    scores = []
-    indices = []
-
-    for i,valA in clusters.items():
-        for j,valB in clusters.items():
-            if i != j:
-                score = []
-                for vA in valA:
-                    for vB in valB:
-                        score += [matrix[vA][vB]]
-                scores.append(min(score))
-                indices.append((i,j))
-    
-    minimum = min(scores)
-    if minimum <= threshold:
-        idxA,idxB = indices[scores.index(minimum)]
-        clusters[idxA] += clusters[idxB]
-        del clusters[idxB]
-        return _flat_single_linkage(
-                clusters,
-                matrix,
-                threshold
-                )
-    else:
-        pass
+    _flat_linkage('single', clusters, matrix, threshold)
 
 def _flat_complete_linkage(
         clusters,
@@ -264,40 +204,232 @@ def _flat_complete_linkage(
         threshold
         ):
     """
-    Internal implementation of flat_upgma.
+    Internal implementation of flat complete linkage clustering.
     """
-# [autouncomment]     cdef int i,j,vA,vB,idxA,idxB
-# [autouncomment]     cdef list score,valA,valB
-    
-    # terminate when the dictionary is of length 1
-    if len(clusters) == 1:
+    _flat_linkage('complete', clusters, matrix, threshold)
+
+def _average(
+        values,
+        valA,
+        valB
+        ):
+    """
+    Compute the average distance between two clusters item by item.
+    """
+    score = values[np.ix_(valA, valB)].ravel().tolist()
+    return sum(score) / len(score)
+
+def _cluster_scores(
+        method,
+        clusters,
+        values
+        ):
+    """
+    Compute the distances (sums for UPGMA) between all pairs of clusters.
+    """
+    if all(len(val) == 1 for val in clusters.values()):
+        idx = [val[0] for val in clusters.values()]
+        return values[np.ix_(idx, idx)]
+
+    combine = {'upgma': np.sum, 'single': np.min, 'complete': np.max}[method]
+    scores = np.empty((len(clusters), len(clusters)))
+    for p, valA in enumerate(clusters.values()):
+        rows = combine(values[valA], axis=0)
+        for q, valB in enumerate(clusters.values()):
+            scores[p, q] = combine(rows[valB])
+    return scores
+
+def _flat_linkage(
+        method,
+        clusters,
+        matrix,
+        threshold
+        ):
+    """
+    Merge the clusters in place until their distance exceeds the threshold.
+    """
+    for merge in _linkage(method, clusters, matrix, threshold):
+        pass
+
+def _linkage(
+        method,
+        clusters,
+        matrix,
+        threshold = None,
+        append = False
+        ):
+    """
+    Merge the clusters in place and yield the merged pairs.
+
+    Parameters
+    ----------
+    method : { 'upgma', 'single', 'complete' }
+        The linkage method.
+    clusters : dict
+        A dictionary with cluster-IDs as keys and lists of the indices of
+        the items as values, which is modified in place.
+    matrix : list or :py:class:`numpy.array`
+        A two-dimensional list containing the distances.
+    threshold : float (default=None)
+        The threshold which terminates the algorithm. If set to None, all
+        clusters are merged.
+    append : bool (default=False)
+        If set to True, merged clusters receive a new ID which is appended
+        to the dictionary (as in :py:func:`_upgma`). Otherwise, the second
+        cluster is merged into the first one.
+
+    Returns
+    -------
+    merges : generator
+        A generator which yields the IDs of the merged clusters, the ID of
+        the new cluster, and their distance.
+
+    Notes
+    -----
+    The distances between the clusters (sums for UPGMA) are stored in an
+    array, along with the minimal distance of each cluster and one of its
+    nearest neighbors. After a merge, only the distances to the merged
+    cluster are compared with these minima, and only the rows whose nearest
+    neighbor was merged and which have no other neighbor at the same
+    distance need to be searched again. As in a full comparison of all
+    clusters, the pair with the lowest distance is merged first, and ties
+    are resolved in favor of the pair that comes first in the order of the
+    clusters in the dictionary. Since the first clusters are merged first,
+    the last one of several nearest neighbors is stored, so that ties do not
+    lead to repeated searches of the same rows.
+
+    Since average distances which are updated after each merge may differ
+    in the last digits from those computed item by item, all pairs whose
+    distance is close to the minimum of a row are compared by their
+    item-by-item average for UPGMA.
+    """
+# [autouncomment]     cdef int a,b,k,m,last,idxA,idxB,idxNew
+# [autouncomment]     cdef float minimum,eps
+    keys = list(clusters)
+    k = len(keys)
+    if k < 2:
         return
 
-    scores = []
-    indices = []
-
-    for i,valA in clusters.items():
-        for j,valB in clusters.items():
-            if i != j:
-                score = []
-                for vA in valA:
-                    for vB in valB:
-                        score += [matrix[vA][vB]]
-                scores.append(max(score))
-                indices.append((i,j))
-    
-    minimum = min(scores)
-    if minimum <= threshold:
-        idxA,idxB = indices[scores.index(minimum)]
-        clusters[idxA] += clusters[idxB]
-        del clusters[idxB]
-        return _flat_complete_linkage(
-                clusters,
-                matrix,
-                threshold
-                )
+    values = np.asarray(matrix, dtype=float)
+    sizes = np.array([len(clusters[key]) for key in keys])
+    scores = _cluster_scores(method, clusters, values)
+
+    if method == 'upgma':
+        def distance(p, q):
+            return scores[p, q] / (sizes[p] * sizes[q])
+
+        def update(a, b, m):
+            scores[a, :m] += scores[b, :m]
+            scores[:m, a] += scores[:m, b]
+            sizes[a] += sizes[b]
+
+        def resolve(rows, cols):
+            missing = np.isnan(exact[rows, cols])
+            for p, q in zip(rows[missing], cols[missing]):
+                exact[p, q] = _average(
+                        values, clusters[keys[p]], clusters[keys[q]])
+            return exact[rows, cols]
+
+        # item-by-item averages, which are computed when needed
+        if all(size == 1 for size in sizes):
+            exact = scores.copy()
+        else:
+            exact = np.full((k, k), np.nan)
+        eps = len(values) ** 2 * np.finfo(float).eps * (
+                np.abs(values).max() if values.size else 0)
     else:
-        pass
+        reduce = np.minimum if method == 'single' else np.maximum
+
+        def distance(p, q):
+            return scores[p, q]
+
+        def update(a, b, m):
+            reduce(scores[a, :m], scores[b, :m], out=scores[a, :m])
+            reduce(scores[:m, a], scores[:m, b], out=scores[:m, a])
+
+        resolve, exact, eps = distance, None, 0
+
+    def closest(rows, m):
+        # distances of the rows, which are exact close to their minimum
+        dists = distance(rows[:, None], np.arange(m))
+        dists[np.arange(len(rows)), rows] = np.inf
+        if exact is not None:
+            idx, cols = np.nonzero(
+                    dists <= dists.min(axis=1)[:, None] + eps)
+            dists = np.full(dists.shape, np.inf)
+            dists[idx, cols] = resolve(rows[idx], cols)
+        return dists
+
+    def neighbors(rows, m):
+        dists = closest(rows, m)
+        minima = dists.min(axis=1)
+        nearest = m - 1 - (dists[:, ::-1] == minima[:, None]).argmax(axis=1)
+        return minima, nearest
+
+    # the clusters are ordered by their rank, appended clusters receive a
+    # new rank
+    ranks = np.arange(k)
+    minima, nearest = neighbors(np.arange(k), k)
+    for m in range(k, 1, -1):
+        minimum = minima[:m].min()
+        if np.isnan(minimum) or (
+                threshold is not None and not minimum <= threshold):
+            return
+        rows = np.flatnonzero(minima[:m] == minimum)
+        a = rows[ranks[rows].argmin()]
+        cols = np.flatnonzero(closest(np.array([a]), m)[0] == minimum)
+        cols = cols[cols != a]
+        b = cols[ranks[cols].argmin()]
+
+        idxA, idxB = keys[a], keys[b]
+        if append:
+            idxNew = max(clusters) + 1
+            clusters[idxNew] = clusters[idxA] + clusters[idxB]
+            del clusters[idxA]
+            keys[a], ranks[a] = idxNew, 2 * k - m
+        else:
+            idxNew = idxA
+            clusters[idxA] += clusters[idxB]
+        del clusters[idxB]
+        yield idxA, idxB, idxNew, minimum
+
+        if m == 2:
+            return
+
+        # store the merged cluster in the slot of the first one and move the
+        # last cluster to the slot of the second one
+        update(a, b, m)
+        if exact is not None:
+            exact[a, :m] = exact[:m, a] = np.nan
+        outdated = (nearest[:m] == a) | (nearest[:m] == b)
+
+        last = m - 1
+        if b != last:
+            scores[b, :m] = scores[last, :m]
+            scores[:m, b] = scores[:m, last]
+            if exact is not None:
+                exact[b, :m] = exact[last, :m]
+                exact[:m, b] = exact[:m, last]
+            for array in (sizes, ranks, minima, nearest, outdated):
+                array[b] = array[last]
+            keys[b] = keys[last]
+            nearest[:m][nearest[:m] == last] = b
+            if a == last:
+                a = b
+
+        # compare the distances to the merged cluster with the minima
+        rows = np.flatnonzero(np.arange(last) != a)
+        rows = rows[distance(rows, a) <= minima[rows] + eps]
+        dists = resolve(rows, np.full(len(rows), a))
+        closer = (dists < minima[rows]) | (
+                (dists == minima[rows]) & outdated[rows])
+        rows = rows[closer]
+        minima[rows], nearest[rows], outdated[rows] = dists[closer], a, False
+
+        # search the rows whose nearest neighbor was merged
+        outdated[a] = True
+        rows = np.flatnonzero(outdated[:last])
+        minima[rows], nearest[rows] = neighbors(rows, last)
 
 
 def upgma(
@@ -354,10 +486,7 @@ def upgma(
     ~lingpy.algorithm.clustering.flat_upgma
    
     """
-# [autouncomment]     cdef int i,a,b
     x = len(taxa)
-# [autouncomment]     cdef float c,d
-# [autouncomment]     cdef str newick_string
 
     clusters = dict([(i,[i]) for i in range(x)])
     branches = dict([(i,0) for i in range(x)])
@@ -366,86 +495,32 @@ def upgma(
 
     _upgma(clusters,matrix,tree,branches)
 
-    newick = dict([(i,taxa[i]) for i in range(len(taxa))])
-    
-    # create different output, depending on the options for the inclusion of
-    # distances or topology only
-    if distances:
-        for i,(a,b,c,d) in enumerate(tree):
-            newick[x+i] = '({0}:{2:.2f},{1}:{3:.2f})'.format(
-                    newick[a],
-                    newick[b],
-                    c,
-                    d
-                    )
-    else:
-        for i in range(len(tree)):
-            newick[x+i] = '({0},{1})'.format(
-                    newick[tree[i][0]],
-                    newick[tree[i][1]]
-                    )
-    
-    newick_string = newick[max(newick.keys())] + ';'
-
-    return newick_string
+    return _tree2nwk(tree, taxa, distances)
 
 def _upgma(
         clusters,
         matrix,
         tree_matrix,
-        branches = {}
+        branches = None
         ):
     """
     Internal implementation of the UPGMA algorithm.
     """
-# [autouncomment]     cdef int i,vA,vB,idxA,idxB,idxNew
-# [autouncomment]     cdef list score,valA,valB
+# [autouncomment]     cdef int idxA,idxB,idxNew
+# [autouncomment]     cdef float minimum
 
     # check for branches
     if not branches:
         branches = dict([(i,0) for i in clusters])
-    
-    # terminate when the dictionary is of length 1
-    if len(clusters) == 1:
-        return
-
-    scores = []
-    indices = []
-
-    for i,valA in clusters.items():
-        for j,valB in clusters.items():
-            if i != j:
-                score = []
-                for vA in valA:
-                    for vB in valB:
-                        score += [matrix[vA][vB]]
-                scores.append(sum(score) / len(score))
-                indices.append((i,j))
-
-    minimum = min(scores)
-    
-    idxNew = max(clusters) + 1
-
-    idxA,idxB = indices[scores.index(minimum)]
-    
-    bA = minimum / 2 - branches[idxA]
-    bB = minimum / 2 - branches[idxB]
-
-    branches[idxNew] = minimum / 2
 
-    clusters[idxNew] = clusters[idxA] + clusters[idxB]
+    for idxA, idxB, idxNew, minimum in _linkage(
+            'upgma', clusters, matrix, append=True):
+        bA = minimum / 2 - branches[idxA]
+        bB = minimum / 2 - branches[idxB]
 
-    del clusters[idxA]
-    del clusters[idxB]
+        branches[idxNew] = minimum / 2
 
-    tree_matrix.append([idxA,idxB,bA,bB])
-    
-    return _upgma(
-            clusters,
-            matrix,
-            tree_matrix,
-            branches
-            )
+        tree_matrix.append([idxA,idxB,bA,bB])
 
 def neighbor(
         matrix,
@@ -500,10 +575,6 @@ def neighbor(
     ~lingpy.algorithm.clustering.upgma
     ~lingpy.algorithm.clustering.flat_upgma
     """
-# [autouncomment]     cdef int i,a,b
-# [autouncomment]     cdef float c,d
-# [autouncomment]     cdef str newick_string
-    
     x = len(taxa)
 
     clusters = dict([(i,[i]) for i in range(x)])
@@ -511,183 +582,144 @@ def neighbor(
 
     _neighbor(clusters,matrix,tree)
 
-    newick = dict([(i,taxa[i]) for i in range(x)])
-        
-    # create different output, depending on the options for the inclusion of
-    # distances or topology only
-    if distances:
-        for i,(a,b,c,d) in enumerate(tree):
-            newick[x+i] = '({0}:{2:.2f},{1}:{3:.2f})'.format(
-                    newick[a],
-                    newick[b],
-                    c,
-                    d
-                    )
-
-    else:
-        for i in range(len(tree)):
-            newick[x+i] = '({0},{1})'.format(
-                    newick[tree[i][0]],
-                    newick[tree[i][1]]
-                    )
-    
-    newick_string = newick[max(newick.keys())] + ';'
-
-    return newick_string
+    return _tree2nwk(tree, taxa, distances)
 
 def _neighbor(
         clusters,
         matrix,
-        tree_matrix,
-        constant_matrix = [],
-        tracer = {}
+        tree_matrix
         ):
     """
     Internal implementation of the neighbor-joining algorithm.
-    """
-# [autouncomment]     cdef int idxA,idxB,idxNew,N,i,j,key
-# [autouncomment]     cdef float sAX,sBX,new_score,score,dist_a,dist_b,dist_ab
-# [autouncomment]     cdef list line,new_matrix
-# [autouncomment]     cdef dict new_clusters
-# [autouncomment]     cdef list averages
-
-    if len(clusters) == 1:
-        return
 
-    # define a tracer for the order of the tree
-    if not tracer:
-        tracer = dict([(tuple([a]),b[0]) for (a,b) in clusters.items()])
-    # terminate when the dictionary is of length 1
-    if len(clusters) == 2:
-        
-        idxA,idxB = 0,1
-
-        # create the new index for the tracer
-        idxNew = max(tracer.values()) + 1
-
-        tracer[tuple(clusters[idxA]+clusters[idxB])] = idxNew
-
-        # append the indices to the tree matrix
-        sAX = matrix[idxA][idxB] / 2
-        sBX = matrix[idxA][idxB] / 2
-
-        tree_matrix.append(
-                (
-                    tracer[tuple(clusters[idxA])],
-                    tracer[tuple(clusters[idxB])],
-                    sAX,
-                    sBX
-                    )
-                )
-
-        # join the clusters according to the index
-        clusters[idxA] += clusters[idxB]
-        del clusters[idxB]
-        
+    Notes
+    -----
+    The distance matrix is stored in an array in which the rows of the
+    joined clusters are replaced in place, and the sums of the rows are
+    updated after each join. As in RapidNJ, each row also stores the IDs of
+    the clusters, sorted by their distance, at the time when it was created.
+    Since the distances between the remaining clusters do not change after a
+    join, each pair is found in the sorted row of the younger cluster, and
+    the rows are searched in blocks of columns until the distance, reduced
+    by the average of the row and the highest average, exceeds the best
+    score found so far. Pairs whose score is close to the minimum are
+    compared by their scores computed with the sums of the rows in the order
+    of the clusters, so that ties are resolved as in a full comparison of
+    all pairs.
+    """
+# [autouncomment]     cdef int a,b,k,m,last,depth,built,idxNew
+# [autouncomment]     cdef float sAX,sBX,dist_ab,best,scale,eps
+    keys = sorted(clusters)
+    k = len(keys)
+    if k < 2:
         return
 
-    # create the constant matrix when the process starts
-    if not constant_matrix:
-        constant_matrix = [[cell for cell in line] for line in matrix]
-    
-    # get the number of taxa
-    N = len(matrix)
-
-    # determine the average scores (divergence r)
-    averages = []
-    for line in matrix:
-        averages.append(sum(line) / (N - 2.0))
-    
-    # create the new matrix
-    new_matrix = [[cell for cell in line] for line in matrix]
-    
-    # fill in the new scores
-    for i,line in enumerate(matrix):
-        for j,score in enumerate(line):
-            if i > j:
-                new_score = score - averages[i] - averages[j]
-                new_matrix[i][j] = new_score
-                new_matrix[j][i] = new_score
-    
-    # determine the minimal score
-    scores = []
-    indices = []
-    for i in sorted(clusters.keys()):
-        for j in sorted(clusters.keys()):
-            if i < j:
-                scores.append(new_matrix[i][j])
-                indices.append((i,j))
-
-    minimum = min(scores)
-    idxA,idxB = indices[scores.index(minimum)]
-
-    # check for the average of the clusters
-    vals = []
-    for i in clusters[idxA]:
-        for j in clusters[idxB]:
-            vals.append(constant_matrix[i][j])
-    tmp_score = sum(vals) / len(vals)
-
-    
-    # append the indices to the tree matrix
-    sAX = matrix[idxA][idxB] / 2.0 + (averages[idxA] - averages[idxB]) / 2
-        #(2.0 * (len(matrix) - 2))
-    sBX = matrix[idxA][idxB] - sAX
-    tree_matrix.append(
-            (
-                tracer[tuple(clusters[idxA])],
-                tracer[tuple(clusters[idxB])],
-                sAX,
-                sBX
-                )
-            )
-
-    # create the new index for the tracer
-    idxNew = max(tracer.values()) + 1
-    tracer[tuple(clusters[idxA]+clusters[idxB])] = idxNew
-
-    # join the clusters according to the index
-    clusters[idxA] += clusters[idxB]
-    del clusters[idxB]
-
-    # create new cluster-dictionary
-    new_clusters = {}
-
-    # insert values in new dictionary
-    for i,key in enumerate(sorted(clusters.keys())):
-        new_clusters[i] = clusters[key]
-
-    # create new matrix
-    new_matrix = []
-
-    # iterate over old matrix and fill in keys for new matrix
-    dist_ab = matrix[idxA][idxB]
-    for i,a in enumerate(sorted(clusters.keys())):
-        for j,b in enumerate(sorted(clusters.keys())):
-            if i < j and a != idxA and b != idxA:
-                new_matrix.append(matrix[a][b])
-            elif i < j and a == idxA:
-                dist_a = matrix[idxA][b]
-                dist_b = matrix[idxB][b]
-                new_matrix.append(((dist_a + dist_b) - dist_ab) / 2.0)
-            elif i < j and b == idxA:
-                dist_a = matrix[idxA][a]
-                dist_b = matrix[idxB][a]
-                new_matrix.append(((dist_a + dist_b) - dist_ab) / 2.0)
-    
-    # get values of new_clusters into clusters
-    clusters = {}
-    for key,val in new_clusters.items():
-        clusters[key] = val
-
-    # return score
-    return _neighbor(
-            clusters,
-            squareform(new_matrix),
-            tree_matrix,
-            constant_matrix,
-            tracer
-            )
+    values = np.array(matrix, dtype=float)
+    nodes = [clusters[key][0] for key in keys]
+    idxNew = max(nodes) + 1
+    ranks = np.arange(k)
+    sums = values.sum(axis=1)
+    scale = np.abs(values).max()
+
+    # the IDs of the clusters in the slots, and the slots of the IDs, with
+    # the last ID reserved for empty columns
+    ids = np.arange(k)
+    slots = np.full(2 * k + 1, -1)
+    slots[:k] = ids
+    dists = np.full((k, k), np.inf)
+    columns = np.full((k, k), 2 * k)
+
+    def sort(rows, m):
+        for row in rows:
+            dist = values[row, :m].copy()
+            dist[row] = np.inf
+            order = np.argsort(dist, kind='stable')[:m - 1]
+            dists[row, :m - 1], dists[row, m - 1:] = dist[order], np.inf
+            columns[row, :m - 1], columns[row, m - 1:] = ids[order], 2 * k
+
+    sort(range(k), k)
+    built = k
+    for m in range(k, 2, -1):
+        eps = 8 * (k ** 2 + m + 4) * np.finfo(float).eps * scale
+
+        # search the sorted rows in blocks of columns
+        averages = sums[:m] / (m - 2.0)
+        highest = averages.max()
+        rows, best, depth, found = np.arange(m), np.inf, 0, []
+        while len(rows) and depth < built:
+            block = slots[columns[rows, depth:depth + 16]]
+            scores = dists[rows, depth:depth + 16] - averages[rows, None]
+            bounds = scores[:, -1] - highest
+            scores = np.where(block >= 0, scores - averages[block], np.inf)
+            best = min(best, scores.min())
+            p, q = np.nonzero(scores <= best + eps)
+            found.append((rows[p], block[p, q]))
+            rows = rows[bounds <= best + 2 * eps]
+            depth += 16
+
+        rows = np.concatenate([block[0] for block in found])
+        cols = np.concatenate([block[1] for block in found])
+        swap = ranks[rows] > ranks[cols]
+        rows[swap], cols[swap] = cols[swap], rows[swap]
+
+        # compute the scores of the candidates with the sums of the rows in
+        # the order of the clusters
+        ranked = np.argsort(ranks[:m])
+        exact = np.zeros(m)
+        for x in np.unique(np.concatenate([rows, cols])):
+            exact[x] = sum(values[x, ranked].tolist()) / (m - 2.0)
+        candidates = values[cols, rows] - exact[cols] - exact[rows]
+        minimum = candidates.min()
+        rows, cols = rows[candidates == minimum], cols[candidates == minimum]
+        first = np.lexsort((ranks[cols], ranks[rows]))[0]
+        a, b = rows[first], cols[first]
+
+        dist_ab = values[a, b]
+        sAX = dist_ab / 2.0 + (exact[a] - exact[b]) / 2
+        sBX = dist_ab - sAX
+        tree_matrix.append((nodes[a], nodes[b], float(sAX), float(sBX)))
+        nodes[a] = idxNew
+        idxNew += 1
+        clusters[keys[a]] += clusters[keys[b]]
+        del clusters[keys[b]]
+
+        # join the clusters in the row of the first one
+        new = (values[a, :m] + values[b, :m] - dist_ab) / 2.0
+        new[a] = 0.0
+        sums[:m] += new - values[:m, a] - values[:m, b]
+        sums[a] = new.sum() - new[b]
+        values[a, :m] = new
+        values[:m, a] = new
+        scale = max(scale, np.abs(new).max())
+        slots[ids[[a, b]]] = -1
+        ids[a] = 2 * k - m
+        slots[ids[a]] = a
+
+        # move the last cluster to the row of the second one
+        last = m - 1
+        if b != last:
+            values[b, :m] = values[last, :m]
+            values[:m, b] = values[:m, last]
+            for array in (sums, ranks, ids, dists, columns):
+                array[b] = array[last]
+            slots[ids[b]] = b
+            nodes[b] = nodes[last]
+            keys[b] = keys[last]
+            if a == last:
+                a = b
+
+        # sort all rows again when half of their columns have been joined
+        if 2 * last <= built:
+            sort(range(last), last)
+            built = last
+        else:
+            sort([a], last)
+
+    a, b = np.argsort(ranks[:2])
+    sAX = values[a, b] / 2
+    tree_matrix.append((nodes[a], nodes[b], float(sAX), float(sAX)))
+    clusters[keys[a]] += clusters[keys[b]]
+    del clusters[keys[b]]
 
 def _tree2nwk(
         tree,
@@ -715,33 +747,27 @@ def _tree2nwk(
 
     """
 
-# [autouncomment]     cdef int i,a,b
-# [autouncomment]     cdef float c,d
     x = len(taxa)
-# [autouncomment]     cdef str newick_string
-
-    newick = dict([(i,taxa[i]) for i in range(x)])
-    
-    # create different output, depending on the options for the inclusion of
-    # distances or topology only
-    if distances:
-        for i,(a,b,c,d) in enumerate(tree):
-            newick[x+i] = '({0}:{2:.2f},{1}:{3:.2f})'.format(
-                    newick[a],
-                    newick[b],
-                    c,
-                    d
-                    )
-    else:
-        for i in range(len(tree)):
-            newick[x+i] = '({0},{1})'.format(
-                    newick[tree[i][0]],
-                    newick[tree[i][1]]
-                    )
-    
-    newick_string = newick[max(newick.keys())] + ';'
-
-    return newick_string    
-    
-    
-    
+    if not tree:
+        return str(taxa[-1]) + ';'
+
+    # assemble the string from the root without recursion
+    pieces = []
+    stack = [x + len(tree) - 1]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            pieces.append(node)
+        elif node < x:
+            pieces.append(str(taxa[node]))
+        else:
+            a, b, c, d = tree[node - x]
+            # create different output, depending on the options for the
+            # inclusion of distances or topology only
+            if distances:
+                stack += [':{0:.2f})'.format(d), b, ':{0:.2f},'.format(c),
+                          a, '(']
+            else:
+                stack += [')', b, ',', a, '(']
+
+    return ''.join(pieces) + ';'
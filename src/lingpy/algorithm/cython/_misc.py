@@ -57,6 +57,14 @@ def squareform(
                 k += 1
     return out
 
+def _rebuild_score_dict(chars, matrix):
+    """
+    Rebuild a pickled scorer with the ScoreDict of the backend in use.
+    """
+    from lingpy.algorithm import misc
+    return misc.ScoreDict(chars, matrix)
+
+
 class ScoreDict(object):
     """
     Class allows quick access to scoring functions using dictionary \
@@ -6,6 +6,8 @@ from itertools import combinations, combinations_with_replacement, product
 from collections import defaultdict
 from functools import partial
 
+import numpy as np
+
 from lingpy.algorithm import calign
 from lingpy.algorithm import talign
 from lingpy.algorithm import cluster
@@ -13,7 +15,7 @@ from lingpy.algorithm import misc
 
 from lingpy.thirdparty.cogent import LoadTree
 from lingpy.sequence.sound_classes import (
-    ipa2tokens, tokens2class, prosodic_string, prosodic_weights, pid,
+    ipa2tokens, tokens2class_many, prosodic_string, prosodic_weights, pid,
 )
 from lingpy.settings import rcParams
 from lingpy import log
@@ -184,15 +186,12 @@ class Multiple:
             model = rcParams[model] if model else rcParams['model']
         
 
-        # check for keyword classes
+        # create the sound-classes or the fake classes
         if not classes:
-            classify = identity
+            self.classes = [identity(x) for x in self.tokens]
         else:
             self.model = model or rcParams['sca']
-            classify = lambda x: tokens2class(x, self.model)
-
-        # create the sound-classes or the fake classes
-        self.classes = [cls for cls in map(classify, self.tokens)]
+            self.classes = tokens2class_many(self.tokens, self.model)
 
         # once a class model is defined, there may be identical sequences,
         # which in IPA terms are different. In order to avoid computing
@@ -229,10 +228,10 @@ class Multiple:
             self._prostrings = list([prosodic_string(s) for s in self._sonars])
         # create sonars if the argument is true
         elif sonar:
-            self._sonars = list(
-                map(lambda x: [int(t) for t in tokens2class(
-                    x, rcParams['art'], stress=rcParams['stress'])],
-                    [self.tokens[key] for key in keys]))
+            self._sonars = [[int(t) for t in classes] for classes in
+                            tokens2class_many(
+                                [self.tokens[key] for key in keys],
+                                rcParams['art'], stress=rcParams['stress'])]
             if log.get_level() <= logging.DEBUG:
                 for _i, _sonar in enumerate(self._sonars):
                     if 0 in _sonar:
@@ -258,13 +257,12 @@ class Multiple:
         for (i, seqA), (j, seqB) in combinations_with_replacement(
             enumerate(self._numbers), 2):
             if i < j:
-                for (numA, numB) in product(seqA, seqB):
-                    self.scoredict[numA, numB] = scorer(
-                        self._get(numA, '_classes'), self._get(numB, '_classes'))
+                for (numA, charA), (numB, charB) in product(
+                        zip(seqA, self._classes[i]), zip(seqB, self._classes[j])):
+                    self.scoredict[numA, numB] = scorer(charA, charB)
                     self.scoredict[numB, numA] = self.scoredict[numA, numB]
             elif i == j:
-                for num in seqA:
-                    char = self._get(num, '_classes')
+                for num, char in zip(seqA, self._classes[i]):
                     self.scoredict[num, num] = scorer(char, char)
 
     def _set_scorer(self, score_mode='classes'):
@@ -352,87 +350,121 @@ class Multiple:
         """
         Method creates an extended library for alignments using the Tcoffee
         approach.
+
+        Notes
+        -----
+        The library is stored as a square array with one row and one column
+        for each residue of the sequences, the position of a residue in the
+        array is given by the dictionary :py:attr:`_residues`. It is only
+        converted to a dictionary, which can be passed to the alignment
+        functions, once it has been extended (see :py:meth:`_library2dict`).
         """
-        self.library = {}
+        residues = [num for nums in self._numbers for num in nums]
+        self._residues = {num: i for i, num in enumerate(residues)}
+        scores = np.array(
+            [[self.scoredict.get((k, l), 0.0) for l in residues] for k in residues],
+            dtype=float).reshape(len(residues), len(residues))
 
         # create library for non-sound-class approaches
         if not self._sonars:
-            for numA, numB in combinations_with_replacement(self._numbers, 2):
-                for k, l in product(numA, numB):
-                    self.library[k, l] = 0.0
-                    self.library[l, k] = 0.0
+            self._library = np.zeros(scores.shape)
         else:
             # note that we somehow HAVE to include a sensitivity for V-C
             # distinctions in the library mode, otherwise it may get complicated
             # sometimes, therefore, the library is initialized by setting only the
             # scores for c-c and v-v matches to 0, the other scores get their
             # original penalty defined by the old scorer
-            for (i, numA), (j, numB) in combinations_with_replacement(
-                enumerate(self._numbers), 2):
-                if i < j:
-                    for k, l in product(numA, numB):
-                        # see the comment above for the add-on in this
-                        # line
-                        a = self._get(k, '_sonars')
-                        b = self._get(l, '_sonars')
-                        if a >= 7 or b >= 7 and a + b < 14:
-                            self.library[k, l] = self.scoredict[k, l]
-                            self.library[l, k] = self.scoredict[l, k]
-                        else:
-                            self.library[k, l] = 0.0
-                            self.library[l, k] = 0.0
-                elif i == j:
-                    for k, l in product(numA, numB):
-                        self.library[k, l] = 0.0
-                        self.library[l, k] = 0.0
-
-    def _extend_library(self):
+            sonars = np.array([s for sonars in self._sonars for s in sonars])
+            seqs = np.repeat(
+                np.arange(self.height), [len(nums) for nums in self._numbers])
+            a, b = sonars[:, None], sonars[None, :]
+            penalize = (a >= 7) | ((b >= 7) & (a + b < 14))
+            # the condition is checked for residues of the first sequence
+            # against residues of the second sequence of each pair
+            before = seqs[:, None] < seqs[None, :]
+            self._library = np.where(
+                (penalize & before) | (penalize.T & before.T), scores, 0.0)
+        self._scores = scores
+
+    def _extend_library(self, anchors=None):
         """
         Extend the library by new alignments.
+
+        Parameters
+        ----------
+        anchors : int (default=None)
+            The maximal number of sequences through which the residues of the
+            other sequences are compared (see :py:meth:`lib_align`).
         """
-        # add the residue-pairs of all aligned sequences first
-        for i, j in [(i, j) for i in range(self.height)
-                     for j in range(self.height) if i <= j]:
-            for m, n in zip(self._alignments[i][j][0], self._alignments[i][j][1]):
-                if m != "-" and n != "-":
-                    # add the values to the library
-                    # the similarity score is determined by adding taking the
-                    # average of matrix score and the similarity score of the
-                    # alignment of both sequences
-                    score = self.scorer[m, n]
-                    sim = self._alignments[i][j][2] / float(
-                        len(self._alignments[i][j][0]))
-                    self.library[m, n] += (sim + score) / 2.0
-                    self.library[n, m] = self.library[m, n]
-
-        # add the residue-pairs resulting from an alignment via a third sequence
-
-        # create the indices for the loop
-        mappings = (
-            (i, j, k)
-            for i in range(self.height)
-            for j in range(self.height)
-            for k in range(self.height)
-            if i <= j and k != i and k != j)
-
-        for i, j, k in mappings:
-            almI, almIK, simIK = self._alignments[i][k]
-            almJ, almJK, simJK = self._alignments[j][k]
-
-            # determine, which of the values occur in both alignments
-            # with the third sequence
-            for char in self._numbers[k]:
-                try:
-                    valI = almI[almIK.index(char)]
-                    valJ = almJ[almJK.index(char)]
-                    if valI != "-" and valJ != "-":
-                        score = self.scorer[valI, valJ]
-                        sim = min(simIK, simJK) / ((len(almIK) + len(almJK)) / 2.0)
-
-                        self.library[valI, valJ] += (sim + score) / 2.0
-                        self.library[valJ, valI] = self.library[valI, valJ]
-                except:
-                    pass
+        index = self._residues
+
+        def residue_pairs(rowA, rowB):
+            return [(index[m], index[n]) for m, n in zip(rowA, rowB)
+                    if m != '-' and n != '-']
+
+        # add the residue-pairs of all aligned sequences first, the similarity
+        # score is determined by taking the average of matrix score and the
+        # similarity score of the alignment of both sequences
+        rows, cols, sims = [], [], []
+        for i, j in combinations_with_replacement(range(self.height), 2):
+            almA, almB, sim = self._alignments[i][j]
+            pairs = residue_pairs(almA, almB)
+            if not pairs:
+                continue
+            rows += [m for m, n in pairs]
+            cols += [n for m, n in pairs]
+            sims += len(pairs) * [sim / float(len(almA))]
+        self._add_to_library(
+            np.array(rows, dtype=int), np.array(cols, dtype=int), np.array(sims))
+
+        # add the residue-pairs resulting from an alignment via a third
+        # sequence k: the residues of k are searched in the second row of the
+        # alignments, which belongs to k for all sequences i < k, so k links
+        # the residues of all pairs of sequences i <= j < k
+        if anchors is None or anchors >= self.height:
+            links = range(self.height)
+        else:
+            distances = np.mean(np.array(self.matrix), axis=1)
+            links = sorted(np.argsort(distances, kind='stable')[:anchors])
+
+        for k in links:
+            if k < 1:
+                continue
+            # store the residue of each sequence i < k which is aligned to
+            # each residue of k (-1 for gaps and unaligned residues)
+            aligned = np.full((k, len(self._numbers[k])), -1)
+            sims, lengths = np.zeros(k), np.zeros(k, dtype=int)
+            for i in range(k):
+                almI, almK, sims[i] = self._alignments[i][k]
+                lengths[i] = len(almK)
+                for m, n in zip(almI, almK):
+                    if m != '-' and n != '-':
+                        aligned[i, int(n.split('.')[1]) - 1] = index[m]
+            I, J = np.triu_indices(k)
+            valI, valJ = aligned[I], aligned[J]
+            pairs, _ = np.nonzero((valI != -1) & (valJ != -1))
+            I, J = I[pairs], J[pairs]
+            found = (valI != -1) & (valJ != -1)
+            self._add_to_library(
+                valI[found], valJ[found],
+                np.minimum(sims[I], sims[J]) / ((lengths[I] + lengths[J]) / 2.0))
+
+    def _add_to_library(self, rows, cols, sims):
+        """
+        Add the average of similarity score and matrix score to pairs of
+        residues, which must not occur twice in one call.
+        """
+        scores = self._scores[rows, cols]
+        self._library[rows, cols] += (sims + scores) / 2.0
+        self._library[cols, rows] = self._library[rows, cols]
+
+    def _library2dict(self):
+        """
+        Return the library as a dictionary with pairs of residues as keys.
+        """
+        residues = list(self._residues)
+        return dict(zip(
+            product(residues, residues), self._library.ravel().tolist()))
 
     def _make_guide_tree(self, tree_calc='upgma'):
         """
@@ -900,6 +932,15 @@ class Multiple:
             since this is the character that represents tones in the prosodic
             strings of sequences.
 
+        anchors : int (default=None)
+            The maximal number of sequences through which the residues of the
+            other sequences are compared when the library is extended. By
+            default, all sequences are used, which requires a number of
+            comparisons which grows with the cube of the number of sequences.
+            When set, only the sequences with the lowest mean distance to the
+            other sequences are used, which makes the library mode feasible
+            for large sets of sequences.
+
         """
         # set up the defaults parameters stored in the kw dictionary
         kw = dict(
@@ -915,7 +956,8 @@ class Multiple:
             scoredict=rcParams['align_scorer'],
             gop=rcParams['align_gop'],
             gap_weight=rcParams['align_gap_weight'],
-            sonars=False)
+            sonars=False,
+            anchors=None)
         kw.update(keywords)
 
         # fixing a but to avoid that defining models as string will yield an error
@@ -957,8 +999,9 @@ class Multiple:
         for run in kw['modes']:
             self._get_pairwise_alignments(
                 run[0], run[1], run[2], kw['factor'], kw['restricted_chars'])
-            self._extend_library()
+            self._extend_library(kw['anchors'])
 
+        self.library = self._library2dict()
         self._set_scorer('library')
         self._get_pairwise_alignments(
             kw['mode'], 0, 0.0, kw['factor'], kw['restricted_chars'])
@@ -18,8 +18,8 @@ from lingpy.basic.wordlist import Wordlist
 from lingpy.convert import html
 from lingpy.convert.strings import msa2str
 from lingpy.sequence.sound_classes import (
-    ipa2tokens, token2class, tokens2class, class2tokens, prosodic_string,
-    prosodic_weights, tokens2morphemes)
+    ipa2tokens, token2class, tokens2class, tokens2class_many, class2tokens,
+    prosodic_string, prosodic_weights, tokens2morphemes)
 from lingpy.align.multiple import Multiple
 from lingpy.align.pairwise import Pairwise
 from lingpy.algorithm import misc
@@ -145,10 +145,10 @@ class MSA(Multiple):
         self.model = keywords['model']
 
         # redefine the sequences of the Multiple class
-        class_strings = [
-            tokens2class(seq.split(' '), self.model, stress=keywords['stress'],
-                diacritics=keywords['diacritics'], cldf=keywords['cldf'])
-            for seq in self.seqs]
+        class_strings = tokens2class_many(
+            [seq.split(' ') for seq in self.seqs], self.model,
+            stress=keywords['stress'], diacritics=keywords['diacritics'],
+            cldf=keywords['cldf'])
 
         # define the scoring dictionaries according to the methods
         aligned_seqs = [alm for alm in self.alm_matrix]
@@ -529,6 +529,9 @@ class Alignments(Wordlist):
         basis for the tabular representation of the word list.
     conf : string (default='')
         A string defining the path to the configuration file.
+    storage : { "rows", "columns" } (default="rows")
+        Store the data as a dictionary of rows or column by column, see
+        :py:class:`~lingpy.basic.wordlist.Wordlist`.
     ref : string (default='cogid')
         The name of the column that stores the cognate IDs.
     modify_ref : function (default=False)
@@ -571,13 +574,14 @@ class Alignments(Wordlist):
         _interactive=True,
         split_on_tones=False,
         ref="cogid",
+        storage='rows',
         **keywords):
         kw = {"segments": "tokens", "alignment": "alignment", "transcription":
                 "ipa", "ref": "cogid", "fuzzy": False}
         kw.update(keywords)
 
         # initialize the wordlist
-        Wordlist.__init__(self, infile, row, col, conf)
+        Wordlist.__init__(self, infile, row, col, conf, storage=storage)
         self._interactive = _interactive
         self._alignment = kw['alignment'] #if kw['alignment'] in \
                                           #   self.header else self._alias[kw['alignment']]
@@ -875,6 +879,15 @@ class Alignments(Wordlist):
             should therefore be aligned specifically. This defaults to "T",
             since this is the character that represents tones in the prosodic
             strings of sequences.
+
+        processes : int (default=1)
+            The number of worker processes among which the cognate sets are
+            distributed. Set to None to use all available cores. The results
+            are identical to those of the serial computation.
+
+        executor : :py:class:`concurrent.futures.Executor` (default=None)
+            An existing process or thread pool which shall be used instead of
+            creating a new process pool.
         """
         kw = dict(
             alignment=False,
@@ -900,6 +913,8 @@ class Alignments(Wordlist):
             style='plain',
             swap_check=False,
             tree_calc=rcParams['align_tree_calc'],
+            processes=1,
+            executor=None,
         )
         kw.update(keywords)
         kw['ref'] = kw['ref'] or self._ref
@@ -923,83 +938,69 @@ class Alignments(Wordlist):
             kw['restricted_chars']
         ])
 
-        for key, value in sorted(self.msa[kw['ref']].items(), key=lambda x: x[0]):
-            if key not in [0, '0', '']:
-                log.debug("Analyzing cognate set number {0}.".format(key))
-
-                # check for scorer keyword
-                if not kw['scoredict']:
-                    m = SCA(value, **kw)
-                else:
-                    # get the tokens
-                    numbers = [self[idx, 'numbers'] for idx in value['ID']]
-                    if kw['sonar']:
-                        sonars = [self[idx, 'sonars'] for idx in value['ID']]
-                    else:
-                        sonars = False
-                    if self._mode == 'fuzzy':
-                        cogs = [self[idx, self._ref] for idx in value['ID']]
-                        idxs = [c.index(key) for c in cogs]
-                        tokens = [self[idx, self._segments] for idx in 
-                                value['ID']]
-                        for i, (n, idx, t) in enumerate(zip(numbers, idxs,
-                            tokens)):
-                            nums = [[]]
-                            for nn, tt in zip(n, t):
-                                if tt == rcParams['morpheme_separator']:
-                                    nums += [[]]
-                                else:
-                                    nums[-1] += [nn]
-                            numbers[i] = nums[idx]
-                            if sonars:
-                                sons = [[]]
-                                for s, tt in zip(sonars[i], t):
-                                    if tt == rcParams['morpheme_separator']:
-                                        sons += [[]]
-                                    else:
-                                        sons[-1] += [s]
-                                sonars[i] = sons[idx]
-                    value['seqs'] = numbers
-
-                    m = SCA(value, **kw)
-                    kw['sonars'] = sonars
-                    kw['classes'] = False
-
-
-                if kw['method'] == 'progressive':
-                    m.prog_align(**kw)
-                elif kw['method'] == 'library':
-                    m.lib_align(**kw)
-
-                if kw['iteration']:
-                    m.iterate_similar_gap_sites()
-                    m.iterate_clusters(0.5)
-                    m.iterate_orphans()
-
-                if kw['swap_check']:
-                    m.swap_check()
-
-                # convert back to external format, if scoredict is set
-                if kw['scoredict']:
-                    for i, alm in enumerate(m.alm_matrix):
-                        tk = self[m.ID[i], self._segments]
-                        if self._mode == 'fuzzy':
-                            tk = tk.n[idxs[i]]
-                        new_tk = class2tokens(tk, alm)
-                        m.alm_matrix[i] = new_tk
-
-                if hasattr(m, 'swaps'):
-                    self._meta['msa'][kw['ref']][key]['swaps'] = m.swaps
-
-                self._meta['msa'][kw['ref']][key]['alignment'] = m.alm_matrix
-                self._meta['msa'][kw['ref']][key]['_sonority_consensus'] = \
-                    m._sonority_consensus
-                self._meta['msa'][kw['ref']][key]['stamp'] = rcParams['align_stamp'].format(
-                    m.dataset, m.seq_id, __version__, rcParams['timestamp'], params)
-                self._meta['msa'][kw['ref']][key]['parameters'] = params
+        processes, executor = kw.pop('processes'), kw.pop('executor')
+        msa = self._meta['msa'][kw['ref']]
+        keys = [key for key in sorted(msa) if key not in [0, '0', '']]
+
+        # the cognate sets are independent of each other, so they can be
+        # distributed among worker processes, the results are written to the
+        # data as soon as they arrive
+        for key, (alignment, consensus, swaps) in zip(keys, util.parallel_map(
+                _align_cognate_set,
+                (self._alignment_task(key, msa[key], kw) for key in keys),
+                processes, executor)):
+            if swaps is not None:
+                msa[key]['swaps'] = swaps
+            msa[key]['alignment'] = alignment
+            msa[key]['_sonority_consensus'] = consensus
+            msa[key]['stamp'] = rcParams['align_stamp'].format(
+                msa[key]['dataset'], msa[key]['seq_id'], __version__,
+                rcParams['timestamp'], params)
+            msa[key]['parameters'] = params
 
         self._msa2col(ref=kw['ref'], alignment=kw['alignment'])
 
+    def _alignment_task(self, key, value, kw):
+        """
+        Prepare the alignment of one cognate set (see
+        :py:func:`_align_cognate_set`).
+        """
+        log.debug("Analyzing cognate set number {0}.".format(key))
+
+        # check for scorer keyword
+        if not kw['scoredict']:
+            return value, None, {}, kw
+
+        # get the tokens
+        numbers = [self[idx, 'numbers'] for idx in value['ID']]
+        if kw['sonar']:
+            sonars = [self[idx, 'sonars'] for idx in value['ID']]
+        else:
+            sonars = False
+        tokens = [self[idx, self._segments] for idx in value['ID']]
+        if self._mode == 'fuzzy':
+            cogs = [self[idx, self._ref] for idx in value['ID']]
+            idxs = [c.index(key) for c in cogs]
+            for i, (n, idx, t) in enumerate(zip(numbers, idxs, tokens)):
+                nums = [[]]
+                for nn, tt in zip(n, t):
+                    if tt == rcParams['morpheme_separator']:
+                        nums += [[]]
+                    else:
+                        nums[-1] += [nn]
+                numbers[i] = nums[idx]
+                if sonars:
+                    sons = [[]]
+                    for s, tt in zip(sonars[i], t):
+                        if tt == rcParams['morpheme_separator']:
+                            sons += [[]]
+                        else:
+                            sons[-1] += [s]
+                    sonars[i] = sons[idx]
+                tokens[i] = t.n[idx]
+        value['seqs'] = numbers
+        return value, tokens, dict(sonars=sonars, classes=False), kw
+
     def get_confidence(self, scorer, ref="lexstatid", gap_weight=0.25):
         """
         Function creates confidence scores for a given set of alignments.
@@ -1321,6 +1322,41 @@ class Alignments(Wordlist):
                     log=False)
 
 
+def _align_cognate_set(task):
+    """
+    Align the sequences of one cognate set.
+
+    Notes
+    -----
+    This function is used by :py:meth:`Alignments.align` and is defined on
+    module level so that it can be sent to worker processes. Only the results
+    are returned, so that the alignment objects do not have to be sent back.
+    """
+    value, tokens, keywords, kw = task
+    m = SCA(value, **kw)
+    kw = dict(kw, **keywords)
+
+    if kw['method'] == 'progressive':
+        m.prog_align(**kw)
+    elif kw['method'] == 'library':
+        m.lib_align(**kw)
+
+    if kw['iteration']:
+        m.iterate_similar_gap_sites()
+        m.iterate_clusters(0.5)
+        m.iterate_orphans()
+
+    if kw['swap_check']:
+        m.swap_check()
+
+    # convert back to external format, if scoredict is set
+    alignment = m.alm_matrix
+    if tokens is not None:
+        alignment = [class2tokens(tk, alm) for tk, alm in zip(tokens, alignment)]
+
+    return alignment, m._sonority_consensus, getattr(m, 'swaps', None)
+
+
 def SCA(infile, **keywords):
     """
     Method returns alignment objects depending on input file or input data.
@@ -4,7 +4,8 @@ Module provides basic operations on Wordlist-Objects.
 import json
 from string import ascii_letters, digits
 from collections import defaultdict
-from itertools import product
+
+import numpy as np
 
 from lingpy.settings import rcParams
 from lingpy.convert.strings import matrix2dst, scorer2str, msa2str
@@ -47,6 +48,139 @@ def get_score(
         return 1.0
 
 
+def _hashable(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _pair_counts(codes, cols, width, weights=None, block=2 ** 22):
+    """
+    Count the codes shared by all pairs of columns.
+
+    Parameters
+    ----------
+    codes, cols : numpy.ndarray
+        The codes and the columns in which they occur, with one entry per
+        distinct pair of a code and a column.
+    width : int
+        The number of columns.
+    weights : numpy.ndarray (default=None)
+        The weights of the entries, defaulting to 1.
+
+    Returns
+    -------
+    counts : numpy.ndarray
+        A matrix whose cell (a, b) sums the weights of the codes in column a
+        which also occur in column b. The values on the diagonal are not
+        counted.
+    """
+    weights = np.ones(len(codes)) if weights is None else weights
+    counts = np.zeros((width, width))
+
+    # codes occurring in only one column do not contribute to the pairs
+    _, inverse, sizes = np.unique(
+        codes, return_inverse=True, return_counts=True)
+    keep = sizes[inverse] > 1
+    codes = np.unique(inverse[keep], return_inverse=True)[1].ravel()
+    cols, weights = cols[keep], weights[keep]
+    order = np.argsort(codes, kind='stable')
+    codes, cols, weights = codes[order], cols[order], weights[order]
+
+    # the matrices of codes and columns are filled block by block
+    size = max(1, block // max(width, 1))
+    for start in range(0, len(codes) and codes[-1] + 1, size):
+        lo, hi = np.searchsorted(codes, [start, start + size])
+        present = np.zeros((min(size, codes[-1] + 1 - start), width))
+        present[codes[lo:hi] - start, cols[lo:hi]] = 1
+        weighted = np.zeros(present.shape)
+        weighted[codes[lo:hi] - start, cols[lo:hi]] = weights[lo:hi]
+        counts += weighted.T @ present
+    np.fill_diagonal(counts, 0)
+    return np.rint(counts).astype(int)
+
+
+def _list_scores(wl, ref, mode, taxa):
+    """
+    Compute the shared or jaccard scores from the lists of all taxa.
+    """
+    idx = wl._header[ref]
+    ids = wl._array[:, [wl.cols.index(taxon) for taxon in taxa]]
+    if not ids.size:
+        return np.zeros((len(taxa), len(taxa)), dtype=int)
+
+    # equal values share a code, all values equal to zero have the code 0
+    lookup = {0: 0}
+    uniques, inverse = np.unique(ids, return_inverse=True)
+    codes = np.array([
+        0 if key == 0 else lookup.setdefault(
+            _hashable(wl[key][idx]), len(lookup)) for key in uniques])
+    codes = codes[inverse.ravel()].reshape(ids.shape)
+
+    pairs, frequency = np.unique(
+        codes * len(taxa) + np.arange(len(taxa)), return_counts=True)
+    codes, cols = pairs // len(taxa), pairs % len(taxa)
+    nonzero = codes != 0
+
+    if mode == 'shared':
+        return _pair_counts(
+            codes[nonzero], cols[nonzero], len(taxa),
+            weights=frequency[nonzero])
+
+    shared = _pair_counts(codes[nonzero], cols[nonzero], len(taxa))
+    zeros = np.zeros(len(taxa), dtype=int)
+    zeros[cols[~nonzero]] = 1
+    distinct = np.bincount(cols, minlength=len(taxa))
+    union = distinct[:, None] + distinct - shared - np.outer(zeros, zeros)
+    return 1 - shared / union
+
+
+def _swadesh_scores(wl, ref, taxa, concepts, ignore_missing):
+    """
+    Compute the swadesh distances from the concepts of all taxa.
+    """
+    idx = wl._header[ref]
+    lookup, codes, cols, present = {}, [], [], np.zeros(
+        (len(concepts), len(taxa)))
+    for i, concept in enumerate(concepts):
+        for j, taxon in enumerate(taxa):
+            keys = wl._col_dict[taxon].get(concept)
+            if keys:
+                present[i, j] = 1
+                for key in keys:
+                    codes += [lookup.setdefault(
+                        (i, _hashable(wl[key][idx])), len(lookup))]
+                    cols += [j]
+    pairs = np.unique(
+        np.array(codes, dtype=int) * len(taxa) + np.array(cols, dtype=int))
+    codes, cols = pairs // len(taxa), pairs % len(taxa)
+
+    # concepts with several values in one taxon are counted only once
+    rows = np.array([i for i, _ in lookup], dtype=int)[codes]
+    cells, sizes = np.unique(rows * len(taxa) + cols, return_counts=True)
+    multiple = np.zeros(len(concepts), dtype=bool)
+    multiple[cells[sizes > 1] // len(taxa)] = True
+    single = ~multiple[rows]
+    shared = _pair_counts(codes[single], cols[single], len(taxa))
+    for i in np.flatnonzero(multiple):
+        selected = rows == i
+        shared += _pair_counts(
+            codes[selected], cols[selected], len(taxa)) > 0
+
+    if ignore_missing:
+        missing = np.zeros((len(taxa), len(taxa)), dtype=int)
+    else:
+        missing = len(concepts) - np.rint(present.T @ present).astype(int)
+    total = wl.height - missing
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = 1 - shared / total
+    for i, j in zip(*np.nonzero(total == 0)):
+        if i != j:
+            log.warning(
+                "Zero-division error encountered in '{0}' and '{1}'.".format(
+                    taxa[i], taxa[j]))
+    scores[total == 0] = 1.0
+    return scores
+
+
 def wl2dst(
         wl,  # wordlist object
         taxa="taxa",
@@ -58,31 +192,33 @@ def wl2dst(
         **keywords):
     """
     Function converts wordlist to distance matrix.
+
+    Notes
+    -----
+    The values of the references are encoded as integers once, and the
+    scores of all pairs of taxa are computed from the matrices of codes and
+    taxa, yielding the same distances as :py:func:`get_score`.
     """
     # check for attributes
     assert hasattr(wl, taxa) and hasattr(wl, concepts)
+    taxa, concepts = getattr(wl, taxa), getattr(wl, concepts)
+
+    def scores(reference):
+        if mode in ['shared', 'jaccard']:
+            return _list_scores(wl, reference, mode, taxa)
+        assert mode == 'swadesh'
+        return _swadesh_scores(wl, reference, taxa, concepts, ignore_missing)
+
+    distances = np.triu(scores(ref), 1)
+    if refB:
+        distances = distances + np.tril(scores(refB), -1)
+    else:
+        distances = distances + distances.T
+    if mode == 'shared':
+        np.fill_diagonal(distances, [
+            len(wl.get_list(col=taxon, flat=True)) for taxon in taxa])
 
-    distances = [[0 for i in range(wl.width)] for j in range(wl.width)]
-
-    for (i, taxA), (j, taxB) in product(
-            enumerate(getattr(wl, taxa)), repeat=2):
-        if i < j:
-            score = get_score(
-                    wl, ref, mode, taxA, taxB, concepts_attr=concepts,
-                    ignore_missing=ignore_missing)
-            distances[i][j] = score
-            if not refB:
-                distances[j][i] = score
-        elif i == j:
-            if mode == 'shared':
-                distances[i][j] = len(
-                        wl.get_list(col=taxA, flat=True))
-        elif i > j and refB:
-            distances[i][j] = get_score(
-                wl, refB, mode, taxA, taxB, concepts_attr=concepts,
-                ignore_missing=ignore_missing)
-
-    return distances
+    return distances.tolist()
 
 
 def iter_rows(wordlist, *values):
@@ -3,12 +3,14 @@ Basic parser for text files in QLC format.
 """
 import os
 import numpy as np
+from bisect import insort
 from collections import defaultdict
 
 from lingpy import basictypes
 assert basictypes  # Needed to make reading config values work!
 from lingpy.settings import rcParams
 from lingpy.read.qlc import read_qlc
+from lingpy.basic.storage import ColumnStore
 from lingpy import util
 from lingpy.util import confirm
 from lingpy import log
@@ -44,13 +46,26 @@ class QLCParser(object):
     """
     Basic class for the handling of text files in QLC format.
 
+    Parameters
+    ----------
+    filename : { string, dict }
+        The input file or a dictionary with the data.
+    conf : string (default='')
+        The path to the configuration file.
+    storage : { "rows", "columns" } (default="rows")
+        Store the data as a dictionary of rows ("rows") or column by column
+        ("columns", see :py:class:`~lingpy.basic.storage.ColumnStore`), which
+        requires much less memory for large word lists.
+
     """
 
-    def __init__(self, filename, conf=''):
+    def __init__(self, filename, conf='', storage='rows'):
         """
         Parse data regularly if the data has not been loaded from a pickled version.
         """
         self.log = log.get_logger()
+        if storage not in ['rows', 'columns']:
+            raise ValueError("Unknown storage {0}.".format(storage))
 
         # try to load the data
         internal_import = False
@@ -170,6 +185,9 @@ class QLCParser(object):
                                     self._class[head],
                                     head))
 
+        if storage == 'columns':
+            self._data = ColumnStore(self._data)
+
         # create entry attribute of the wordlist
         self.entries = sorted(set([b.lower() for a, b in self._alias.items() if b]))
 
@@ -178,6 +196,19 @@ class QLCParser(object):
         for key in [k for k in input_data if type(k) != int]:
             self._meta[key] = input_data[key]
 
+    def __getstate__(self):
+        # the datatypes defined in the configuration may be lambda functions,
+        # so we only store their definitions
+        state = dict(self.__dict__)
+        state['_class'] = {
+            k: v for k, v in self._class.items() if k not in self._class_string}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._class.update(
+            {k: eval(v) for k, v in self._class_string.items()})
+
     def __getitem__(self, idx):
         """
         Method allows quick access to the data by passing the integer key.
@@ -277,6 +308,7 @@ class QLCParser(object):
             source,
             function,
             override=False,
+            batch=False,
             **keywords):
         """
         Add new entry-types to the word list by modifying given ones.
@@ -296,6 +328,13 @@ class QLCParser(object):
             A function which is used to convert the source into the target
             value.
 
+        batch : bool (default=False)
+            If set to True, the function is called only once with the whole
+            source column (a list of values, in the order of the IDs) and
+            must return the list of target values. If multiple entry-types
+            are passed as source, the function receives a list of tuples with
+            one value per entry-type.
+
         keywords : {dict}
             A dictionary of keywords that are passed as parameters to the
             function.
@@ -307,8 +346,23 @@ class QLCParser(object):
         entries, but the most basic procedure is to use an existing entry-type
         and to modify it with help of a function.
 
+        Batch functions avoid the overhead of one function call per entry and
+        can process whole columns at once, e.g., with NumPy::
+
+            >>> wl.add_entries('length', 'tokens', lambda col: [
+            ...     len(x) for x in col], batch=True)
+
         """
-        self._add_entries(entry, source, function, override=override, **keywords)
+        self._add_entries(
+            entry, source, function, override=override, batch=batch, **keywords)
+
+    def _get_column(self, idx):
+        """
+        Return the values of a column, in the order of the IDs.
+        """
+        if isinstance(self._data, ColumnStore):
+            return self._data.column(idx)
+        return [row[idx] for row in self._data.values()]
 
     def _add_entries(
             self,
@@ -316,6 +370,7 @@ class QLCParser(object):
             source,
             function,
             override=False,
+            batch=False,
             **keywords):
         # check for empty entries etc.
         if not entry:
@@ -323,19 +378,19 @@ class QLCParser(object):
 
         lentry = entry.lower()
 
+        values = []
+
         def _apply(key, s, *args, **kwargs):
             try:
-                res = function(s, *args, **kwargs)
+                values.append(function(s, *args, **kwargs))
             except:
                 raise ValueError('Could not convert item ID: {0}.'.format(key))
-            if override:
-                self._data[key][self._header[lentry]] = res
-            else:
-                self._data[key].append(res)
 
         # check for override stuff, this causes otherwise an error message
         if entry not in self.header and override:
-            return self.add_entries(entry, source, function, override=False)
+            return self.add_entries(
+                entry, source, function, override=False, batch=batch,
+                **keywords)
 
         # check whether the stuff is already there
         if entry in self._header and not override:
@@ -343,7 +398,8 @@ class QLCParser(object):
                 "Column <{entry}> already exists, do you want to override?".format(
                     entry=entry)):
                 keywords['override'] = True
-                return self.add_entries(entry, source, function, **keywords)
+                return self.add_entries(
+                    entry, source, function, batch=batch, **keywords)
             return  # pragma: no cover
 
         if not override:
@@ -371,8 +427,22 @@ class QLCParser(object):
             # modify the entries attribute
             self.entries = sorted(set(self.entries + [entry.lower()]))
 
+        # pass the whole column to batch functions
+        if batch:
+            if isinstance(source, dict):
+                column = [source[key] for key in self]
+            elif ',' in source:
+                column = list(zip(*[
+                    self._get_column(self._header[s]) for s in source.split(',')]))
+            else:
+                column = self._get_column(self._header[source])
+            values = list(function(column, **keywords))
+            if len(values) != len(self):
+                raise ValueError(
+                    'Function returned {0} values for {1} entries.'.format(
+                        len(values), len(self)))
         # check for multiple entries (separated by comma)
-        if ',' in source:
+        elif ',' in source:
             sources = source.split(',')
             idxs = [self._header[s] for s in sources]
 
@@ -390,10 +460,43 @@ class QLCParser(object):
             for key in self:
                 _apply(key, self[key][idx], **keywords)
 
+        # store the new values, column stores replace the whole column
+        if isinstance(self._data, ColumnStore):
+            self._data.set_column(
+                self._header[lentry] if override else self._data.width, values)
+        elif override:
+            idx = self._header[lentry]
+            for key, value in zip(self, values):
+                self._data[key][idx] = value
+        else:
+            for key, value in zip(self, values):
+                self._data[key].append(value)
+
+
+def _has_name(index, name):
+    """
+    Check whether a row or column of an index is listed under a name.
+    """
+    return any(n in index for n in ((None, '') if not name else (name,)))
+
+
+def _insort_lower(names, name):
+    """
+    Insert a name into a list of names sorted case-insensitively.
+    """
+    key, lo, hi = ('%s' % name).lower(), 0, len(names)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key < ('%s' % names[mid]).lower():
+            hi = mid
+        else:
+            lo = mid + 1
+    names.insert(lo, name)
+
 
 class QLCParserWithRowsAndCols(QLCParser):
-    def __init__(self, filename, row, col, conf):
-        QLCParser.__init__(self, filename, conf=conf)
+    def __init__(self, filename, row, col, conf, storage='rows'):
+        QLCParser.__init__(self, filename, conf=conf, storage=storage)
 
         try:
             self._row_name = self._alias[row]
@@ -403,57 +506,156 @@ class QLCParserWithRowsAndCols(QLCParser):
         except KeyError:
             raise ValueError("Could not find row or col in configuration or input file!")
 
-        def unique_sorted(idx, key):
-            return sorted(
-                set([self._data[k][idx] or '' for k in self._data
-                     if k != 0 and isinstance(k, int)]),
-                key=key)
+        # row and column index point to the place where the data of the main
+        # items is stored in the original dictionary
+        self._rowIdx = rowIdx
+        self._colIdx = colIdx
 
+        self._make_index()
+
+    def _make_index(self):
+        """
+        Create the index of the IDs by row and column.
+
+        Notes
+        -----
+        The index is stored as a dictionary of rows (usually concepts) with
+        dictionaries of columns (usually doculects) and the list of IDs as
+        values (:py:attr:`_dict`), and as a dictionary of columns with
+        dictionaries of rows (:py:attr:`_col_dict`). Both dictionaries share
+        the same lists of IDs, which are kept up to date when the rows or
+        columns of entries are changed, along with the number of entries in
+        each row and column.
+        """
         # define rows and cols as attributes of the word list
-        self.rows = unique_sorted(rowIdx, lambda x: ('%s' % x).lower())
-        self.cols = unique_sorted(colIdx, lambda x: x.lower())
+        self._sort_index(
+            set(v[self._rowIdx] or '' for v in self._data.values()),
+            set(v[self._colIdx] or '' for v in self._data.values()))
+
+        self._dict = {}
+        for key, value in self._data.items():
+            row = self._dict.get(value[self._rowIdx])
+            if row is None:
+                # We use a regular dict for the rows to make the attribute
+                # picklable.
+                row = self._dict[value[self._rowIdx]] = defaultdict(list)
+            row[value[self._colIdx]].append(key)
+        self._row_sizes = {row: sum(map(len, d.values()))
+                           for row, d in self._dict.items()}
+
+        # add empty lists for all missing cells, so that both dictionaries
+        # share all lists of IDs
+        self._col_dict = {col: {} for col in self.cols}
+        for row, d in self._dict.items():
+            for col in self.cols:
+                self._col_dict.setdefault(col, {})[row] = d[col]
+            for col in d:
+                self._col_dict.setdefault(col, {})[row] = d[col]
+        self._col_sizes = {col: sum(map(len, d.values()))
+                           for col, d in self._col_dict.items()}
+        self.__array = None
+
+    def _sort_index(self, rows, cols):
+        self.rows = sorted(rows, key=lambda x: ('%s' % x).lower())
+        self.cols = sorted(cols, key=lambda x: x.lower())
 
         # define height and width of the word list
         self.height = len(self.rows)
         self.width = len(self.cols)
 
-        # row and column index point to the place where the data of the main
-        # items is stored in the original dictionary
-        self._rowIdx = rowIdx
-        self._colIdx = colIdx
+    def _update_index(self, key, row, col):
+        """
+        Move an entry in the index after its row or column was changed.
+        """
+        self._dict[row][col].remove(key)
+        new_row, new_col = self[key, self._row_name], self[key, self._col_name]
+        if new_row not in self._dict:
+            if not _has_name(self._dict, new_row):
+                _insort_lower(self.rows, new_row or '')
+            cells = self._dict[new_row] = defaultdict(
+                list, {c: [] for c in self._col_dict})
+            self._row_sizes[new_row] = 0
+            for c, ids in cells.items():
+                self._col_dict[c][new_row] = ids
+        if new_col not in self._col_dict:
+            if not _has_name(self._col_dict, new_col):
+                _insort_lower(self.cols, new_col or '')
+            cells = self._col_dict[new_col] = {r: [] for r in self._dict}
+            self._col_sizes[new_col] = 0
+            for r, ids in cells.items():
+                self._dict[r][new_col] = ids
+        insort(self._dict[new_row][new_col], key)
+        self._row_sizes[row] -= 1
+        self._col_sizes[col] -= 1
+        self._row_sizes[new_row] += 1
+        self._col_sizes[new_col] += 1
+
+        # remove the old row and column if they have no entries left
+        if not self._row_sizes[row]:
+            del self._dict[row], self._row_sizes[row]
+            for d in self._col_dict.values():
+                del d[row]
+            if not _has_name(self._dict, row):
+                self.rows.remove(row or '')
+        if not self._col_sizes[col]:
+            del self._col_dict[col], self._col_sizes[col]
+            for d in self._dict.values():
+                d.pop(col, None)
+            if not _has_name(self._col_dict, col):
+                self.cols.remove(col or '')
+        self.height = len(self.rows)
+        self.width = len(self.cols)
+        self.__array = None
+
+    @property
+    def _array(self):
+        """
+        Array of the IDs with one column per column and one row per row and
+        synonym of the word list.
+        """
+        if self.__array is None:
+            # create the array by counting the maximal number of occurrences,
+            # store the row names separately in a dictionary
+            tmp_list = []
+            self.__idx = {}
+            for k, d in self._dict.items():
+                self.__idx[k] = []
+                # get maximal amount of "synonyms"
+                for i in range(max([len(x) for x in d.values()])):
+                    self.__idx[k] += [len(tmp_list)]
+                    tmp_list += [[
+                        d[col][i] if len(d[col]) > i else 0 for col in self.cols]]
+            self.__array = np.array(tmp_list)
+        return self.__array
+
+    @property
+    def _idx(self):
+        self._array
+        return self.__idx
 
-        # create a basic array which assigns ids for the entries in a starling manner.
-        # first, find out, how many items (== synonyms) are there maximally for each row
-        self._dict = defaultdict(lambda: defaultdict(list))
-        for key, value in [(k, v) for k, v in self._data.items()
-                           if k != 0 and str(k).isnumeric()]:
-            self._dict[value[rowIdx]][value[colIdx]].append(key)
-
-        # We must cast to a regular dict to make the attribute picklable.
-        self._dict = dict(self._dict)
-
-        # create the array by counting the maximal number of occurrences, store
-        # the row names separately in a dictionary
-        tmp_list = []
-        self._idx = {}
-
-        count = 0
-        for k, d in self._dict.items():
-            self._idx[k] = []
-
-            # get maximal amount of "synonyms"
-            for i in range(max([len(x) for x in d.values()])):
-                tmp = []
-                for j in range(self.width):
-                    try:
-                        tmp.append(d[self.cols[j]][i])
-                    except:
-                        tmp.append(0)
-                self._idx[k] += [count]
-                count += 1
-                tmp_list += [tmp]
-
-        self._array = np.array(tmp_list)
+    def __setitem__(self, idx, item):
+        """
+        Modify a specific cell in a specific column of a wordlist.
+        """
+        if isinstance(idx, tuple) and len(idx) == 2 and idx[0] in self._data \
+                and self._alias.get(idx[1]) in [self._row_name, self._col_name]:
+            row, col = self[idx[0], self._row_name], self[idx[0], self._col_name]
+            QLCParser.__setitem__(self, idx, item)
+            self._update_index(idx[0], row, col)
+        else:
+            QLCParser.__setitem__(self, idx, item)
+
+    def _add_entries(self, entry, source, function, override=False, **keywords):
+        if override and self._alias.get(entry) in [self._row_name, self._col_name]:
+            idx = self.header[self._alias[entry]]
+            before = self._get_column(idx)
+            QLCParser._add_entries(
+                self, entry, source, function, override=override, **keywords)
+            if self._get_column(idx) != before:
+                self._make_index()
+        else:
+            QLCParser._add_entries(
+                self, entry, source, function, override=override, **keywords)
 
     def __getattr__(self, attr):
         """
@@ -0,0 +1,287 @@
+"""
+Column-oriented storage for the data of QLCParser objects.
+
+By default, a :py:class:`~lingpy.basic.parser.QLCParser` stores its data as a
+dictionary with integer IDs as keys and one Python list per row as values.
+For large word lists, the per-row lists and the many duplicated objects in
+columns like "doculect" or "concept" dominate the memory consumption. The
+:py:class:`ColumnStore` offers the same mapping interface, but stores each
+column separately in a compact representation:
+
+* columns of integers and floats are stored as typed arrays,
+* columns of strings are stored as arrays of codes into a table of unique
+  values (interned strings),
+* columns of token lists (e.g., "tokens", "alignment") are stored as one flat
+  array of token codes along with the offsets of each row,
+* all other columns are stored as plain Python lists.
+"""
+from array import array
+from collections.abc import Mapping, MutableSequence
+from functools import partial
+from itertools import accumulate, chain
+
+from lingpy import basictypes
+
+
+class _ObjectColumn(list):
+    """
+    Column storing arbitrary objects in a list.
+    """
+    def tolist(self):
+        return list(self)
+
+
+class _ArrayColumn(object):
+    """
+    Column storing integers or floats in a typed array.
+    """
+    def __init__(self, values, type_, typecode):
+        self.type = type_
+        self.data = array(typecode, values)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, pos):
+        return self.data[pos]
+
+    def __setitem__(self, pos, value):
+        if type(value) is not self.type:
+            raise TypeError(value)
+        self.data[pos] = value
+
+    def tolist(self):
+        return self.data.tolist()
+
+
+class _StringColumn(object):
+    """
+    Column storing strings as codes into a table of unique strings.
+    """
+    def __init__(self, values):
+        self.values, self.index = [], {}
+        self.codes = array('i', [self._code(v) for v in values])
+
+    def _code(self, value):
+        try:
+            return self.index[value]
+        except KeyError:
+            self.index[value] = len(self.values)
+            self.values.append(value)
+            return self.index[value]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, pos):
+        return self.values[self.codes[pos]]
+
+    def __setitem__(self, pos, value):
+        if type(value) is not str:
+            raise TypeError(value)
+        self.codes[pos] = self._code(value)
+
+    def tolist(self):
+        return [self.values[code] for code in self.codes]
+
+
+class _TokenColumn(_StringColumn):
+    """
+    Column storing lists of strings as one flat array of codes.
+
+    Notes
+    -----
+    The lists are created anew with the type of the original values whenever
+    they are accessed, so modifying a list in place does not modify the
+    column. Assigned values are kept as they are.
+    """
+    def __init__(self, values, factory):
+        self.values, self.index = [], {}
+        self.factory = factory
+        self.codes = array(
+            'i', [self._code(token) for token in chain.from_iterable(values)])
+        self.offsets = array(
+            'q', [0] + list(accumulate(len(value) for value in values)))
+        self.changed = {}
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, pos):
+        if pos in self.changed:
+            return self.changed[pos]
+        return self.factory(list(map(
+            self.values.__getitem__,
+            self.codes[self.offsets[pos]:self.offsets[pos + 1]])))
+
+    def __setitem__(self, pos, value):
+        self.changed[pos] = value
+
+    def tolist(self):
+        return [self[pos] for pos in range(len(self))]
+
+
+def _token_factory(value):
+    """
+    Return the function which recreates lists of tokens of the given type.
+    """
+    if type(value) is list:
+        return list
+    if type(value) is basictypes.lists:
+        return partial(basictypes.lists, sep=value.sep)
+    if type(value) is basictypes.aligned:
+        return basictypes.aligned
+    if type(value) is basictypes._strings and value._type is str:
+        return basictypes.strings
+
+
+def _factory_key(value):
+    return type(value), getattr(value, 'sep', None), getattr(value, '_type', None)
+
+
+def column(values):
+    """
+    Create the most compact column for a list of values.
+    """
+    types = set(type(value) for value in values)
+    if types == {int}:
+        try:
+            return _ArrayColumn(values, int, 'q')
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return _ArrayColumn(values, float, 'd')
+    elif types == {str}:
+        return _StringColumn(values)
+    elif len(types) == 1 and _token_factory(values[0]):
+        key = _factory_key(values[0])
+        if all(_factory_key(value) == key and all(
+                type(token) is str for token in value) for value in values):
+            return _TokenColumn(values, _token_factory(values[0]))
+    return _ObjectColumn(values)
+
+
+class Row(MutableSequence):
+    """
+    View on one row of a :py:class:`ColumnStore`.
+
+    Notes
+    -----
+    Rows behave like lists of fixed length: cells can be read and assigned,
+    while rows can neither grow nor shrink, since all rows of a column store
+    share the same columns.
+    """
+    __slots__ = ('_store', '_pos')
+
+    def __init__(self, store, pos):
+        self._store = store
+        self._pos = pos
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [col[self._pos] for col in self._store._columns[i]]
+        return self._store._columns[i][self._pos]
+
+    def __setitem__(self, i, value):
+        self._store._set(self._pos, i, value)
+
+    def __delitem__(self, i):
+        raise TypeError('Rows of a ColumnStore have a fixed length.')
+
+    def insert(self, i, value):
+        raise TypeError('Rows of a ColumnStore have a fixed length.')
+
+    def __len__(self):
+        return len(self._store._columns)
+
+    def __iter__(self):
+        return (col[self._pos] for col in self._store._columns)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class ColumnStore(Mapping):
+    """
+    Mapping of integer IDs to rows, storing the data column by column.
+
+    Parameters
+    ----------
+    rows : dict
+        A dictionary with integer IDs as keys and lists of equal length as
+        values.
+
+    Notes
+    -----
+    The store offers the interface of the dictionary which is used by default
+    to store the data of a :py:class:`~lingpy.basic.parser.QLCParser`. Rows
+    are returned as views (see :py:class:`Row`), which write changes through
+    to the columns. Whole columns can be retrieved and set with
+    :py:meth:`column` and :py:meth:`set_column`.
+    """
+    def __init__(self, rows):
+        self._keys = list(rows)
+        self._pos = {key: pos for pos, key in enumerate(self._keys)}
+        width = len(rows[self._keys[0]]) if self._keys else 0
+        self._columns = [
+            column([row[i] for row in rows.values()]) for i in range(width)]
+
+    def __getitem__(self, key):
+        return Row(self, self._pos[key])
+
+    def __contains__(self, key):
+        return key in self._pos
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def width(self):
+        return len(self._columns)
+
+    def _set(self, pos, i, value):
+        try:
+            self._columns[i][pos] = value
+        except TypeError:
+            # the value does not fit the compact column, so we store the
+            # column as a list
+            self._columns[i] = _ObjectColumn(self._columns[i].tolist())
+            self._columns[i][pos] = value
+
+    def column(self, i):
+        """
+        Return all values of a column, in the order of the IDs.
+        """
+        return self._columns[i].tolist()
+
+    def set_column(self, i, values):
+        """
+        Replace a column or add a new column by passing the index of the next
+        column.
+
+        Parameters
+        ----------
+        i : int
+            The index of the column.
+        values : list
+            The values of the column, in the order of the IDs.
+        """
+        if len(values) != len(self._keys):
+            raise ValueError('Expected {0} values for the column, got {1}.'.format(
+                len(self._keys), len(values)))
+        if i == len(self._columns):
+            self._columns.append(column(values))
+        else:
+            self._columns[i] = column(values)
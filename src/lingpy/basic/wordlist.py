@@ -2,6 +2,8 @@
 This module provides a basic class for the handling of word lists.
 """
 import os
+import json
+import pickle
 import numpy as np
 from collections import defaultdict
 from pathlib import Path
@@ -22,6 +24,13 @@ from lingpy.basic.ops import (
 from lingpy.algorithm import clustering as cluster
 from lingpy import util
 from lingpy import log
+from lingpy import cache
+from lingpy import __version__
+
+# version of the binary snapshot format, which needs to be increased whenever
+# the attributes of the classes change in an incompatible way
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_MAGIC = b'LINGPY-SNAPSHOT'
 
 
 class BounceAsID (object):
@@ -71,6 +80,13 @@ class Wordlist(QLCParserWithRowsAndCols):
         A string defining the path to the configuration file (more information
         in the notes).
 
+    storage : { "rows", "columns" } (default="rows")
+        Store the data as a dictionary of rows ("rows") or column by column
+        ("columns"). Column storage keeps numbers in arrays of the
+        :py:mod:`array` module and strings and tokens as codes into tables of
+        unique values, which requires much less memory for large word lists
+        (more information in the notes).
+
     Notes
     -----
     A word list is created from a dictionary containing the data. 
@@ -92,10 +108,18 @@ class Wordlist(QLCParserWithRowsAndCols):
     transcriptions, both the orthographical source and the IPA transcriptions
     can be easily accessed as two separate two-dimensional lists.
 
+    With column storage, rows are returned as views on the columns (see
+    :py:class:`~lingpy.basic.storage.ColumnStore`). Values can be changed
+    by assigning them (e.g., ``wl[1, 'tokens'] = tokens``), but token lists
+    are created anew on each access, so that modifying them in place does not
+    change the data.
+
     """
-    def __init__(self, filename, row='concept', col='doculect', conf=None):
+    def __init__(self, filename, row='concept', col='doculect', conf=None,
+                 storage='rows'):
         QLCParserWithRowsAndCols.__init__(
-            self, filename, row, col, conf or util.data_path('conf', 'wordlist.rc'))
+            self, filename, row, col, conf or util.data_path('conf', 'wordlist.rc'),
+            storage=storage)
 
         # setup other local temporary storage
         self._etym_dict = {}
@@ -111,6 +135,7 @@ class Wordlist(QLCParserWithRowsAndCols):
             source,
             function,
             override=False,
+            batch=False,
             **keywords):
         """
         Add new entry-types to the word list by modifying given ones.
@@ -130,6 +155,11 @@ class Wordlist(QLCParserWithRowsAndCols):
             A function which is used to convert the source into the target
             value.
 
+        batch : bool (default=False)
+            If set to True, the function is called only once with the whole
+            source column and must return the list of target values (see
+            :py:meth:`~lingpy.basic.parser.QLCParser.add_entries`).
+
         keywords : {dict}
             A dictionary of keywords that are passed as parameters to the
             function.
@@ -142,7 +172,8 @@ class Wordlist(QLCParserWithRowsAndCols):
         and to modify it with help of a function.
 
         """
-        self._add_entries(entry, source, function, override, **keywords)
+        self._add_entries(
+            entry, source, function, override, batch=batch, **keywords)
 
 
     def get_dict(
@@ -240,11 +271,9 @@ class Wordlist(QLCParserWithRowsAndCols):
             return entries
 
         if col:
-            data = defaultdict(list)
-            for i, j in [(self[i][self._rowIdx], i)
-                         for i in self._array[:, self.cols.index(col)] if i != 0]:
-                data[i].append(j)
-            entries = data
+            entries = defaultdict(list, {
+                key: list(value) for key, value in self._col_dict[col].items()
+                if value})
             if entry:
                 entries = {key: [self[i][self._header[entry]] for i in value]
                            for key, value in entries.items()}
@@ -379,7 +408,11 @@ class Wordlist(QLCParserWithRowsAndCols):
                 raise ValueError(
                     "The column {0} you selected is not available!".format(col))
             else:
-                data = self._array[:, self.cols.index(col)]
+                if flat:
+                    data = [i for value in self._col_dict[col].values()
+                            for i in value]
+                else:
+                    data = self._array[:, self.cols.index(col)]
 
                 if not entry:
                     if flat:
@@ -463,9 +496,10 @@ class Wordlist(QLCParserWithRowsAndCols):
         cogIdx = self._header[ref]
 
         # iterate over all data
+        colIdxs = {col: i for i, col in enumerate(self.cols)}
         for key in self:
             cogids = self[key][cogIdx]
-            colIdx = self.cols.index(self[key][self._colIdx])
+            colIdx = colIdxs[self[key][self._colIdx]]
             # check if data is not a list or tuple, if this is the case,
             # make it a fake-list, so we can treat it just as all the other
             # instances of fuzzy cognates (output is the same, though)
@@ -1048,6 +1082,77 @@ class Wordlist(QLCParserWithRowsAndCols):
         if stats == 'mean':
             return sum([a / self.height for a in cov.values()]) / self.width
 
+    def save_snapshot(self, filename):
+        """
+        Store the object along with all derived data in a binary snapshot.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the snapshot file.
+
+        Notes
+        -----
+        Snapshots store the complete state of an object, including the
+        derived columns and indices of :py:class:`~lingpy.compare.lexstat.LexStat`
+        (tokens, sonars, prosodic strings, classes, numbers, weights,
+        frequencies, scorers, and pairs), so that loading a snapshot with
+        :py:meth:`from_snapshot` is much faster than creating the object
+        from a text file. Snapshots are pickle files with a short header
+        which identifies the format, the version of LingPy, and the class of
+        the object. They can only be loaded with the same version of LingPy
+        and should only be loaded from trusted sources.
+
+        See also
+        --------
+        from_snapshot
+        """
+        header = json.dumps({
+            'format': SNAPSHOT_FORMAT,
+            'version': __version__,
+            'class': '{0.__module__}.{0.__name__}'.format(self.__class__)})
+        cache._atomic_dump(
+            self, Path(filename),
+            header=SNAPSHOT_MAGIC + b' ' + header.encode('utf8') + b'\n')
+
+    @classmethod
+    def from_snapshot(cls, filename):
+        """
+        Load an object from a binary snapshot.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the snapshot file, see :py:meth:`save_snapshot`.
+
+        Examples
+        --------
+        Store a LexStat object with all its derived data and load it again::
+
+            >>> from lingpy import *
+            >>> lex = LexStat(test_data('KSL.qlc'))
+            >>> lex.save_snapshot('KSL.snapshot')
+            >>> lex = LexStat.from_snapshot('KSL.snapshot')
+        """
+        with open(filename, 'rb') as fp:
+            line = fp.readline()
+            if not line.startswith(SNAPSHOT_MAGIC + b' '):
+                raise ValueError(
+                    "File {0} is not a LingPy snapshot.".format(filename))
+            header = json.loads(line[len(SNAPSHOT_MAGIC) + 1:].decode('utf8'))
+            if header['format'] != SNAPSHOT_FORMAT or \
+                    header['version'] != __version__:
+                raise ValueError(
+                    "Snapshot {0} was created with LingPy {1} (format {2}) "
+                    "and cannot be loaded with LingPy {3}.".format(
+                        filename, header['version'], header['format'],
+                        __version__))
+            obj = pickle.load(fp)
+        if not isinstance(obj, cls):
+            raise TypeError("Snapshot {0} stores a {1} object, not a {2}.".format(
+                filename, header['class'], cls.__name__))
+        return obj
+
     @classmethod
     def from_cldf(
             cls, 
@@ -28,6 +28,9 @@ class _strings(list):
     def __setitem__(self, index, item):
         list.__setitem__(self, index, self._type(item))
 
+    def __reduce__(self):
+        return _strings, (self._type, list(self))
+
 integer = lambda x: int(x) if x else 0
 strings = partial(_strings, str)
 ints = partial(_strings, int)
@@ -37,6 +40,9 @@ class aligned(_strings):
 
     def __init__(self, iterable):
         _strings.__init__(self, str, iterable)
+
+    def __reduce__(self):
+        return aligned, (list(self),)
     
     @property
     def a(self):
@@ -62,6 +68,9 @@ class lists(_strings):
     def __add__(self, other):
         return lists(str(self)+self.sep+str(other))
 
+    def __reduce__(self):
+        return lists, (list(self), self.sep)
+
     def extend(self, other):
         super(lists, self).extend(lists('')+_strings(str, other))
 
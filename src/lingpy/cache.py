@@ -3,26 +3,191 @@
 Some operations in lingpy may be time consuming, so we provide a mechanism to cache the
 results of these operations.
 """
+import os
 import pickle
 import pathlib
+import hashlib
+import tempfile
+
+from appdirs import user_cache_dir
 
 from lingpy import __version__
+from lingpy import log
+
+# user-level cache directory
+USER_DIR = pathlib.Path(user_cache_dir('lingpy'))
+
+# compiled models are stored per lingpy version
+DIR = USER_DIR.joinpath(__version__)
 
-# Fix for the lambda
-DIR = pathlib.Path().joinpath(pathlib.Path().absolute(), "lingpy/data/cache/2.6.9")
 
 def path(filename, d=DIR):
     return d.joinpath(pathlib.Path(filename).name + '.pkl')
 
 
-def load(filename, d=DIR):
+def fingerprint(sources):
+    """
+    Compute a checksum of the content of a list of source files.
+
+    Notes
+    -----
+    Missing files are included in the checksum as missing, so that adding
+    a source file invalidates cached objects as well.
+    """
+    digest = hashlib.sha256()
+    for source in sources:
+        source = pathlib.Path(source)
+        digest.update(source.name.encode('utf8'))
+        if source.exists():
+            digest.update(source.read_bytes())
+        else:
+            digest.update(b'\x00missing')
+    return digest.hexdigest()
+
+
+def load(filename, d=DIR, sources=None):
+    """
+    Load a cached object.
+
+    Parameters
+    ----------
+    filename : str
+        The name under which the object was stored.
+    sources : list (default=None)
+        The source files from which the object was derived. If passed, a
+        :py:class:`ValueError` is raised when the files were changed since
+        the object was stored.
+    """
     with path(filename, d=d).open('rb') as fp:
-        return pickle.load(fp)
+        checksum, data = pickle.load(fp)
+    if sources is not None and checksum != fingerprint(sources):
+        raise ValueError("Cached object {0} is out of date.".format(filename))
+    return data
+
+
+def dump(data, filename, d=DIR, sources=None):
+    """
+    Store an object in the cache.
+
+    Parameters
+    ----------
+    data : object
+        The object to be stored.
+    filename : str
+        The name under which the object is stored.
+    sources : list (default=None)
+        The source files from which the object was derived, see :py:func:`load`.
+
+    Notes
+    -----
+    Failure to write to the cache is logged, but not raised, since the cache
+    is only used to speed up loading.
+    """
+    try:
+        _atomic_dump(
+            (fingerprint(sources) if sources is not None else None, data),
+            path(filename, d=d))
+    except OSError as e:  # pragma: no cover
+        log.warning("Could not write {0} to the cache: {1}".format(filename, e))
+
+
+def _atomic_dump(data, path, header=b''):
+    """Pickle data to path, making sure readers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(header)
+            pickle.dump(data, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, str(path))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class LRUCache(object):
+    """
+    Content-addressed on-disk cache with a size limit.
+
+    Parameters
+    ----------
+    d : { str, Path } (default=None)
+        The directory in which the cached objects are stored. Defaults to the
+        directory "scorers" in the user's cache directory.
+    max_size : int (default=2**30)
+        The maximal size of the cache in bytes.
+    max_entries : int (default=100)
+        The maximal number of objects in the cache.
+
+    Notes
+    -----
+    Objects are stored as pickle files named by their key. When the cache
+    grows beyond its limits, the least recently used objects are evicted.
+    """
+    def __init__(self, d=None, max_size=2 ** 30, max_entries=100):
+        self.dir = pathlib.Path(d) if d else USER_DIR.joinpath('scorers')
+        self.max_size = max_size
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(*components):
+        """Compute a key from the string representations of components."""
+        digest = hashlib.sha256()
+        for component in components:
+            digest.update(str(component).encode('utf8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.dir.joinpath(key + '.pkl')
+
+    def _entries(self):
+        if not self.dir.exists():
+            return []
+        return sorted(
+            (p.stat().st_mtime_ns, p.stat().st_size, p)
+            for p in self.dir.glob('*.pkl'))
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def __len__(self):
+        return len(self._entries())
+
+    @property
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def get(self, key, default=None):
+        """Return the object stored under key, marking it as recently used."""
+        path = self._path(key)
+        try:
+            with path.open('rb') as fp:
+                data = pickle.load(fp)
+        except FileNotFoundError:
+            return default
+        except Exception:  # pragma: no cover
+            log.warning('Could not read cached object {0}.'.format(path))
+            return default
+        os.utime(str(path))
+        return data
+
+    def set(self, key, data):
+        """Store an object under key and evict old objects if needed."""
+        _atomic_dump(data, self._path(key))
+        self.evict()
 
+    def evict(self):
+        """Remove least recently used objects until the limits are met."""
+        entries = self._entries()
+        size = sum(s for _, s, _ in entries)
+        while entries and (
+                len(entries) > self.max_entries or size > self.max_size):
+            _, s, path = entries.pop(0)
+            path.unlink()
+            size -= s
 
-def dump(data, filename, d=DIR):
-    return
-#    if not d.exists():
-#        d.mkdir(parents=True)  # pragma: no cover
-#    with path(filename, d=d).open('wb') as fp:
-#        pickle.dump(data, fp)
+    def clear(self):
+        """Remove all objects from the cache."""
+        for _, _, path in self._entries():
+            path.unlink()
@@ -1,6 +1,7 @@
 import random
 from itertools import product
 from collections import Counter, defaultdict
+from collections.abc import Mapping
 from copy import copy
 
 import numpy as np
@@ -23,6 +24,7 @@ from lingpy.algorithm import misc
 from lingpy import util
 from lingpy.util import charstring
 from lingpy import log
+from lingpy import cache
 
 
 def _check_tokens(key_and_tokens, cldf=False, diacritics=None, stress=None):
@@ -66,6 +68,270 @@ def _lexstat(x, y):
     return x if x != '-' else charstring(y)
 
 
+def _get_corrdist_for_pair(task):
+    """
+    Compute the correspondence distribution for one language pair.
+
+    Notes
+    -----
+    This function is used by :py:meth:`LexStat._get_corrdist` and is defined
+    on module level so that it can be sent to worker processes.
+    """
+    (i, j, tA, tB, threshold, numbers, weights, prostrings, modes, factor,
+     restricted_chars, scorer) = task
+    log.info("Calculating alignments for pair {0} / {1}.".format(tA, tB))
+
+    corrdist = defaultdict(float)
+    included = 0
+    for mode, gop, scale in modes:
+        corrs, included = calign.corrdist(
+            threshold,
+            numbers,
+            weights,
+            prostrings,
+            gop,
+            scale,
+            factor,
+            scorer,
+            mode,
+            restricted_chars)
+
+        # change representation of gaps
+        for (a, b), d in corrs.items():
+            # XXX check for bias XXX
+            if a == '-':
+                a = charstring(i + 1)
+            elif b == '-':
+                b = charstring(j + 1)
+            corrdist[a, b] += d / float(len(modes))
+    return (tA, tB), corrdist, included
+
+
+def _get_randist_for_pair(task):
+    """
+    Compute the random correspondence distribution for one language pair.
+
+    Notes
+    -----
+    This function is used by :py:meth:`LexStat._get_randist` and is defined
+    on module level so that it can be sent to worker processes.
+    """
+    (i, j, tA, tB, seqs, weights, prostrings, modes, factor,
+     restricted_chars, scorer, attested, markov, gap) = task
+    log.info(
+        "Calculating random alignments for pair {0}/{1}.".format(tA, tB))
+
+    corrdist = defaultdict(float)
+    for mode, gop, scale in modes:
+        corrs, included = calign.corrdist(
+            10.0,
+            seqs,
+            weights,
+            prostrings,
+            gop,
+            scale,
+            factor,
+            scorer,
+            mode,
+            restricted_chars)
+
+        # change representation of gaps
+        for a, b in list(corrs.keys()):
+            # get the correspondence count
+            d = corrs[a, b] * attested / included
+            # XXX check XXX * len(self.pairs[tA,tB]) / runs
+
+            # check for gaps
+            if markov:
+                if a == gap:
+                    a = 'X.-'
+                elif b == gap:
+                    b = 'X.-'
+                a = str(i + 1) + '.' + a
+                b = str(j + 1) + '.' + b
+            elif a == '-':
+                a = charstring(i + 1)
+            elif b == '-':
+                b = charstring(j + 1)
+            corrdist[a, b] += d / len(modes)
+    return (tA, tB), corrdist
+
+
+def _rng(seed, *keys):
+    """Return a random number generator for the stream identified by keys."""
+    return random.Random(':'.join(str(key) for key in (seed,) + keys))
+
+
+def _word_distances(task):
+    """
+    Calculate the distances between pairs of words.
+
+    Notes
+    -----
+    The task consists of the method, the data of the words (see
+    :py:meth:`LexStat._word_data`), the scorer, the pairs of words as tuples
+    of their positions (or None for all pairs), and the parameters of the
+    method. Distances which cannot be computed are returned as None.
+    """
+    method, words, scorer, pairs, kw = task
+    if pairs is None:
+        pairs = list(util.combinations2(range(len(words[0]))))
+
+    if method == 'sca':
+        seqs, weights, pros, sims = words
+        return calign.pair_distances(
+            seqs, weights, pros, pairs, kw['gop'], kw['scale'], kw['factor'],
+            scorer, kw['mode'], kw['restricted_chars'], None, sims)
+    if method == 'lexstat':
+        numbers, gops, pros, langids, sims = words
+        return calign.pair_distances(
+            numbers, gops, pros, pairs, 1, kw['scale'], kw['factor'], scorer,
+            kw['mode'], kw['restricted_chars'], langids, sims)
+
+    seqs = words[0]
+    if method == 'edit-dist':
+        def function(x, y):
+            return edit_dist(x, y, True, kw['restriction'])
+    elif method == 'turchin':
+        function = turchin
+    else:
+        def function(x, y):
+            return talign.align_pair(
+                x, y, kw['gop'], kw['scale'], kw['external_scorer'],
+                'overlap', True)[2]
+
+    distances = []
+    for i, j in pairs:
+        try:
+            distances.append(function(seqs[i], seqs[j]))
+        except ZeroDivisionError:
+            distances.append(None)
+    return distances
+
+
+class _Pairs(Mapping):
+    """
+    Word pairs of all language pairs, created whenever they are accessed.
+
+    Notes
+    -----
+    For each pair of different languages, the word pairs are all pairs of
+    words with the same meaning, leaving out pairs whose segments, joined to
+    strings, are identical to a pair which was already included. For each language paired with
+    itself, the word pairs are the words which are not marked as duplicates.
+    Since the pairs are not stored, the memory needed is bounded by the size
+    of the pairs of a single language pair.
+    """
+    def __init__(self, wordlist):
+        self._wordlist = wordlist
+        self._keys = list(util.multicombinations2(wordlist.cols))
+        self._index = set(self._keys)
+
+    def __getitem__(self, key):
+        if key not in self._index:
+            raise KeyError(key)
+        return list(self.iter_pairs(*key))
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def iter_pairs(self, taxonA, taxonB):
+        """
+        Iterate over the word pairs of a language pair.
+        """
+        wl = self._wordlist
+        dictA = wl.get_dict(col=taxonA)
+        if taxonA == taxonB:
+            for c in sorted(dictA):
+                for idx in dictA[c]:
+                    if wl[idx, wl._duplicates] != 1:
+                        yield idx, idx
+        else:
+            dictB = wl.get_dict(col=taxonB)
+            seen = set()
+            for c in sorted(set(dictA).intersection(dictB)):
+                for idxA, idxB in product(dictA[c], dictB[c]):
+                    segments = (
+                        ''.join(wl[idxA, wl._segments]),
+                        ''.join(wl[idxB, wl._segments]))
+                    if segments not in seen:
+                        seen.add(segments)
+                        yield idxA, idxB
+
+
+class SelfScores(object):
+    """
+    Cache of the self-alignment scores of words.
+
+    Notes
+    -----
+    The self-alignment score of a word is needed to turn the similarity of
+    two words into a distance. The scores are stored per word and per set of
+    parameters, that is, the name of the scorer, the factor for matches in
+    the same prosodic context, and the slice of the word which is aligned.
+    Each score is stored along with its sequence and computed anew when the
+    sequence changed (e.g., when the column of numbers was rebuilt). When a
+    scorer is replaced by a new object (e.g., when a new scorer is computed
+    with :py:meth:`LexStat.get_scorer`), all scores computed with the old
+    scorer are discarded.
+
+    Attributes
+    ----------
+    hits : int
+        The number of scores which were taken from the cache.
+    misses : int
+        The number of scores which were computed.
+    """
+    def __init__(self):
+        self.scorers = {}
+        self.scores = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.scores)
+
+    def clear(self):
+        """
+        Remove all scores and reset the counters.
+        """
+        self.__init__()
+
+    def get(self, name, scorer, factor, key, seq):
+        """
+        Return the self-alignment score of a sequence.
+
+        Parameters
+        ----------
+        name : str
+            The name of the scorer.
+        scorer : { dict, :py:class:`~lingpy.algorithm.cython.misc.ScoreDict` }
+            The scorer.
+        factor : float
+            The factor by which matches in the same prosodic context are
+            increased.
+        key : tuple
+            The key which identifies the sequence, usually the ID of the word
+            and the slice of the word.
+        seq : list
+            The sequence.
+        """
+        if self.scorers.get(name) is not scorer:
+            self.scores = {k: v for k, v in self.scores.items() if k[0] != name}
+            self.scorers[name] = scorer
+        stored, score = self.scores.get((name, factor, key), (None, None))
+        if stored == seq:
+            self.hits += 1
+        else:
+            score = sum([(1.0 + factor) * scorer[char, char] for char in seq])
+            self.scores[name, factor, key] = (list(seq), score)
+            self.misses += 1
+        return score
+
+
 class LexStat(Wordlist):
     """
     Basic class for automatic cognate detection.
@@ -184,13 +450,16 @@ class LexStat(Wordlist):
         in a reconstruction system, and the target is a proposed phonetic
         interpretation. This practice is also accepted by the `EDICTOR
         <http://edictor.digling.org>`_ tool.
+    storage : { "rows", "columns" } (default="rows")
+        Store the data as a dictionary of rows or column by column, see
+        :py:class:`~lingpy.basic.wordlist.Wordlist`.
 
     Attributes
     ----------
     pairs : dict
-        A dictionary with tuples of language names as key and indices as value,
+        A mapping with tuples of language names as key and indices as value,
         pointing to unique combinations of words with the same meaning in all
-        language pairs.
+        language pairs. The pairs are created whenever they are accessed.
     model : :py:class:`~lingpy.data.model.Model`
         The sound class model instance which serves to convert the phonetic
         data into sound classes.
@@ -231,6 +500,10 @@ class LexStat(Wordlist):
           attribute of each LexStat class. As the "rscorer", the "bscorer" can
           also be accessed directly as an attribute of the LexStat class
           (:py:class:`~lingpy.compare.lexstat.lexstat.bscorer`).
+    self_scores : :py:class:`~lingpy.compare.lexstat.SelfScores`
+        The cache of the self-alignment scores of the words, which is shared
+        by all methods which compute distances between words, and counts its
+        hits and misses.
 
     Notes
     -----
@@ -264,7 +537,8 @@ class LexStat(Wordlist):
             "row": "concept",
             "col": "doculect",
             "conf": None,
-            'cldf': True
+            'cldf': True,
+            'storage': 'rows'
         }
         kw.update(keywords)
 
@@ -292,7 +566,7 @@ class LexStat(Wordlist):
         # initialize the wordlist
         Wordlist.__init__(
                 self, filename, row=kw['row'], col=kw['col'],
-                conf=kw['conf'])
+                conf=kw['conf'], storage=kw['storage'])
         assert self._segments in self.header or \
             self._transcription in self.header
 
@@ -331,46 +605,10 @@ class LexStat(Wordlist):
             else:
                 log.info("No obvious errors found in the data.")
 
-        # sonority profiles
-        if self._sonars not in self.header:
-            self.add_entries(
-                self._sonars,
-                self._segments,
-                lambda x: [int(i) for i in tokens2class(
-                    x, rcParams['art'], stress=rcParams['stress'],
-                    cldf=self._cldf)])
-        if self._prostrings not in self.header:
-            self.add_entries(
-                    self._prostrings, self._sonars,
-                    lambda x: kw['get_prostring'](x))
-        # get sound class strings
-        if self._classes not in self.header:
-            self.add_entries(
-                self._classes, self._segments,
-                lambda x: ''.join(tokens2class(x, kw["model"], cldf=self._cldf,
-                    stress=rcParams['stress'])))
-        # create IDs for the languages
-        if self._langid not in self.header:
-            transform = dict(zip(
-                self.cols, [str(i + 1) for i in range(self.width)]))
-            self.add_entries(
-                    self._langid, self._col_name, lambda x: transform[x])
-        # get the numbers for all strings
-        if self._numbers not in self.header:
-            # change the discriminative potential of the sound-class string
-            # tuples, note that this is still wip, we have to tweak around with
-            # this in order to find an optimum for the calculation
-            self._transform = kw['transform']
-            self.add_entries(
-                self._numbers,
-                self._langid + ',' + self._classes + ',' + self._prostrings,
-                lambda x, y: [charstring(x[y[0]], a, self._transform[b])
-                              for a, b in zip(x[y[1]], x[y[2]])])
-        # check for weights
-        if self._weights not in self.header:
-            self.add_entries(
-                    self._weights, self._prostrings,
-                    lambda x: prosodic_weights(x))
+        # derive sonority profiles, prosodic strings, sound classes, language
+        # IDs, numbers, and weights in one pass over the data
+        self._preprocess(kw['model'], kw['get_prostring'], kw['transform'])
+
         # check for duplicates
         # first, check for item 'words' in data, if not given, create it
         if self._transcription not in self.header:
@@ -436,37 +674,74 @@ class LexStat(Wordlist):
             if 'cscorer' in self._meta['scorer']:
                 self.cscorer = self._meta['scorer']['cscorer']
 
-        # make the language pairs
+        # make the language pairs, which are created when they are accessed
         if not hasattr(self, "pairs"):
-            self.pairs = {}
-            self._same_vals = defaultdict(list)
-            for (i, taxonA), (j, taxonB) in util.multicombinations2(
-                    enumerate(self.cols)):
-                self.pairs[taxonA, taxonB] = []
-                dictA = self.get_dict(col=taxonA)
-                dictB = self.get_dict(col=taxonB)
-                if i < j:
-                    for c in sorted(set(dictA).intersection(dictB)):
-                        for idxA, idxB in product(dictA[c], dictB[c]):
-                            this_pair = '{0}-{1}/{2}-{3}'.format(
-                                    ''.join(self[idxA, self._segments]),
-                                    taxonA,
-                                    ''.join(self[idxB, self._segments]),
-                                    taxonB
-                                    )
-                            if not self._same_vals[this_pair]:
-                                self.pairs[taxonA, taxonB] += [(idxA, idxB)]
-                            self._same_vals[this_pair] += [(idxA, idxB)]
-                elif i == j:
-                    for c in sorted(dictA):
-                        for idx in dictA[c]:
-                            dAB = self[idx, self._duplicates]
-                            if dAB != 1:
-                                self.pairs[taxonA, taxonA] += [(idx, idx)]
+            self.pairs = _Pairs(self)
 
     def __repr__(self):
         return "<lexstat-model {0}>".format(self.filename)
 
+    @property
+    def self_scores(self):
+        """
+        The cache of the self-alignment scores of the words (see
+        :py:class:`~lingpy.compare.lexstat.SelfScores`).
+        """
+        if '_self_scores' not in self.__dict__:
+            self._self_scores = SelfScores()
+        return self._self_scores
+
+    def _self_score(self, name, idx, seq, factor, slc=None):
+        return self.self_scores.get(
+            name, getattr(self, name), factor, (idx, slc), seq)
+
+    def _preprocess(self, model, get_prostring, transform):
+        """
+        Add all missing columns derived from the segments in one pass.
+        """
+        langids = dict(zip(self.cols, [str(i + 1) for i in range(self.width)]))
+        derive = [
+            (self._sonars, lambda v: [int(i) for i in tokens2class(
+                v[self._segments], rcParams['art'], stress=rcParams['stress'],
+                cldf=self._cldf)]),
+            (self._prostrings, lambda v: get_prostring(v[self._sonars])),
+            (self._classes, lambda v: ''.join(tokens2class(
+                v[self._segments], model, cldf=self._cldf,
+                stress=rcParams['stress']))),
+            (self._langid, lambda v: langids[v[self._col_name]]),
+            # change the discriminative potential of the sound-class string
+            # tuples, note that this is still wip, we have to tweak around
+            # with this in order to find an optimum for the calculation
+            (self._numbers, lambda v: [
+                charstring(v[self._langid], a, transform[b])
+                for a, b in zip(v[self._classes], v[self._prostrings])]),
+            (self._weights, lambda v: prosodic_weights(v[self._prostrings])),
+        ]
+        sources = {
+            name: self._header[name] for name in
+            [self._segments, self._col_name] + [n for n, _ in derive]
+            if name in self.header}
+        derive = [(name, f) for name, f in derive if name not in sources]
+        if not derive:
+            return
+        if self._numbers not in sources:
+            self._transform = transform
+
+        columns = [[] for _ in derive]
+        for key in self:
+            row = self[key]
+            values = {name: row[idx] for name, idx in sources.items()}
+            try:
+                for (name, function), column in zip(derive, columns):
+                    values[name] = function(values)
+                    column.append(values[name])
+            except Exception:
+                raise ValueError('Could not convert item ID: {0}.'.format(key))
+
+        for (name, _), column in zip(derive, columns):
+            self.add_entries(
+                name, dict(zip(self, column)), lambda x: x, batch=True)
+
     def __getitem__(self, idx):
         """
         Method allows quick access to the data by passing the integer key.
@@ -510,32 +785,20 @@ class LexStat(Wordlist):
         """Helper method defines how words are aligned to retrieve distance \
                 scores"""
         def lexstat_align(x, y):
-            return calign.align_pair(
-                    self[x, self._numbers], 
-                    self[y, self._numbers],
-                    [self.cscorer[charstring(self[y, 'langid']), n] for n in
-                        self[x, self._numbers]],
-                    [self.cscorer[charstring(self[x, 'langid']), n] for n in
-                        self[y, self._numbers]], 
-                    self[x, self._prostrings],
-                    self[y, self._prostrings], 
-                    1,
-                    kw['scale'], 
-                    kw['factor'], 
-                    self.cscorer,
-                    kw['mode'], 
-                    kw['restricted_chars'], 1
-                    )[2]
+            return word_align(x, y, 'lexstat')
 
         def sca_align(x, y):
-            return calign.align_pair(
-                [n.split('.', 1)[1] for n in self[x, self._numbers]],
-                [n.split('.', 1)[1] for n in self[y, self._numbers]],
-                self[x, self._weights], self[y, self._weights],
-                self[x, self._prostrings], self[y, self._prostrings],
-                kw['gop'], kw['scale'], kw['factor'], self.rscorer,
-                kw['mode'], kw['restricted_chars'],
-                1)[2]
+            return word_align(x, y, 'sca')
+
+        def word_align(x, y, method):
+            d = _word_distances((
+                method, self._word_data([x, y], method, **kw),
+                self._word_scorer(method), [(0, 1)], kw))[0]
+            if d is None:
+                raise ZeroDivisionError(
+                    "The self-alignment scores of {0} and {1} are zero.".format(
+                        x, y))
+            return d
 
         def edit_align(x, y):
             entry = kw.get('entry', self._segments)
@@ -562,6 +825,107 @@ class LexStat(Wordlist):
                 lexstat_align, sca_align, edit_align, turchin_align,
                 custom_align)))[method]
 
+    def _word_data(self, indices, method, slices=None, **kw):
+        """
+        Return the data of the words needed to calculate their distances.
+
+        Notes
+        -----
+        The data is passed to :py:func:`_word_distances`, either in the
+        current or in a worker process.
+        """
+        slices = slices or [None for idx in indices]
+
+        def column(entry):
+            return [
+                self[idx, entry][slc[0]:slc[1]] if slc else self[idx, entry]
+                for idx, slc in zip(indices, slices)]
+
+        if method == 'sca':
+            seqs = [[n.split('.', 1)[1] for n in seq] for seq in column(
+                self._numbers)]
+            return (
+                seqs,
+                column(self._weights),
+                column(self._prostrings),
+                [self._self_score('rscorer', idx, seq, kw['factor'], slc)
+                 for idx, seq, slc in zip(indices, seqs, slices)])
+        if method == 'lexstat':
+            numbers = column(self._numbers)
+            langids = [self[idx, self._langid] for idx in indices]
+            return (
+                numbers,
+                [{langid: [self.cscorer[charstring(langid), n] for n in seq]
+                  for langid in set(langids)} for seq in numbers],
+                column(self._prostrings),
+                langids,
+                [self._self_score('cscorer', idx, seq, kw['factor'], slc)
+                 for idx, seq, slc in zip(indices, numbers, slices)])
+        if method == 'edit-dist':
+            return (column(kw.get('entry', self._segments)), )
+        if method == 'turchin':
+            return (column(self._segments), )
+        return (column('user_tokens'), )
+
+    def _word_scorer(self, method):
+        if method == 'lexstat':
+            return self.cscorer
+        if method == 'sca':
+            return self.rscorer
+
+    def _check_distances(self, indices, pairs, distances):
+        """
+        Replace distances which could not be computed.
+        """
+        for k, d in enumerate(distances):
+            if d is None:
+                idxA, idxB = indices[pairs[k][0]], indices[pairs[k][1]]
+                log.warning(
+                    "Encountered Zero-Division for the comparison of "
+                    "{0} ({2}) and {1} ({3})".format(
+                        ''.join(self[idxA, self._segments]),
+                        ''.join(self[idxB, self._segments]),
+                        idxA, idxB
+                        ))
+                distances[k] = 100
+        return np.array(distances, dtype=float)
+
+    def _pair_distances(
+            self, indices, pairs, method, slices=None, **kw):
+        """
+        Calculate the distances between pairs of words.
+
+        Parameters
+        ----------
+        indices : list
+            The IDs of the words.
+        pairs : list
+            The pairs of words, passed as tuples of their positions in the
+            list of indices.
+        method : {'sca','lexstat','edit-dist','turchin','custom'}
+            The method to calculate the distances (see
+            :py:meth:`~lingpy.compare.lexstat.LexStat.cluster`).
+        slices : list (default=None)
+            Slices of the words which are compared instead of the whole words.
+
+        Returns
+        -------
+        distances : :py:class:`numpy.ndarray`
+            The distance for each pair.
+
+        Notes
+        -----
+        For the methods "sca" and "lexstat", all pairs are aligned in one call
+        of :py:func:`~lingpy.algorithm.cython.calign.pair_distances`, which
+        computes the self-similarity of each word only once. All other
+        methods compute the distance pair by pair.
+        """
+        pairs = list(pairs)
+        distances = _word_distances((
+            method, self._word_data(indices, method, slices, **kw),
+            self._word_scorer(method), pairs, kw))
+        return self._check_distances(indices, pairs, distances)
+
     def _align_method(self, method, **kw):
         """Helper method for alignment operations"""
         def base_align(x, y):
@@ -591,6 +955,7 @@ class LexStat(Wordlist):
                     max_steps=kw['max_steps'], inflation=kw['inflation'],
                     expansion=kw['expansion'],
                     add_self_loops=kw['add_self_loops'], logs=kw['mcl_logs'],
+                    prune=kw['mcl_prune'], sparse=kw['mcl_sparse'],
                     revert=True)
 
         def infomap(x, y):
@@ -651,7 +1016,9 @@ class LexStat(Wordlist):
             ref='scaid',
             restricted_chars=rcParams['restricted_chars'],
             threshold=rcParams['lexstat_scoring_threshold'],
-            subset=False)
+            subset=False,
+            processes=1,
+            executor=None)
         kw.update(keywords)
 
         self._included = {}
@@ -666,54 +1033,43 @@ class LexStat(Wordlist):
                     cluster_method=kw['cluster_method'],
                     ref=kw['ref'])
 
+        def tasks():
+            for (i, tA), (j, tB) in util.multicombinations2(
+                    enumerate(self.cols)):
+                pairs = self.pairs[tA, tB]
+                if kw['subset']:
+                    pairs = [
+                            pair for pair in pairs if pair in
+                            self.subsets[tA, tB]]
+
+                # threshold and preprocessing, make sure threshold is
+                # different from pre-processing threshold when
+                # preprocessing is set to false
+                if kw['preprocessing']:
+                    pairs = [pair for pair in pairs
+                             if self[pair, kw['ref']][0] == self[
+                                 pair, kw['ref']][1]]
+                    threshold = 10.0
+                else:
+                    threshold = kw['threshold']
+
+                yield (
+                    i, j, tA, tB, threshold,
+                    [self[pair, self._numbers] for pair in pairs],
+                    [self[pair, self._weights] for pair in pairs],
+                    [self[pair, self._prostrings] for pair in pairs],
+                    kw['modes'], kw['factor'], kw['restricted_chars'],
+                    self.bscorer)
+
         with util.pb(
                 desc='CORRESPONDENCE CALCULATION',
                 total=self.width ** 2 / 2) as pb:
-            for (i, tA), (j, tB) in util.multicombinations2(
-                    enumerate(self.cols)):
+            for (tA, tB), corrs, included in util.parallel_map(
+                    _get_corrdist_for_pair, tasks(),
+                    processes=kw['processes'], executor=kw['executor']):
                 pb.update(1)
-                log.info("Calculating alignments for pair {0} / {1}.".format(
-                    tA, tB))
-
-                corrdist[tA, tB] = defaultdict(float)
-                for mode, gop, scale in kw['modes']:
-                    pairs = self.pairs[tA, tB]
-                    if kw['subset']:
-                        pairs = [
-                                pair for pair in pairs if pair in
-                                self.subsets[tA, tB]]
-
-                    # threshold and preprocessing, make sure threshold is
-                    # different from pre-processing threshold when
-                    # preprocessing is set to false
-                    if kw['preprocessing']:
-                        pairs = [pair for pair in pairs
-                                 if self[pair, kw['ref']][0] == self[
-                                     pair, kw['ref']][1]]
-                        threshold = 10.0
-                    else:
-                        threshold = kw['threshold']
-
-                    corrs, self._included[tA, tB] = calign.corrdist(
-                        threshold,
-                        [self[pair, self._numbers] for pair in pairs],
-                        [self[pair, self._weights] for pair in pairs],
-                        [self[pair, self._prostrings] for pair in pairs],
-                        gop,
-                        scale,
-                        kw['factor'],
-                        self.bscorer,
-                        mode,
-                        kw['restricted_chars'])
-
-                    # change representation of gaps
-                    for (a, b), d in corrs.items():
-                        # XXX check for bias XXX
-                        if a == '-':
-                            a = charstring(i + 1)
-                        elif b == '-':
-                            b = charstring(j + 1)
-                        corrdist[tA, tB][a, b] += d / float(len(kw['modes']))
+                corrdist[tA, tB] = corrs
+                self._included[tA, tB] = included
 
         return corrdist
 
@@ -728,13 +1084,20 @@ class LexStat(Wordlist):
             runs=rcParams['lexstat_runs'],
             rands=rcParams['lexstat_rands'],
             limit=rcParams['lexstat_limit'],
-            method=rcParams['lexstat_scoring_method'])
+            method=rcParams['lexstat_scoring_method'],
+            seed=None,
+            processes=1,
+            executor=None)
         kw.update(keywords)
 
         # determine the mode
         method = 'markov' if kw['method'] in ['markov', 'markov-chain', 'mc'] \
             else 'shuffle'
 
+        # all random numbers are drawn from independent streams derived from
+        # the seed, so results do not depend on the number of workers
+        seed = random.getrandbits(64) if kw['seed'] is None else kw['seed']
+
         corrdist = {}
         tasks = (self.width ** 2) / 2
 
@@ -742,9 +1105,8 @@ class LexStat(Wordlist):
             seqs, pros, weights = {}, {}, {}
 
             # get a random distribution for all pairs
-            sample = random.sample(
-                [(i, j) for i in range(kw['rands']) for j in
-                    range(kw['rands'])], kw['runs'])
+            sample = [divmod(x, kw['rands']) for x in _rng(
+                seed, 'sample').sample(range(kw['rands'] ** 2), kw['runs'])]
 
             with util.pb(
                     desc='SEQUENCE GENERATION',
@@ -752,10 +1114,11 @@ class LexStat(Wordlist):
                 for i, taxon in enumerate(self.cols):
                     progress.update(1)
                     log.info("Analyzing taxon {0}.".format(taxon))
+                    rng = _rng(seed, taxon)
                     tokens = self.get_list(col=taxon, entry="tokens", flat=True)
                     prostrings = self.get_list(
                             col=taxon, entry=self._prostrings, flat=True)
-                    m = MCPhon(tokens, True, prostrings)
+                    m = MCPhon(tokens, True, prostrings, rng=rng)
                     words = []
                     j, k = 0, 0
                     while j < kw['rands']:
@@ -773,7 +1136,7 @@ class LexStat(Wordlist):
                                 " the random distribution. "
                                 "Will expand automatically")
                         while len(words) < kw['rands']:
-                            words += [words[random.randint(0, len(words)-1)]]
+                            words += [words[rng.randint(0, len(words)-1)]]
 
                     seqs[taxon], pros[taxon], weights[taxon] = [], [], []
                     for w in words:
@@ -787,108 +1150,52 @@ class LexStat(Wordlist):
                                  [self._transform[pr] for pr in pros[taxon][-1]]
                                  )])
 
-            with util.pb(
-                    desc='RANDOM CORRESPONDENCE CALCULATION',
-                    total=tasks) as progress:
+            def get_tasks():
                 for (i, tA), (j, tB) in util.multicombinations2(
                         enumerate(self.cols)):
-                    progress.update(1)
-                    log.info(
-                        "Calculating random alignments"
-                        " for pair {0}/{1}.".format(tA, tB)
-                    )
-                    corrdist[tA, tB] = defaultdict(float)
-                    for mode, gop, scale in kw['modes']:
-                        corrs, included = calign.corrdist(
-                            10.0,
-                            [(seqs[tA][x], seqs[tB][y]) for x, y in sample],
-                            [(weights[tA][x], weights[tB][y]) for x, y in
-                                sample],
-                            [(pros[tA][x], pros[tB][y]) for x, y in sample],
-                            gop,
-                            scale,
-                            kw['factor'],
-                            self.rscorer,
-                            mode,
-                            kw['restricted_chars'])
-
-                        # change representation of gaps
-                        for a, b in list(corrs.keys()):
-                            # get the correspondence count
-                            d = corrs[a, b] * self._included[tA, tB] / included
-                            # XXX check XXX * len(self.pairs[tA,tB]) / runs
-
-                            # check for gaps
-                            if a == rcParams['gap_symbol']:
-                                a = 'X.-'
-                            elif b == rcParams['gap_symbol']:
-                                b = 'X.-'
-
-                            a = str(i + 1) + '.' + a
-                            b = str(j + 1) + '.' + b
-                            corrdist[tA, tB][a, b] += d / len(kw['modes'])
+                    yield (
+                        i, j, tA, tB,
+                        [(seqs[tA][x], seqs[tB][y]) for x, y in sample],
+                        [(weights[tA][x], weights[tB][y]) for x, y in sample],
+                        [(pros[tA][x], pros[tB][y]) for x, y in sample],
+                        kw['modes'], kw['factor'], kw['restricted_chars'],
+                        self.rscorer, self._included[tA, tB], True,
+                        rcParams['gap_symbol'])
         # use shuffle approach otherwise
         else:
-            tasks = self.width ** 2 / 2
-            with util.pb(
-                    desc='RANDOM CORRESPONDENCE CALCULATION',
-                    total=tasks) as progress:
+            def get_tasks():
                 for (i, tA), (j, tB) in util.multicombinations2(
                         enumerate(self.cols)):
-                    progress.update(1)
-                    log.info(
-                        "Calculating random alignments"
-                        "for pair {0}/{1}.".format(tA, tB)
-                    )
-                    corrdist[tA, tB] = defaultdict(float)
-
                     # get the number pairs etc.
-                    numbers = [
-                            self[pair, self._numbers] for pair in
-                            self.pairs[tA, tB]]
-                    gops = [
-                            self[pair, self._weights] for pair in
-                            self.pairs[tA, tB]]
+                    pairs = self.pairs[tA, tB]
+                    numbers = [self[pair, self._numbers] for pair in pairs]
+                    gops = [self[pair, self._weights] for pair in pairs]
                     prostrings = [
-                            self[pair, self._prostrings] for pair in
-                            self.pairs[tA, tB]]
-                    sample = [
-                            (x, y)
-                            for x in range(len(numbers)) for y in
-                            range(len(numbers))]
-                    if len(sample) > kw['runs']:
-                        sample = random.sample(sample, kw['runs'])
-
-                    for mode, gop, scale in kw['modes']:
-                        corrs, included = calign.corrdist(
-                            10.0,
-                            [(
-                                numbers[s[0]][0],
-                                numbers[s[1]][1]) for s in sample],
-                            [(gops[s[0]][0], gops[s[1]][1]) for s in sample],
-                            [(
-                                prostrings[s[0]][0],
-                                prostrings[s[1]][1]) for s in sample],
-                            gop,
-                            scale,
-                            kw['factor'],
-                            self.bscorer,
-                            mode,
-                            kw['restricted_chars'])
-
-                        # change representation of gaps
-                        for a, b in list(corrs.keys()):
-                            # get the correspondence count
-                            d = corrs[a, b] * self._included[tA, tB] / included
-                            # XXX check XXX* len(self.pairs[tA,tB]) / runs
-
-                            # check for gaps
-                            if a == '-':
-                                a = charstring(i + 1)
-                            elif b == '-':
-                                b = charstring(j + 1)
-
-                            corrdist[tA, tB][a, b] += d / len(kw['modes'])
+                            self[pair, self._prostrings] for pair in pairs]
+                    n = len(numbers)
+                    if n ** 2 > kw['runs']:
+                        sample = [divmod(x, n) for x in _rng(
+                            seed, tA, tB).sample(range(n ** 2), kw['runs'])]
+                    else:
+                        sample = [(x, y) for x in range(n) for y in range(n)]
+                    yield (
+                        i, j, tA, tB,
+                        [(numbers[x][0], numbers[y][1]) for x, y in sample],
+                        [(gops[x][0], gops[y][1]) for x, y in sample],
+                        [(prostrings[x][0], prostrings[y][1])
+                            for x, y in sample],
+                        kw['modes'], kw['factor'], kw['restricted_chars'],
+                        self.bscorer, self._included[tA, tB], False,
+                        rcParams['gap_symbol'])
+
+        with util.pb(
+                desc='RANDOM CORRESPONDENCE CALCULATION',
+                total=tasks) as progress:
+            for (tA, tB), corrs in util.parallel_map(
+                    _get_randist_for_pair, get_tasks(),
+                    processes=kw['processes'], executor=kw['executor']):
+                progress.update(1)
+                corrdist[tA, tB] = corrs
         return corrdist
 
     def get_scorer(self, **keywords):
@@ -935,6 +1242,9 @@ class LexStat(Wordlist):
         cluster_method : {"upgma" "single" "complete"} (default="upgma")
             Select the method to be used for the calculation of cognates in the
             preprocessing phase, if "preprocessing" is set to c{True}.
+        ref : str (default="scaid")
+            The column which stores the cognate sets of the preprocessing
+            phase. If the column exists already, its cognate sets are used.
         gop : int (default=-2)
             If "preprocessing" is selected, define the gap opening penalty for
             the preprocessing calculation of cognates.
@@ -953,6 +1263,27 @@ class LexStat(Wordlist):
             a very small constant, by which the score is divided in this case.
             Not that this constant is only relevant in those cases where the
             shuffling procedure was not carried out long enough.
+        seed : int (default=None)
+            The seed for the random numbers used to compute the random
+            distribution. Each language pair (and each taxon when using the
+            "markov" method) uses its own random stream derived from this
+            seed. If set to None, the seed is taken from Python's
+            :py:mod:`random` module.
+        processes : int (default=1)
+            The number of worker processes among which the language pairs are
+            distributed when computing the attested and the random
+            distribution. Set to None to use all available cores. The results
+            are identical to those of the serial computation.
+        executor : :py:class:`concurrent.futures.Executor` (default=None)
+            An existing process or thread pool which shall be used instead of
+            creating a new process pool.
+        cache : { bool, str, :py:class:`~lingpy.cache.LRUCache` } (default=False)
+            If set to True, the scoring function and the distributions from
+            which it was derived are stored in the on-disk scorer cache in the
+            user's cache directory, and loaded from there when the scorer is
+            computed again with the same parameters on the same data. Pass a
+            directory name or a :py:class:`~lingpy.cache.LRUCache` instance to
+            use a different cache.
 
         """
         kw = dict(
@@ -977,7 +1308,12 @@ class LexStat(Wordlist):
             defaults=False,
             unattested=-5,
             unexpected=0.00001,
-            smooth=1
+            smooth=1,
+            seed=None,
+            processes=1,
+            executor=None,
+            cache=False,
+            ref='scaid'
         )
         kw.update(keywords)
         if kw['defaults']:
@@ -1045,6 +1381,20 @@ class LexStat(Wordlist):
         self._meta['params'] = self.params
         self._stamp += "# Parameters: " + parstring + '\n'
 
+        # check for a scorer computed earlier on the same data
+        if kw['cache']:
+            scorer_cache = kw['cache'] if isinstance(
+                kw['cache'], cache.LRUCache) else cache.LRUCache(
+                    None if kw['cache'] is True else kw['cache'])
+            key = self._get_scorer_key(parstring, **kw)
+            cached = scorer_cache.get(key)
+            if cached:
+                log.info("Loaded the scoring function from the cache.")
+                (self._corrdist, self._randist, self.cscorer,
+                 self._included) = cached
+                self._meta['scorer']['cscorer'] = self.cscorer
+                return
+
         # get the correspondence distribution
         self._corrdist = self._get_corrdist(**kw)
         # get the random distribution
@@ -1104,6 +1454,52 @@ class LexStat(Wordlist):
         self.cscorer = misc.ScoreDict(self.chars, matrix)
         self._meta['scorer']['cscorer'] = self.cscorer
 
+        if kw['cache']:
+            scorer_cache.set(key, (
+                self._corrdist, self._randist, self.cscorer, self._included))
+
+    def _get_scorer_key(self, parstring, **kw):
+        """
+        Compute the key under which a scoring function is cached.
+
+        Notes
+        -----
+        The key is computed from the parameters of the scoring function and
+        from all data which enter its computation.
+        """
+        # cognate sets in an existing reference column are reused by the
+        # preprocessing instead of being computed from the parameters
+        ref = kw['preprocessing'] and kw['ref'] in self.header
+
+        def components():
+            yield parstring
+            for name in [
+                    'method', 'ratio', 'vscale', 'runs', 'threshold', 'modes',
+                    'factor', 'restricted_chars', 'preprocessing', 'rands',
+                    'limit', 'cluster_method', 'gop',
+                    'preprocessing_threshold', 'preprocessing_method',
+                    'subset', 'unattested', 'unexpected', 'smooth', 'seed',
+                    'ref']:
+                yield name, kw[name]
+            yield self.model.name
+            yield self.vowels
+            yield sorted(self._transform.items())
+            yield rcParams['gap_symbol']
+            yield self.bscorer.chars2int, self.bscorer.matrix
+            if kw['subset']:
+                yield sorted(self.subsets.items())
+            for idx in sorted(self):
+                yield self[idx, self._col_name]
+                yield self[idx, self._row_name]
+                yield self[idx, self._segments]
+                yield self[idx, self._numbers]
+                yield self[idx, self._weights]
+                yield self[idx, self._prostrings]
+                if ref:
+                    yield self[idx, kw['ref']]
+
+        return cache.LRUCache.key(*components())
+
     def align_pairs(self, idxA, idxB, concept=None, **keywords):
         """
         Align all or some words of a given pair of languages.
@@ -1206,7 +1602,16 @@ class LexStat(Wordlist):
             scorer,
             kw['mode'],
             kw['restricted_chars'],
-            distance)
+            0)
+        if distance:
+            # turn the similarity into a distance with the cached
+            # self-alignment scores
+            name = 'cscorer' if kw['method'] == 'lexstat' else 'bscorer'
+            simA = self._self_score(
+                name, idxA, self[idxA, self._numbers], kw['factor'])
+            simB = self._self_score(
+                name, idxB, self[idxB, self._numbers], kw['factor'])
+            d = 1 - ((2 * d) / (simA + simB))
 
         # get a string of scores
         if kw['method'] == 'lexstat':
@@ -1261,33 +1666,31 @@ class LexStat(Wordlist):
         kw = dict(
             defaults=False,
             external_scorer=False,  # external scoring function
+            processes=1,
+            executor=None,
         )
         kw.update(keywords)
-        function = self._distance_method(
-                method, scale=scale, factor=factor,
-                restricted_chars=restricted_chars, mode=mode, gop=gop,
-                restriction=restriction, external_scorer=kw['external_scorer'])
+        params = dict(
+            scale=scale, factor=factor, restricted_chars=restricted_chars,
+            mode=mode, gop=gop, restriction=restriction,
+            external_scorer=kw['external_scorer'])
         concepts = [concept] if concept else sorted(self.rows)
-        for c in concepts:
+        indices = [self.get_list(row=c, flat=True) for c in concepts]
+        scorer = self._word_scorer(method)
+
+        # the concepts are independent of each other, so they can be
+        # distributed among worker processes
+        tasks = (
+            (method, self._word_data(idxs, method, **params), scorer, None,
+             params) for idxs in indices)
+        for c, idxs, distances in zip(concepts, indices, util.parallel_map(
+                _word_distances, tasks, kw['processes'], kw['executor'])):
             log.info("Analyzing words for concept <{0}>.".format(c))
-            indices = self.get_list(row=c, flat=True)
-            matrix = []
-            for idxA, idxB in util.combinations2(indices):
-                try:
-                    d = function(idxA, idxB)
-                except ZeroDivisionError:
-                    log.warning(
-                        "Encountered Zero-Division for the comparison of "
-                        "{0} ({2}) and {1} ({3})".format(
-                            ''.join(self[idxA, self._segments]),
-                            ''.join(self[idxB, self._segments]),
-                            idxA, idxB
-                            ))
-                    d = 100
-                matrix += [d]
-            matrix = misc.squareform(matrix)
+            distances = self._check_distances(
+                idxs, list(util.combinations2(range(len(idxs)))), distances)
+            matrix = misc.squareform(distances.tolist())
             if not concept:
-                yield c, indices, matrix
+                yield c, idxs, matrix
             else:
                 yield matrix
 
@@ -1344,6 +1747,20 @@ class LexStat(Wordlist):
             Specify the inflation parameter for the use of the MCL algorithm.
         expansion : int (default=2)
             Specify the expansion parameter for the use of the MCL algorithm.
+        mcl_prune : float (default=0)
+            Values below this threshold are set to zero in each iteration of
+            the MCL algorithm.
+        mcl_sparse : bool (default=False)
+            If set to c{True}, the MCL algorithm is carried out with sparse
+            matrices (requires `scipy`).
+        processes : int (default=1)
+            The number of worker processes among which the concepts are
+            distributed when computing the distance matrices. Set to None to
+            use all available cores. The clusters are identical to those of
+            the serial computation.
+        executor : :py:class:`concurrent.futures.Executor` (default=None)
+            An existing process or thread pool which shall be used instead of
+            creating a new process pool.
 
         """
         kw = dict(
@@ -1354,12 +1771,16 @@ class LexStat(Wordlist):
             guess_threshold=False,
             gt_trange=(0.4, 0.6, 0.02),
             mcl_logs=lambda x: -np.log2((1 - x) ** 2),
+            mcl_prune=0,
+            mcl_sparse=False,
             gt_mode='average',
             matrix_type='distances',
             link_threshold=False,
             _return_matrix=False,  # help function for test purposes
             defaults=False,
             external_scorer=False,  # external scoring dictionary
+            processes=1,
+            executor=None,
         )
         kw.update(keywords)
         if kw['defaults']:
@@ -1499,8 +1920,38 @@ class LexStat(Wordlist):
                 factor=factor, gop=gop, normalized=edit_dist_normalized)
 
         for taxA, taxB in util.combinations2(self.cols):
+            pairs = list(sample(self.pairs[taxA, taxB]))
+            if method in ['sca', 'lexstat']:
+                # align all pairs at once, using the same scores as
+                # align_pairs
+                indices = sorted(set(idx for pair in pairs for idx in pair))
+                positions = {idx: i for i, idx in enumerate(indices)}
+                if method == 'lexstat':
+                    name = 'cscorer'
+                    gops = [[self.cscorer[charstring(self[idx, self._langid]),
+                                          n] for n in self[idx, self._numbers]]
+                            for idx in indices]
+                else:
+                    name = 'bscorer'
+                    gops = [self[idx, self._weights] for idx in indices]
+                seqs = [self[idx, self._numbers] for idx in indices]
+                distances = calign.pair_distances(
+                    seqs, gops,
+                    [self[idx, self._prostrings] for idx in indices],
+                    [(positions[pA], positions[pB]) for pA, pB in pairs],
+                    abs(gop) if method == 'lexstat' else gop, scale, factor,
+                    getattr(self, name), mode, '_T', None,
+                    [self._self_score(name, idx, seq, factor)
+                     for idx, seq in zip(indices, seqs)])
+                for i, d in enumerate(distances):
+                    if d is None:
+                        self.log.error("Zero-Warning")
+                        distances[i] = 1.0
+                yield distances
+                continue
+
             distances = []
-            for pA, pB in sample(self.pairs[taxA, taxB]):
+            for pA, pB in pairs:
                 try:
                     d = function(pA, pB)
                 except ZeroDivisionError:
@@ -21,9 +21,6 @@ try:
 except ImportError:
     from lingpy.algorithm.cython import _calign as calign
 
-# taking functions from lexstat source code here
-def _charstring(id_, char='X', cls='-'):
-    return '{0}.{1}.{2}'.format(id_, char, cls)
 
 def _get_slices(tokens, **keywords):
     """
@@ -112,9 +109,9 @@ class Partial(LexStat):
     Attributes
     ----------
     pairs : dict
-        A dictionary with tuples of language names as key and indices as value, \
+        A mapping with tuples of language names as key and indices as value, \
         pointing to unique combinations of words with the same meaning in all \
-        language pairs.
+        language pairs. The pairs are created whenever they are accessed.
     model : :py:class:`~lingpy.data.model.Model`
         The sound class model instance which serves to convert the phonetic
         data into sound classes.
@@ -615,46 +612,6 @@ class Partial(LexStat):
         )
         kw.update(keywords)
         
-        def function(idxA, idxB, sA, sB, **keywords):
-            if method == 'lexstat':
-                args = [
-                        self[idxA, self._numbers][sA[0]:sA[1]],
-                        self[idxB, self._numbers][sB[0]:sB[1]],
-                        [self.cscorer[_charstring(
-                            self[idxB, self._langid]
-                            ), n]
-                            for n in self[idxA, self._numbers][sA[0]:sA[1]]],
-                        [self.cscorer[_charstring(
-                            self[idxA, self._langid]), n]
-                            for n in self[idxB, self._numbers][sB[0]:sB[1]]],
-                        self[idxA, self._prostrings][sA[0]:sA[1]],
-                        self[idxB, self._prostrings][sB[0]:sB[1]],
-                        1,
-                        scale,
-                        factor,
-                        self.cscorer,
-                        mode,
-                        restricted_chars,
-                        1]
-            elif method == 'sca':
-                args = [
-                        [n.split('.', 1)[1] for n in self[idxA,
-                            self._numbers][sA[0]:sA[1]]],
-                        [n.split('.', 1)[1] for n in self[idxB,
-                            self._numbers][sB[0]:sB[1]]],
-                        self[idxA, self._weights][sA[0]:sA[1]],
-                        self[idxB, self._weights][sB[0]:sB[1]],
-                        self[idxA, self._prostrings][sA[0]:sA[1]],
-                        self[idxB, self._prostrings][sB[0]:sB[1]],
-                        gop,
-                        scale,
-                        factor,
-                        self.rscorer,
-                        mode,
-                        restricted_chars,
-                        1]
-            return calign.align_pair(*args)[2]
-        
         concepts = [concept] if concept else sorted(self.rows)
         
         # we have two basic constraints in the algorithm:
@@ -686,6 +643,17 @@ class Partial(LexStat):
                     trace[idx] += [(i, slc, count)]
                     count += 1
             
+            # calculate the distances of all parts of different words at once
+            pairs = [
+                (posA, posB) for posA, posB in combinations(range(count), r=2)
+                if tracer[posA][0] != tracer[posB][0]]
+            distances = dict(zip(pairs, self._pair_distances(
+                [idx for idx, i, slc in tracer], pairs, method,
+                slices=[slc for idx, i, slc in tracer], scale=scale,
+                factor=factor, restricted_chars=restricted_chars, mode=mode,
+                gop=gop, restriction=restriction,
+                external_scorer=kw['external_scorer']).tolist()))
+
             if kw['imap_mode']:
                 # now, iterate for each string pair, asses the scores, and make
                 # sure, we only assign the best of those to the matrix
@@ -700,8 +668,7 @@ class Partial(LexStat):
                     idxs = []
                     for i,sliceA,posA in trace[idxA]:
                         for j,sliceB,posB in trace[idxB]:
-                            d = function(idxA, idxB, sliceA, sliceB)
-                            scores += [d]
+                            scores += [distances[posA, posB]]
                             idxs += [(posA,posB)]
                     
                     visited_seqs = set([])
@@ -725,22 +692,9 @@ class Partial(LexStat):
                                 matrix[posA][posB] = 1
                                 matrix[posB][posA] = 1
             else:
-                matrix = []
-                for (idxA, posA, sliceA), (idxB, posB, sliceB) in combinations(tracer, r=2):
-                    
-                    if idxA == idxB:
-                        d = 1
-                    else:
-                        try:
-                            d = function(idxA, idxB, sliceA, sliceB)
-                        except ZeroDivisionError:
-                            lingpy.log.warning(
-                                "Encountered Zero-Division for the comparison of "
-                                "{0} and {1}".format(
-                                    ''.join(self[idxA, self._tokens]),
-                                    ''.join(self[idxB, self._tokens])))
-                            d = 100
-                    matrix += [d]
+                matrix = [
+                    distances.get((posA, posB), 1) for posA, posB in
+                    combinations(range(count), r=2)]
                 matrix = lingpy.algorithm.misc.squareform(matrix)
             if not concept:
                 yield c, tracer, matrix
@@ -803,6 +757,12 @@ class Partial(LexStat):
             Specify the inflation parameter for the use of the MCL algorithm.
         expansion : int (default=2)
             Specify the expansion parameter for the use of the MCL algorithm.
+        mcl_prune : float (default=0)
+            Values below this threshold are set to zero in each iteration of
+            the MCL algorithm.
+        mcl_sparse : bool (default=False)
+            If set to c{True}, the MCL algorithm is carried out with sparse
+            matrices (requires `scipy`).
         
         """
         kw = dict(
@@ -816,7 +776,9 @@ class Partial(LexStat):
                 word_sep=lingpy.settings.rcParams['word_separator'],
                 word_seps=lingpy.settings.rcParams['word_separators'],
                 seps=lingpy.settings.rcParams['morpheme_separators'],
-                mcl_logs=lambda x: -np.log2((1 - x) ** 2)
+                mcl_logs=lambda x: -np.log2((1 - x) ** 2),
+                mcl_prune=0,
+                mcl_sparse=False,
                 )
         kw.update(keywords)        
 
@@ -854,6 +816,8 @@ class Partial(LexStat):
                             expansion=kw['expansion'],
                             add_self_loops=kw['add_self_loops'],
                             logs=kw['mcl_logs'],
+                            prune=kw['mcl_prune'],
+                            sparse=kw['mcl_sparse'],
                             revert=True)
                 elif cluster_method in ['upgma', 'single', 'complete', 'ward']:
                     c = clustering.flat_cluster(cluster_method,
@@ -2,6 +2,7 @@
 Phylogeny-based detection of borrowings in lexicostatistical wordlists.
 """
 import os
+import time
 import itertools
 from collections import defaultdict
 
@@ -46,6 +47,164 @@ from lingpy.basic import Wordlist
 from lingpy.read.csv import csv2dict, csv2list
 
 
+class TreeIndex:
+    """
+    Precomputed topology of a reference tree for gain-loss mapping.
+
+    Parameters
+    ----------
+    tree : :py:class:`~lingpy.thirdparty.cogent.tree.PhyloNode`
+        The reference tree.
+    taxa : list
+        The taxa in the order of the presence-absence patterns which are
+        analyzed with the tree.
+
+    Notes
+    -----
+    The index is derived from the index of the tree itself (see
+    :py:meth:`~lingpy.thirdparty.cogent.tree.TreeNode.buildIndex`), which
+    yields the tips below each node and the lowest common ancestors. The
+    nodes are numbered in postorder, so the descendants of a node are all
+    nodes between its first descendant (see :py:attr:`first`) and the node
+    itself. Sets of taxa are represented as integers in which the bit with
+    the index of the taxon is set. Lowest common ancestors are cached, and
+    they can be computed for many patterns at once with
+    :py:meth:`lowest_common_ancestors`.
+    """
+    def __init__(self, tree, taxa):
+        self.tree = tree._getIndex() or tree.buildIndex()
+        start = self.tree.position[tree]
+        stop = self.tree.end[start]
+
+        # a node is preceded in postorder by all nodes before the end of its
+        # subtree in preorder except for itself and its ancestors
+        self.post = {
+            i: self.tree.end[i] - 1 - self.tree.depth[i] -
+            (start - self.tree.depth[start]) for i in range(start, stop)}
+        self.pre = sorted(self.post, key=self.post.get)
+        nodes = [self.tree.nodes[i] for i in self.pre]
+        self.names = [node.Name for node in nodes]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.children = [
+            [self.post[self.tree.position[child]] for child in node.Children]
+            for node in nodes]
+        self.taxa = list(taxa) + [
+            node.Name for node in nodes if not node.Children and
+            node.Name not in taxa]
+        bits = {taxon: i for i, taxon in enumerate(self.taxa)}
+
+        self.parent = [-1 for node in nodes]
+        self.first, self.masks, self.tipnodes = [], [], {}
+        for i, children in enumerate(self.children):
+            if children:
+                self.first.append(self.first[children[0]])
+                mask = 0
+                for child in children:
+                    self.parent[child] = i
+                    mask |= self.masks[child]
+                self.masks.append(mask)
+            else:
+                self.first.append(i)
+                self.masks.append(1 << bits[self.names[i]])
+                self.tipnodes[bits[self.names[i]]] = i
+        self.ntips = [bin(mask).count('1') for mask in self.masks]
+
+        self._lcas = {}
+
+    def mask(self, taxa):
+        """
+        Return the set of the given taxa as an integer.
+        """
+        mask = 0
+        for i, taxon in enumerate(self.taxa):
+            if taxon in taxa:
+                mask |= 1 << i
+        return mask
+
+    def tips(self, node):
+        """
+        Return the names of the tips below a node, from left to right.
+
+        Notes
+        -----
+        In contrast to the tree method `tips`, the tips of a tip are the tip
+        itself.
+        """
+        return [tip.Name for tip in self.tree.tipNodes(
+            self.tree.nodes[self.pre[node]])]
+
+    def nontips(self, node):
+        """
+        Return the internal nodes below a node (without the node) in preorder.
+        """
+        pre = self.pre[node]
+        return [self.post[i] for i in range(pre + 1, self.tree.end[pre])
+                if self.tree.nodes[i].Children]
+
+    def lowest_common_ancestor(self, mask):
+        """
+        Return the lowest node whose tips include the given set of taxa.
+
+        Notes
+        -----
+        As with the tree method `lowestCommonAncestor`, the lowest common
+        ancestor of a single taxon is the taxon itself, and None is returned
+        for the empty set.
+        """
+        if not mask:
+            return None
+        try:
+            return self._lcas[mask]
+        except KeyError:
+            # the lowest common ancestor of the leftmost and the rightmost tip
+            # is the lowest common ancestor of all tips
+            tips, rest = [], mask
+            while rest:
+                bit = rest & -rest
+                tips.append(self.pre[self.tipnodes[bit.bit_length() - 1]])
+                rest ^= bit
+            node = self.post[self.tree.lca(min(tips), max(tips))]
+            self._lcas[mask] = node
+            return node
+
+    def lowest_common_ancestors(self, patterns):
+        """
+        Compute the lowest common ancestors for many sets of taxa at once.
+
+        Parameters
+        ----------
+        patterns : numpy.ndarray
+            A boolean array with one row per set of taxa and one column per
+            taxon, in the order of the taxa passed to the index.
+
+        Returns
+        -------
+        nodes : list
+            The lowest common ancestors of the sets, which are also cached for
+            :py:meth:`lowest_common_ancestor`.
+        """
+        patterns = np.asarray(patterns, dtype=bool)
+        patterns = patterns.reshape(len(patterns), -1)
+        tips = np.array(
+            [[(mask >> i) & 1 for i in range(patterns.shape[1])]
+             for mask in self.masks], dtype=bool).reshape(-1, patterns.shape[1])
+        # a node includes a set of taxa if none of the taxa are outside of it,
+        # the lowest of these nodes is the one with the fewest tips
+        outside = patterns.astype(float) @ (~tips).T.astype(float)
+        nodes = np.where(outside == 0, self.ntips, len(self.taxa) + 1).argmin(axis=1)
+
+        out = []
+        weights = [1 << i for i in range(patterns.shape[1])]
+        for row, node in zip(patterns, nodes.tolist()):
+            mask = sum([weights[i] for i in np.flatnonzero(row).tolist()])
+            if mask:
+                self._lcas[mask] = node
+                out.append(node)
+            else:
+                out.append(None)
+        return out
+
+
 def get_gls(
         paps,
         taxa,
@@ -65,9 +224,11 @@ def get_gls(
         characters are indicated by -1.
     taxa : list
         The list of taxa (leaves of the tree).
-    tree : str
-        A tree in Newick-format. Taxon names should (of course) be identical
-        with the names in the list of taxa.
+    tree : { :py:class:`~lingpy.thirdparty.cogent.tree.PhyloNode`, :py:class:`TreeIndex` }
+        The reference tree. Taxon names should (of course) be identical
+        with the names in the list of taxa. When computing scenarios for many
+        patterns, pass a :py:class:`TreeIndex` of the tree, which is otherwise
+        created anew for each call.
     gpl : int
         Gains per lineage. Specify the maximal amount of gains per lineage. One
         lineage is hereby defined as one path in the tree. If set to 0, only
@@ -104,20 +265,16 @@ def get_gls(
         if pap[i] == -1:
             pap[i] = missing_data
 
+    if not isinstance(tree, TreeIndex):
+        tree = TreeIndex(tree, taxa)
+
     # get dictionary for taxa with their states
     statesD = dict(zip(taxa, pap))
 
-    states1 = [s for s in statesD if statesD[s] == 1]
-
     # get subtree for taxa with positive paps
-    tree = tree.lowestCommonAncestor([t for t in taxa if statesD[t] == 1])
-    tips = tree.getTipNames()
-    root = tree.Name
-    nodes = tree.getNodeNames()
-    distances = defaultdict(list)
-    for node in [n for n in nodes if n != root]:
-        distances[len(tree.getConnectingEdges(root, node))].append(node)
-    distances[0] = [root]
+    present = tree.mask([t for t in taxa if statesD[t] == 1])
+    root = tree.lowest_common_ancestor(present)
+    tips = tree.tips(root)
 
     # assign the scenarios, each scenario consists of the state of the node in
     # the tree and a dictionary with the previous events, where the node-name
@@ -125,101 +282,98 @@ def get_gls(
     scenarios = {taxon: [(statesD[taxon], {})] for taxon in tips}
 
     # return simple scenario if the group is single origin
-    if [statesD[tip] for tip in tips].count(1) == len(tips):
-        return [(root, 1)]
-
-    # start iteration over outmost layer
-    for i in sorted(distances, reverse=True):
-        log.debug("Calculating Layer {0}...".format(i))
-
-        for node in distances[i]:
-            tree_node = tree.getNodeMatchingName(node)
-
-            if not tree_node.isTip():
-                names = [n.Name for n in tree_node.Children]
-                log.debug("... current node {0} ({1})".format(node, names))
-
-                # define new nodes list (to be appended to new node
-                new_nodes = []
-                for combination in itertools.product(
-                        *[scenarios[n.Name] for n in tree_node.Children]):
-                    # get stories
-                    states = [node[0] for node in combination]
-                    stories = [node[1] for node in combination]
-
-                    # evaluate the states
-                    s1 = states.count(1)
-                    s0 = states.count(0)
-                    sM = states.count(-1)
-
-                    sL = len(states)
-
-                    new_stories = {}
-                    for story in stories:
-                        new_stories.update(story)
-
-                    if s1 + sM == sL:
-                        # combine states if they evaluate to 1
-                        new_nodes.append((1, new_stories))
-                        log.debug("...... 1 nodes: %s" % (new_nodes[-1],))
-                    elif s0 + sM == sL:
-                        # combine states if they evaluate to 0
-                        # append the new combined stuff to the dictionary
-                        new_nodes.append((0, new_stories))
-                        log.debug("...... 0 nodes: %s" % (new_nodes[-1],))
-                    elif sM == sL:
-                        # if the both evaluate to -1, also combine them
-                        new_nodes.append((-1, new_stories))
-                    else:
-                        # append both scenarios if there's both 1 and 0
-                        # assuming origin, each node that has a 0, needs an extra origin
-                        new_storiesA = new_stories.copy()
-                        new_storiesB = new_stories.copy()
-
-                        for j, state in enumerate(states):
-                            if state == 1:
-                                new_storiesA[names[j]] = 1
-                            if state == 0:
-                                new_storiesB[names[j]] = 0
-
-                        new_nodes += [(1, new_storiesB)]
-                        new_nodes += [(0, new_storiesA)]
-
-                        log.debug("...... 01 nodes: %s" % (new_nodes[-2],))
-                        log.debug("...... 01 nodes: %s" % (new_nodes[-1],))
-
-                # evaluate the scenarios for consistency reasons,
-                good_nodes = []
-                minGains, minLoss = defaultdict(list), defaultdict(list)
-                for j, (state, scenario) in enumerate(new_nodes):
-                    # avoid to append scenarios with more than allowed gains per lineage
-                    if not (state == 1 and list(scenario.values()).count(1) > gpl):
-                        # check scenarios having a loss in order to retrieve
-                        # the scenario with the minimal weight, since once a
-                        # loss is determined, the gains can be freely chosen
-                        gains = list(scenario.values()).count(1)
-                        losses = list(scenario.values()).count(0)
-                        w = gains * weights[0] + losses * weights[1]
+    if tree.masks[root] & ~present == 0:
+        return [(tree.names[root], 1)]
+
+    # start iteration from the leaves, since the nodes are ordered in
+    # postorder, the children of a node are always visited before the node
+    for node in range(tree.first[root], root + 1):
+        if tree.children[node]:
+            names = [tree.names[child] for child in tree.children[node]]
+            log.debug("... current node {0} ({1})".format(
+                tree.names[node], names))
+
+            # define new nodes list (to be appended to new node
+            new_nodes = []
+            for combination in itertools.product(
+                    *[scenarios[name] for name in names]):
+                # get stories
+                states = [child[0] for child in combination]
+                stories = [child[1] for child in combination]
+
+                # evaluate the states
+                s1 = states.count(1)
+                s0 = states.count(0)
+                sM = states.count(-1)
+
+                sL = len(states)
+
+                new_stories = {}
+                for story in stories:
+                    new_stories.update(story)
+
+                if s1 + sM == sL:
+                    # combine states if they evaluate to 1
+                    new_nodes.append((1, new_stories))
+                    log.debug("...... 1 nodes: %s" % (new_nodes[-1],))
+                elif s0 + sM == sL:
+                    # combine states if they evaluate to 0
+                    # append the new combined stuff to the dictionary
+                    new_nodes.append((0, new_stories))
+                    log.debug("...... 0 nodes: %s" % (new_nodes[-1],))
+                elif sM == sL:
+                    # if the both evaluate to -1, also combine them
+                    new_nodes.append((-1, new_stories))
+                else:
+                    # append both scenarios if there's both 1 and 0
+                    # assuming origin, each node that has a 0, needs an extra origin
+                    new_storiesA = new_stories.copy()
+                    new_storiesB = new_stories.copy()
+
+                    for j, state in enumerate(states):
+                        if state == 1:
+                            new_storiesA[names[j]] = 1
                         if state == 0:
-                            minGains[w].append(j)
-                        # do the same for scenarios having a gain, if multiple
-                        # loss-models are encountered
-                        elif state == 1:
-                            minLoss[w].append(j)
-
-                # append lowest weights in gains to the list
-                if minGains:
-                    good_nodes.extend([new_nodes[idx] for idx in minGains[min(minGains)]])
-                if minLoss:
-                    good_nodes.extend([new_nodes[idx] for idx in minLoss[min(minLoss)]])
-
-                scenarios[tree_node.Name] = good_nodes
+                            new_storiesB[names[j]] = 0
+
+                    new_nodes += [(1, new_storiesB)]
+                    new_nodes += [(0, new_storiesA)]
+
+                    log.debug("...... 01 nodes: %s" % (new_nodes[-2],))
+                    log.debug("...... 01 nodes: %s" % (new_nodes[-1],))
+
+            # evaluate the scenarios for consistency reasons,
+            good_nodes = []
+            minGains, minLoss = defaultdict(list), defaultdict(list)
+            for j, (state, scenario) in enumerate(new_nodes):
+                # avoid to append scenarios with more than allowed gains per lineage
+                if not (state == 1 and list(scenario.values()).count(1) > gpl):
+                    # check scenarios having a loss in order to retrieve
+                    # the scenario with the minimal weight, since once a
+                    # loss is determined, the gains can be freely chosen
+                    gains = list(scenario.values()).count(1)
+                    losses = list(scenario.values()).count(0)
+                    w = gains * weights[0] + losses * weights[1]
+                    if state == 0:
+                        minGains[w].append(j)
+                    # do the same for scenarios having a gain, if multiple
+                    # loss-models are encountered
+                    elif state == 1:
+                        minLoss[w].append(j)
+
+            # append lowest weights in gains to the list
+            if minGains:
+                good_nodes.extend([new_nodes[idx] for idx in minGains[min(minGains)]])
+            if minLoss:
+                good_nodes.extend([new_nodes[idx] for idx in minLoss[min(minLoss)]])
+
+            scenarios[tree.names[node]] = good_nodes
 
     # select the best of all scenarios by comparing all weights
     winners = defaultdict(list)
-    for s in scenarios[root]:
+    for s in scenarios[tree.names[root]]:
         if s[0] == 1:
-            s[1][root] = s[0]
+            s[1][tree.names[root]] = s[0]
 
         # count the weights
         events = list(s[1].values())
@@ -228,14 +382,24 @@ def get_gls(
 
     # select the scenario with the hightest number of gains, if push-gains
     # option is set to true
-    log.debug('%s' % (
-        [x for x in tree.getNodeMatchingName(root).getTipNames() if x not in states1],))
+    log.debug('%s' % ([x for x in tips if statesD[x] != 1],))
 
     return sorted(
         winners[min(winners)],
         key=lambda x: [y[1] for y in x].count(1 if push_gains else 0))[0]
 
 
+def _gain_loss_task(task):
+    """
+    Compute the gain-loss scenarios of one model of an analysis.
+    """
+    phybo, glm, mode, ratio, restriction, keywords = task
+    start = time.time()
+    scenarios = phybo._gain_loss_scenarios(
+        glm, mode, ratio, restriction, **keywords)
+    return scenarios, time.time() - start
+
+
 class PhyBo(Wordlist):
     """
     Basic class for calculations using the TreBor method.
@@ -381,6 +545,9 @@ class PhyBo(Wordlist):
         if isinstance(self.tree, str):
             self.tree = cg.LoadTree(treestring=self.tree)
 
+        # the tree is queried for every cognate set, so we index it
+        self.tree.buildIndex()
+
         # if no good topology is given, create it automatically, using
         # the radial layout function
         gTpl = radial_layout(
@@ -440,7 +607,7 @@ class PhyBo(Wordlist):
             paps += [pap[i]]
         return taxa, paps
 
-    def _get_GLS_top_down(self, pap, mode=1, missing_data=0):
+    def _get_GLS_top_down(self, pap, mode=1, missing_data=0, tree=None):
         """
         Infer gain-loss scenario using the method by Dagan & Martin (2007).
 
@@ -452,90 +619,75 @@ class PhyBo(Wordlist):
             raise ValueError("[i] Mode should be an integer.")
 
         taxa, paps = self._existing_taxa_and_paps(pap, missing_data)
+        tree = tree or TreeIndex(self.tree, self.taxa)
 
         # get list of taxa where pap is 1
-        presents = [self.taxa[i] for i in range(len(self.taxa)) if pap[i] in (1, -1)]
+        presents = tree.mask(
+            [self.taxa[i] for i in range(len(self.taxa)) if pap[i] in (1, -1)])
 
         # get the subtree containing all taxa that have positive paps
-        tree = self.tree.lowestCommonAncestor(
-            [self.taxa[i] for i in range(len(self.taxa)) if pap[i] >= 1])
-        log.debug("Subtree is {0}.".format(str(tree)))
+        root = tree.lowest_common_ancestor(tree.mask(
+            [self.taxa[i] for i in range(len(self.taxa)) if pap[i] >= 1]))
+        log.debug("Subtree is {0}.".format(tree.names[root]))
 
         # assign the basic (starting) values to the dictionary
-        nodes = [t.Name for t in tree.tips()]
+        nodes = tree.tips(root)
         log.debug("Nodes are {0}.".format(','.join(nodes)))
 
         if mode == 1:
-            return [(tree.Name, 1)]
+            return [(tree.names[root], 1)]
 
         # store the scenario
         scenario = []
 
         # make the queue
-        queue = [[tree, 1]]
+        queue = [[root, 1]]
         while queue:
             # get tree and counter from queue
             tmp_tree, counter = queue.pop(0)
 
             # break if counter exceeds the mode
             if counter >= mode:
-                t = tmp_tree.lowestCommonAncestor(
-                    [p for p in presents if p in tmp_tree.getTipNames()])
-                scenario.append((t.Name, 1) if hasattr(t, 'Name') else (tmp_tree.Name, 0))
+                t = tree.lowest_common_ancestor(presents & tree.masks[tmp_tree])
+                scenario.append(
+                    (tree.names[t], 1) if t is not None else (tree.names[tmp_tree], 0))
             else:
                 # store common names and children nodes
                 commons = []
-                tmp_names = tmp_tree.getTipNames()
-
-                # store results for separate children
-                tmp_results = []
-
-                for child in tmp_tree.Children:
-                    subtree = child.lowestCommonAncestor(
-                        [p for p in presents if p in child.getTipNames()])
+                tmp_names = tree.tips(tmp_tree)
 
+                for child in tree.children[tmp_tree]:
                     # check for tip names in subtrees
-                    if hasattr(subtree, "Children"):
-                        subnames = subtree.getTipNames()
-                    else:
-                        if child.Name in presents:
-                            subnames = [child.Name]
-                        else:
-                            subnames = []
-
-                    commons.extend(subnames)
-                    tmp_results += [child]
+                    subtree = tree.lowest_common_ancestor(
+                        presents & tree.masks[child])
+                    commons.extend(tree.tips(subtree) if subtree is not None else [])
 
                 # evaluate the results
                 cSet = set(commons)
                 tSet = set(tmp_names)
                 # check for identity and stop iteration if tips are identical
                 if cSet == tSet:
-                    scenario += [(tmp_tree.lowestCommonAncestor(presents).Name, 1)]
-                # otherwise check for intersection and small amount of
-                # differences
-                # elif tmp_tree == tree.lowestCommonAncestor(commons):
-                # elif cSet.issubset(tSet) and len(tSet) - len(cSet) < len(tSet) / 2:
-                #    scenario += [(tmp_tree.lowestCommonAncestor(presents).Name,1)]
+                    scenario += [(tree.names[tree.lowest_common_ancestor(
+                        presents & tree.masks[tmp_tree])], 1)]
                 # otherwise append the other results to the queue
                 else:
                     add2scenario = []
-                    for child in tmp_results:
-                        if child.Children:
+                    for child in tree.children[tmp_tree]:
+                        if tree.children[child]:
                             queue += [(child, counter + 1)]
                         else:
-                            if child.Name in presents:
+                            if presents & tree.masks[child]:
                                 add2scenario += [child]
 
                     if len(add2scenario) == 2:
-                        if add2scenario[0].Parent == add2scenario[1].Parent:
-                            scenario += [(add2scenario[0].Parent.Name, 1)]
+                        if tree.parent[add2scenario[0]] == tree.parent[add2scenario[1]]:
+                            scenario += [(tree.names[tree.parent[add2scenario[0]]], 1)]
                         else:
                             for c in add2scenario:
-                                scenario += [(c.Name, 1)]
+                                scenario += [(tree.names[c], 1)]
                     else:
                         for c in add2scenario:
-                            scenario += [(c.Name, 1)]
+                            scenario += [(tree.names[c], 1)]
 
         # TODO fill the scenario with gaps
         output = []
@@ -543,32 +695,32 @@ class PhyBo(Wordlist):
 
         for s in scenario:
             output += [s]
-            subtree = tree.getNodeMatchingName(s[0])
+            subtree = tree.index[s[0]]
 
-            if subtree.Children:
+            if tree.children[subtree]:
                 # order the internal nodes according to the number of their leaves
                 ordered_nodes = sorted(
-                    subtree.nontips() + [subtree], key=lambda x: len(x.tips()))
+                    tree.nontips(subtree) + [subtree], key=lambda x: tree.ntips[x])
 
                 # start bottom-up
                 for node in ordered_nodes:
-                    children = node.Children
+                    children = tree.children[node]
                     states = []
 
                     for child in children:
-                        state = d[child.Name]
+                        state = d[tree.names[child]]
                         states += [state]
 
                     # check for identity of states
                     if sum(states) == len(states):
-                        d[node.Name] = 1
+                        d[tree.names[node]] = 1
                     elif sum(states) == 0:
-                        d[node.Name] = 0
+                        d[tree.names[node]] = 0
                     else:
-                        d[node.Name] = 1
+                        d[tree.names[node]] = 1
                         for i, state in enumerate(states):
                             if state == 0:
-                                output += [(children[i].Name, 0)]
+                                output += [(tree.names[children[i]], 0)]
 
         return output
 
@@ -579,7 +731,8 @@ class PhyBo(Wordlist):
         r=(1, 1),
         gpl=1,
         push_gains=True,
-        missing_data=0
+        missing_data=0,
+        tree=None
     ):
         """
         Calculate a gain-loss scenario (GLS) for a given PAP.
@@ -602,20 +755,25 @@ class PhyBo(Wordlist):
             Indicate, how missing values should be represented in the paps. If
             set to 0, missing values will be treated as non-cognate words. If
             set to 1, missing values will be treated as potential cognates.
+        tree : :py:class:`TreeIndex` (default=None)
+            The index of the reference tree, which is created from the tree
+            of the analysis if it is not passed.
 
         """
         # make a dictionary that stores the scenario
         d = {}
         taxa, paps = self._existing_taxa_and_paps(pap, missing_data)
+        tree = tree or TreeIndex(self.tree, self.taxa)
+        positions = {taxon: i for i, taxon in enumerate(taxa)}
 
         # get the subtree containing all taxa that have positive paps
-        tree = self.tree.lowestCommonAncestor(
-            [self.taxa[i] for i in range(len(self.taxa)) if pap[i] >= 1])
+        root = tree.lowest_common_ancestor(tree.mask(
+            [self.taxa[i] for i in range(len(self.taxa)) if pap[i] >= 1]))
 
-        log.debug("Subtree is {0}.".format(str(tree)))
+        log.debug("Subtree is {0}.".format(tree.names[root]))
 
         # assign the basic (starting) values to the dictionary
-        nodes = [t.Name for t in tree.tips()]
+        nodes = tree.tips(root)
         log.debug("Nodes are {0}.".format(','.join(nodes)))
 
         # calculate the initial restriction value (maximal weight). This is roughly
@@ -633,8 +791,8 @@ class PhyBo(Wordlist):
         # missing data in a two-fold fashion here. this is probably
         # computationally not the most feasible solution. however, it is the
         # only way I can think of at the moment
-        maxG = sum([1 for x in nodes if paps[taxa.index(x)] in (1, -1)])
-        maxL = sum([1 for x in nodes if paps[taxa.index(x)] in (0, -1)])
+        maxG = sum([1 for x in nodes if paps[positions[x]] in (1, -1)])
+        maxL = sum([1 for x in nodes if paps[positions[x]] in (0, -1)])
 
         log.debug("Initial restriction threshold is {0}.".format(RST))
 
@@ -645,7 +803,7 @@ class PhyBo(Wordlist):
         # where all present states in the leaves are treated as origins
         dbpaps = []
         for node in nodes:
-            idx = taxa.index(node)
+            idx = positions[node]
             if paps[idx] >= 1:
                 state = 1
             else:
@@ -659,26 +817,27 @@ class PhyBo(Wordlist):
 
         # return simple scenario, if the group is single-origin
         if sum([d[node][0][0] for node in nodes]) == len(nodes):
-            return [(tree.Name, 1)]
+            return [(tree.names[root], 1)]
 
         # order the internal nodes according to the number of their leaves
-        ordered_nodes = sorted(tree.nontips() + [tree], key=lambda x: len(x.tips()))
+        ordered_nodes = sorted(
+            tree.nontips(root) + [root], key=lambda x: tree.ntips[x])
 
         search_space = 0
         log.debug('The Pap to be analysed: %s' % ', '.join(dbpaps))
 
         # join the nodes successively
         for i, node in enumerate(ordered_nodes):
-            log.debug('Node to be joined in this run: %s' % node)
+            log.debug('Node to be joined in this run: %s' % tree.names[node])
 
             # when dealing with multifurcating trees, we have to store all
             # possible scenarios, i.e. we need to store the crossproduct of all
             # scenarios
 
-            names = [x.Name for x in node.Children]
+            names = [tree.names[x] for x in tree.children[node]]
 
             # get the nodes with their states from the dictionary
-            tmp_nodes = [d[x.Name] for x in node.Children]
+            tmp_nodes = [d[x] for x in names]
 
             # get the cross-product of the stuff
             crossp = itertools.product(*tmp_nodes)
@@ -836,9 +995,9 @@ class PhyBo(Wordlist):
                     if weightB <= rst and not noB:
                         newNodes += [newNodeB]
 
-                d[node.Name] = newNodes
-                log.debug("... Possible scenarios for '{0}': {1}".format(node.Name, len(
-                    d[node.Name])))
+                d[tree.names[node]] = newNodes
+                log.debug("... Possible scenarios for '{0}': {1}".format(
+                    tree.names[node], len(newNodes)))
 
         # try to find the best scenario by counting the ratio of gains and losses.
         # the key idea here is to reduce the number of possible scenarios according
@@ -850,16 +1009,16 @@ class PhyBo(Wordlist):
         # differently. So in a second stage we choose only those scenarios where
         # there is a minimal amount of gains.
 
-        # convert the specific format of the d[tree.Name] to simple format
+        # convert the specific format of the d[tree.names[root]] to simple format
         gls_list = []
-        for first, last, mg, ml in d[tree.Name]:
+        for first, last, mg, ml in d[tree.names[root]]:
             log.debug('%s %s' % (first, last))
             if first == 1:
-                gls_list.append([(tree.Name, first)] + last)
+                gls_list.append([(tree.names[root], first)] + last)
             else:
                 gls_list.append(last)
 
-        log.debug("Number of inferred scenarios: %s" % len(d[tree.Name]))
+        log.debug("Number of inferred scenarios: %s" % len(d[tree.names[root]]))
         log.debug("Number of decisions: %s" % search_space)
 
         # the tracer stores all scores
@@ -908,8 +1067,7 @@ class PhyBo(Wordlist):
             new_length_of_tips = 0
             for taxon, state in line:
                 if state == 1:
-                    new_length_of_tips += len(
-                        self.tree.getNodeMatchingName(taxon).getTipNames())
+                    new_length_of_tips += tree.ntips[tree.index[taxon]]
             if new_length_of_tips < old_length_of_tips:
                 old_length_of_tips = new_length_of_tips
                 best_scenario = i
@@ -1060,6 +1218,36 @@ class PhyBo(Wordlist):
             the gains are closer to the root.
 
 
+        """
+        mode, glm = self._gain_loss_model(mode, ratio, restriction)
+
+        util.setdefaults(
+            keywords,
+            force=False,
+            gpl=1,
+            push_gains=True,
+            missing_data=0)
+
+        # check for previous analyses
+        if glm in self.gls and not keywords['force']:
+            log.info(
+                "Gain-loss scenario {0} has already been calculated.  For recalculation, "
+                "set 'force' to 'True'.".format(glm))
+            return
+
+        scenarios = self._gain_loss_scenarios(
+            glm, mode, ratio, restriction,
+            gpl=keywords['gpl'],
+            push_gains=keywords['push_gains'],
+            missing_data=keywords['missing_data'])
+        self._store_gain_loss_scenarios(
+            glm, mode, ratio, restriction, scenarios,
+            output_gml=output_gml, output_plot=output_plot, tar=tar)
+
+    @staticmethod
+    def _gain_loss_model(mode, ratio, restriction):
+        """
+        Return the normalized mode and the name of a gain-loss model.
         """
         if mode not in ['weighted', 'w', 'r', 'restriction', 't', 'topdown']:
             raise ValueError("[!] The mode {0} is not available".format(mode))
@@ -1079,45 +1267,33 @@ class PhyBo(Wordlist):
             glm = 'r-{0}'.format(restriction)
         elif mode == 'topdown':
             glm = 't-{0}'.format(restriction)
+        return mode, glm
 
-        util.setdefaults(
-            keywords,
-            force=False,
-            gpl=1,
-            push_gains=True,
-            missing_data=0)
-
-        # check for previous analyses
-        if glm in self.gls and not keywords['force']:
-            log.info(
-                "Gain-loss scenario {0} has already been calculated.  For recalculation, "
-                "set 'force' to 'True'.".format(glm))
-            return
-
-        # create statistics for this run
-        self.stats[glm] = {}
-
-        # store the statistics
-        self.stats[glm]['mode'] = mode
-        self.stats[glm]['dataset'] = self.dataset
-
-        # attribute stores all gls for each cog
-        self.gls[glm] = {}
+    def _gain_loss_scenarios(
+            self, glm, mode, ratio, restriction, gpl=1, push_gains=True,
+            missing_data=0):
+        """
+        Compute the gain-loss scenarios of all non-singleton paps for a model.
+        """
+        scenarios = {}
 
         # make a temporary hash in order to decrease the number of calls to the algorithm
         cogDict = {}
 
-        skip, nonskip = 0, 0
+        # index the tree once and compute the subtrees of all patterns at once
+        tree = TreeIndex(self.tree, self.taxa)
+        patterns = set(tuple(self.paps[cog]) for cog in self.cogs)
+        if patterns:
+            tree.lowest_common_ancestors(np.array(sorted(patterns)) >= 1)
+
         for cog in util.pb(self.cogs, desc='GAIN-LOSS-MAPPING ({0})'.format(glm)):
             # check whether cog has already been calculated
             cogTuple = tuple(self.paps[cog])
             if cogTuple in cogDict:
-                skip += 1
                 log.debug(
                     "Skipping already calculated pattern for COG {0}...".format(cog))
-                self.gls[glm][cog] = cogDict[cogTuple]
+                scenarios[cog] = cogDict[cogTuple]
             else:
-                nonskip += 1
                 log.debug("Calculating GLS for COG {0}...".format(cog))
 
                 # check for singletons
@@ -1128,11 +1304,11 @@ class PhyBo(Wordlist):
                         gls = get_gls(
                             self.paps[cog],
                             self.taxa,
-                            self.tree,
-                            gpl=keywords['gpl'],
+                            tree,
+                            gpl=gpl,
                             weights=ratio,
-                            push_gains=keywords['push_gains'],
-                            missing_data=keywords['missing_data']
+                            push_gains=push_gains,
+                            missing_data=missing_data
                         )
 
                     if mode == 'restriction':
@@ -1140,26 +1316,45 @@ class PhyBo(Wordlist):
                             self.paps[cog],
                             r=restriction,
                             mode='r',
-                            gpl=keywords['gpl'],
-                            push_gains=keywords['push_gains'],
-                            missing_data=keywords['missing_data']
+                            gpl=gpl,
+                            push_gains=push_gains,
+                            missing_data=missing_data,
+                            tree=tree
                         )
 
                     if mode == 'topdown':
                         gls = self._get_GLS_top_down(
                             self.paps[cog],
                             mode=restriction,
-                            missing_data=keywords['missing_data']
+                            missing_data=missing_data,
+                            tree=tree
                         )
                 noo = sum([t[1] for t in gls])
 
-                self.gls[glm][cog] = (gls, noo)
+                scenarios[cog] = (gls, noo)
 
                 # append new results to cogDict
                 cogDict[cogTuple] = (gls, noo)
 
         # append scenario to gls
         log.info("Successfully calculated Gain-Loss-Scenarios.")
+        return scenarios
+
+    def _store_gain_loss_scenarios(
+            self, glm, mode, ratio, restriction, scenarios, output_gml=False,
+            output_plot=False, tar=False):
+        """
+        Store the gain-loss scenarios of a model along with their statistics.
+        """
+        # create statistics for this run
+        self.stats[glm] = {}
+
+        # store the statistics
+        self.stats[glm]['mode'] = mode
+        self.stats[glm]['dataset'] = self.dataset
+
+        # attribute stores all gls for each cog
+        self.gls[glm] = scenarios
 
         # write the results to file
         # if output of gls is chosen, load the gml-graph
@@ -2148,8 +2343,22 @@ class PhyBo(Wordlist):
             Select or unselect output plot for the MLN.
         plot_msn : bool (default=False)
             Select or unselect output plot for the MSN.
+        processes : int (default=1)
+            The number of worker processes among which the models are
+            distributed. If set to None, all available cores are used.
+        executor : :py:class:`concurrent.futures.Executor` (default=None)
+            An existing executor, e.g. a process or thread pool, which shall be
+            used to compute the models.
+
+        Notes
+        -----
+        The gain-loss scenarios of the models do not depend on each other, so
+        they can be computed in parallel. The time needed for each model is
+        logged.
 
         """
+        processes = keywords.pop('processes', 1)
+        executor = keywords.pop('executor', None)
         util.setdefaults(
             keywords,
             colorbar=None,  # mpl.cm.jet,
@@ -2192,28 +2401,33 @@ class PhyBo(Wordlist):
                     ('restriction', 5),
                     ('restriction', 6)]
 
+        models = []
         for mode, params in runs:
-            log.info(
-                "Analysing dataset with mode {0} and params {1}...".format(mode, params))
-            kw = dict(
-                mode=mode,
-                output_gml=output_gml,
-                tar=tar,
-                output_plot=output_plot,
-                missing_data=keywords["missing_data"])
+            ratio, restriction = (1, 1), 3
+            kw = dict(missing_data=keywords["missing_data"])
             if mode == 'weighted':
-                kw.update(
-                    gpl=keywords['gpl'],
-                    push_gains=keywords['push_gains'],
-                    ratio=params)
+                kw.update(gpl=keywords['gpl'], push_gains=keywords['push_gains'])
+                ratio = params
             elif mode == 'restriction':
-                kw.update(
-                    gpl=keywords['gpl'],
-                    push_gains=keywords['push_gains'],
-                    restriction=params)
+                kw.update(gpl=keywords['gpl'], push_gains=keywords['push_gains'])
+                restriction = params
             elif mode == 'topdown':
-                kw.update(restriction=params)
-            self.get_GLS(**kw)
+                restriction = params
+            mode, glm = self._gain_loss_model(mode, ratio, restriction)
+            if glm in self.gls or glm in [model[1] for model in models]:
+                log.info(
+                    "Gain-loss scenario {0} has already been calculated.".format(glm))
+            else:
+                models.append((self, glm, mode, ratio, restriction, kw))
+
+        for (_, glm, mode, ratio, restriction, _), (scenarios, seconds) in zip(
+                models,
+                util.parallel_map(_gain_loss_task, models, processes, executor)):
+            log.info("Computed gain-loss model {0} in {1:.2f} seconds.".format(
+                glm, seconds))
+            self._store_gain_loss_scenarios(
+                glm, mode, ratio, restriction, scenarios,
+                output_gml=output_gml, output_plot=output_plot, tar=tar)
 
         # calculate the different distributions
         # start by calculating the contemporary distributions
@@ -1,10 +1,11 @@
 """
 Module provides basic checks for wordlists.
 """
-import networkx as nx
-from networkx.algorithms.clique import find_cliques
 from itertools import combinations
 from collections import defaultdict
+
+import numpy as np
+
 from lingpy import log
 
 
@@ -23,6 +24,94 @@ def _get_concepts(wordlist, concepts):
     return {c: set(wordlist.get_list(col=c, flat=True, entry=concepts)) for c in
         wordlist.cols}
 
+def _coverage_matrix(wordlist, concepts):
+    """
+    Count the concepts shared by all pairs of columns of a wordlist.
+
+    Notes
+    -----
+    The concepts of each column are stored as a row of a boolean matrix, so
+    that the coverage of all pairs is given by the product of the matrix with
+    its transpose.
+    """
+    items, taxa = {}, _get_concepts(wordlist, concepts)
+    rows, cols = [], []
+    for i, tax in enumerate(wordlist.cols):
+        for concept in taxa[tax]:
+            rows += [i]
+            cols += [items.setdefault(concept, len(items))]
+    presence = np.zeros((wordlist.width, len(items)))
+    presence[rows, cols] = 1
+    return np.rint(presence @ presence.T).astype(int)
+
+
+def _bits(bitset):
+    while bitset:
+        bit = bitset & -bitset
+        yield bit.bit_length() - 1
+        bitset ^= bit
+
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # pragma: no cover
+    def _popcount(bitset):
+        return bin(bitset).count('1')
+
+
+def _maximum_cliques(neighbors):
+    """
+    Find all cliques of maximal size in a graph.
+
+    Parameters
+    ----------
+    neighbors : list
+        The neighbors of each node, given as an integer whose bits are set
+        for the neighboring nodes.
+
+    Returns
+    -------
+    cliques : list
+        The lists of nodes of all maximum cliques.
+
+    Notes
+    -----
+    The cliques are searched with the Bron-Kerbosch algorithm with pivoting,
+    skipping all branches which cannot yield a clique of the size of the
+    largest clique found so far.
+    """
+    best, cliques = 0, []
+    stack = [([], (1 << len(neighbors)) - 1, 0)]
+    while stack:
+        clique, candidates, excluded = stack.pop()
+        if not candidates:
+            if not excluded and len(clique) >= best:
+                if len(clique) > best:
+                    best, cliques = len(clique), []
+                cliques += [clique]
+            continue
+        size = _popcount(candidates)
+        if len(clique) + size < best:
+            continue
+
+        # the pivot is the node with most neighbors among the candidates
+        pivot, degree = None, -1
+        for node in _bits(candidates | excluded):
+            current = _popcount(candidates & neighbors[node])
+            if current > degree:
+                pivot, degree = node, current
+                if degree >= size - 1:
+                    break
+        for node in _bits(candidates & ~neighbors[pivot]):
+            stack += [(
+                clique + [node],
+                candidates & neighbors[node],
+                excluded & neighbors[node])]
+            candidates ^= 1 << node
+            excluded |= 1 << node
+    return cliques
+
+
 def mutual_coverage(wordlist, concepts='concept'):
     """Compute mutual coverage for all language pairs in your data.
     
@@ -103,11 +192,9 @@ def mutual_coverage_check(wordlist, threshold, concepts='concept'):
     mutual_coverage_subset
     average_coverage
     """
-    mc = mutual_coverage(wordlist, concepts)
-    for coverage in mc.values():
-        if [x for x in coverage if len(coverage[x]) < threshold]:
-            return False
-    return True
+    coverage = _coverage_matrix(wordlist, concepts)
+    np.fill_diagonal(coverage, threshold)
+    return bool((coverage >= threshold).all())
 
 def mutual_coverage_subset(wordlist, threshold, concepts='concept'):
     """Compute maximal mutual coverage for all language in a wordlist.
@@ -127,7 +214,14 @@ def mutual_coverage_subset(wordlist, threshold, concepts='concept'):
         A tuple consisting of the number of languages for which the coverage
         could be found as well as a list of all pairings in which this coverage
         is possible. The list itself contains the mutual coverage inside each
-        pair and the list of languages.
+        pair and the list of languages, and is sorted by the languages.
+
+    Notes
+    -----
+    The subsets are the largest cliques of the graph in which all language
+    pairs with sufficient coverage are connected. They are searched on the
+    bitsets of the neighbors of each language, skipping all branches which
+    cannot yield a subset of the size of the largest subset found so far.
 
     Examples
     --------
@@ -148,27 +242,25 @@ def mutual_coverage_subset(wordlist, threshold, concepts='concept'):
     mutual_coverage_check
     average_coverage
     """
-    coverage = mutual_coverage(wordlist, concepts)
-
-    G = nx.Graph()
-    for tax in wordlist.cols:
-        G.add_node(tax)
-    for taxA, taxB in combinations(wordlist.cols, r=2):
-        if len(coverage[taxA][taxB]) >= threshold:
-            G.add_edge(taxA, taxB, coverage=coverage[taxA][taxB])
-    
-    best_cliques = defaultdict(list)
-    best_clique = 0
-    for clique in find_cliques(G):
-        sums = []
-        for taxA, taxB in combinations(clique, r=2):
-            sums += [len(G[taxA][taxB]['coverage'])]
-        if sums:
-            val = int(sum(sums) / len(sums) + 0.5)
-            best_cliques[len(clique)] += [(val, sorted(clique))]
-            if len(clique) > best_clique:
-                best_clique = len(clique)
-    return best_clique, best_cliques[best_clique]
+    coverage = _coverage_matrix(wordlist, concepts)
+    edges = coverage >= threshold
+    np.fill_diagonal(edges, False)
+    neighbors = [
+        int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little')
+        for row in edges]
+
+    best_cliques = []
+    for clique in _maximum_cliques(neighbors):
+        if len(clique) > 1:
+            sums = np.triu(coverage[np.ix_(clique, clique)], 1)
+            val = int(
+                int(sums.sum()) / (len(clique) * (len(clique) - 1) // 2) + 0.5)
+            best_cliques += [
+                (val, sorted(wordlist.cols[i] for i in clique))]
+    if not best_cliques:
+        return 0, []
+    return len(best_cliques[0][1]), sorted(
+        best_cliques, key=lambda x: x[1])
 
 
 def average_coverage(wordlist, concepts='concepts'):
@@ -206,11 +298,8 @@ def average_coverage(wordlist, concepts='concepts'):
     mutual_coverage
 
     """
-    mc = mutual_coverage(wordlist)
-    score = []
-    for v in mc.values():
-        for key, val in v.items():
-            score += [len(val)]
+    coverage = _coverage_matrix(wordlist, 'concept')
+    score = coverage[~np.eye(wordlist.width, dtype=bool)].tolist()
     return sum(score) / len(score) / wordlist.height
 
 
@@ -114,7 +114,7 @@ def _find_dir_path(graph, start, end):
                 # the respective shortest path is what we are looking for.
                 paths = _fop(graph.to_undirected(), start, end)
                 current_path_length = max([len(path) for path in paths])
-                shortest_paths = nx.shortest_path(graph)
+                shortest_paths = dict(nx.shortest_path(graph))
                 current_path = []
                 for path in paths:
                     for node in path[1:-1]:
@@ -395,9 +395,6 @@ def compile_model(model, path=None):
 
     # load the sound classes
     sound_classes = _import_sound_classes(new_path('converter'))
-
-    # dump the data
-    cache.dump(sound_classes, model + '.converter')
     log.info("... successfully created the converter.")
 
     # try to load the scoring function or the score tree
@@ -425,13 +422,47 @@ def compile_model(model, path=None):
         scorer = misc.ScoreDict(chars, matrix)
         util.write_text_file(new_path('matrix'), scorer2str(scorer))
 
+    # dump the data, once all source files are in place
+    sources = model_sources(model, path)
+    cache.dump(sound_classes, model + '.converter', sources=sources)
     if scorer:
-        cache.dump(scorer, model + '.scorer')
+        cache.dump(scorer, model + '.scorer', sources=sources)
         log.info("... successfully created the scorer.")
     else:
         log.info("... no scoring dictionary defined.")
 
     log.info("Model <" + model + "> was compiled successfully.")
+    return sound_classes, scorer
+
+
+def model_sources(model, path=None):
+    """
+    Return the paths of the files from which a sound-class model is compiled.
+
+    Notes
+    -----
+    Compiled models are cached along with a checksum of these files, so that
+    they are compiled anew when one of the files is modified.
+    """
+    return [
+        os.path.join(path or util.data_path('models'), model, name)
+        for name in ['converter', 'matrix', 'scorer']]
+
+
+def dvt_sources(path=''):
+    """
+    Return the paths of the files from which diacritics, vowels, and tones are
+    compiled.
+    """
+    if not path:
+        file_path = util.data_path('models', 'dvt')
+    elif path in ['evolaemp', 'el']:
+        file_path = util.data_path('models', 'dvt', 'dvt_el')
+    else:
+        file_path = path
+    return [
+        os.path.join(file_path, name) for name in
+        ['diacritics', 'vowels', 'tones']]
 
 
 def compile_dvt(path=''):
@@ -460,21 +491,14 @@ def compile_dvt(path=''):
     """
     log.info("Compiling diacritics and vowels...")
 
-    # get the path to the models
-    if not path:
-        file_path = util.data_path('models', 'dvt')
-    elif path in ['evolaemp', 'el']:
-        file_path = util.data_path('models', 'dvt_el')
-    else:
-        file_path = path
-
     def _read_string(name):
         # normalize stuff
         # TODO: this is potentially dangerous and it is important to decide whether
         # TODO: switching to NFD might not be a better choice
         return util.read_text_file(
-            os.path.join(file_path, name), normalize='NFC').replace('\n', '')
+            sources[name], normalize='NFC').replace('\n', '')
 
+    sources = dict(zip(['diacritics', 'vowels', 'tones'], dvt_sources(path)))
     diacritics = _read_string('diacritics').replace('-', '')
     vowels = ''.join([v for v in _read_string('vowels') if v not in diacritics])
     tones = _read_string('tones')
@@ -482,8 +506,9 @@ def compile_dvt(path=''):
     dvt = (diacritics, vowels, tones)
 
     if path in ['evolaemp', 'el']:
-        cache.dump(dvt, 'dvt_el')
+        cache.dump(dvt, 'dvt_el', sources=list(sources.values()))
     else:
-        cache.dump(dvt, 'dvt')
+        cache.dump(dvt, 'dvt', sources=list(sources.values()))
 
     log.info("Diacritics and sound classes were successfully compiled.")
+    return dvt
@@ -3,9 +3,10 @@ Module for handling sequence models.
 """
 import os
 import re
+import pickle
 
-from lingpy.data.derive import compile_model, compile_dvt
-from lingpy.read.phylip import read_scorer
+from lingpy.data.derive import (
+    compile_model, compile_dvt, model_sources, dvt_sources)
 from lingpy import cache
 from lingpy import util
 
@@ -105,28 +106,31 @@ class Model(object):
     """
 
     def __init__(self, model, path=None):
+        self.name = model
+        self._load(path)
+
+    def _load(self, path=None):
+        model = self.name
         new_path = lambda *cmps: \
             os.path.join(path or util.data_path('models'), model, *cmps)
-        self.name = model
 
-        # try to load the converter
+        # try to load the compiled model from the cache, and compile it if it
+        # is missing or if its source files have been modified
+        sources = model_sources(model, path)
         try:
-            self.converter = cache.load(model + '.converter')
-        except:
-            compile_model(model, path)
-            self.converter = cache.load(model + '.converter')
-
-        # give always preference to scorer matrix files
-        if os.path.isfile(new_path('matrix')):
-            self.scorer = read_scorer(new_path('matrix'))
-        elif os.path.isfile(new_path('scorer.bin')):
-            try:
-                self.scorer = cache.load(model + '.scorer')
-            except FileNotFoundError:
-                pass
-        # if none of the above fits, leave it
-        else:
-            pass
+            self.converter = cache.load(model + '.converter', sources=sources)
+            if os.path.isfile(new_path('matrix')) or os.path.isfile(
+                    new_path('scorer')):
+                self.scorer = cache.load(model + '.scorer', sources=sources)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            self.converter, scorer = compile_model(model, path)
+            # if there is no scorer, leave it
+            if scorer:
+                self.scorer = scorer
+
+        # tables of tokens converted to sound classes, filled on demand by
+        # lingpy.sequence.sound_classes.token2class
+        self._class_tables = {}
 
         # read information from the info-file
         self.info = {}
@@ -180,6 +184,48 @@ class Model(object):
         return self.scorer[x, y]
 
 
+class LazyModel(Model):
+    """
+    Sound-class model which is only loaded when it is used for the first time.
+
+    Parameters
+    ----------
+    model : str
+        The name of the model, see :py:class:`Model`.
+    path : str (default=None)
+        The folder from which the model is loaded.
+
+    Notes
+    -----
+    This class is used for the models stored in
+    :py:data:`lingpy.settings.rcParams`, so that importing LingPy or changing
+    the schema does not require to load all models. The name of the model is
+    available right away, while the converter, the scorer, and the model
+    information are loaded and (if needed) compiled on first access.
+
+    See also
+    --------
+    Model
+    """
+
+    def __init__(self, model, path=None):
+        self.name = model
+        self._path = path
+
+    def __getattr__(self, attr):
+        # only called for attributes which have not been set, so we load the
+        # model once and look up the attribute again
+        if attr.startswith('__') or '_path' not in self.__dict__:
+            raise AttributeError(attr)
+        self._load(self._path)
+        del self._path
+        return getattr(self, attr)
+
+    @property
+    def loaded(self):
+        return '_path' not in self.__dict__
+
+
 def load_dvt(path=''):
     """
     Function loads the default characters for IPA diacritics and IPA vowels of LingPy.
@@ -191,9 +237,8 @@ def load_dvt(path=''):
         fn = 'dvt'
 
     try:
-        dvt = cache.load(fn)
-    except:
-        compile_dvt(path)
-        dvt = cache.load(fn)
+        dvt = cache.load(fn, sources=dvt_sources(path))
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        dvt = compile_dvt(path)
 
     return dvt
@@ -4,6 +4,6 @@ Module provides methods and functions for dealing with linguistic sequences.
 """
 from __future__ import print_function, division, unicode_literals
 
-from lingpy.sequence.sound_classes import ipa2tokens, tokens2class
+from lingpy.sequence.sound_classes import ipa2tokens, tokens2class, tokens2class_many
 from lingpy.sequence.profile import simple_profile, context_profile
 from lingpy.sequence.ngrams import *
@@ -19,11 +19,15 @@ class MCBasic(object):
     seq : list
         A list of sequences. Sequences are assumed to be tokenized, i.e. they
         should be either passed as lists or as tuples.
+    rng : :py:class:`random.Random` (default=None)
+        The random number generator used to walk the chain. Defaults to the
+        global generator of Python's :py:mod:`random` module.
 
     """
 
-    def __init__(self, seqs):
+    def __init__(self, seqs, rng=None):
         self.seqs = seqs
+        self.rng = rng or random
 
         # create distribution
         self.dist = {}
@@ -41,13 +45,13 @@ class MCBasic(object):
         out = []
 
         # get the start sequence 
-        startS = random.choice(self.dist['#'])
+        startS = self.rng.choice(self.dist['#'])
 
         out += [startS]
 
         i = 0
         while True:
-            nextS = random.choice(self.dist[out[-1]])
+            nextS = self.rng.choice(self.dist[out[-1]])
 
             # check for terminal symbol
             if nextS == '$':
@@ -75,6 +79,10 @@ class MCPhon(MCBasic):
         List containing the prosodic profiles of the input sequences. If the
         list is empty, the profiles are generated automatically.
 
+    rng : :py:class:`random.Random` (default=None)
+        The random number generator used to create new strings. Defaults to
+        the global generator of Python's :py:mod:`random` module.
+
     """
 
     def __init__(
@@ -84,6 +92,7 @@ class MCPhon(MCBasic):
         prostrings=[],
         classes=False,
         class_model=rcParams['model'],
+        rng=None,
         **keywords
     ):
         setdefaults(keywords, stress=rcParams['stress'],
@@ -129,8 +138,8 @@ class MCPhon(MCBasic):
             # start appending the stuff
             self.bigrams += [bigrams]
 
-            # init the mother object
-            MCBasic.__init__(self, self.bigrams)
+        # init the mother object
+        MCBasic.__init__(self, self.bigrams, rng=rng)
 
     def get_string(self, new=True, tokens=False):
         """
@@ -12,11 +12,6 @@ from functools import partial
 
 import numpy as np
 
-try:
-    from scipy import linalg, stats
-except ImportError:
-    linalg, stats = False, False
-
 # Default probability for unobserved samples.
 _UNOBS = 1e-10
 
@@ -630,9 +625,12 @@ def sgt_dist(freqdist, **kwargs):
         distribution.
     """
 
-    # Make sure the scientific libraries have been loaded, raising an
-    # ImportError if not
-    if not linalg or not stats:
+    # Make sure the scientific libraries can be loaded, raising an
+    # ImportError if not; scipy is imported here, since it is expensive to
+    # import and only needed by this estimator
+    try:
+        from scipy import linalg, stats
+    except ImportError:
         raise ImportError('The package `scipy` is needed by SGT.')
 
     # Deal with additional arguments.
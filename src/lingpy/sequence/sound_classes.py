@@ -665,13 +665,55 @@ def token2class(token, model, stress=None, diacritics=None, cldf=None):
     stress = rcParams['stress'] or stress
     diacritics = rcParams['diacritics'] or diacritics
 
-    # change token if cldf is selected
-    if cldf:
-        token = token.split('/')[1] or '?' if '/' in token else token
+    model, table = _class_table(model, stress, diacritics, cldf)
+    try:
+        return table[token]
+    except KeyError:
+        return _lookup_class(token, model, table, stress, diacritics, cldf)
+
+
+# maximal number of tokens for which the sound classes are stored per model
+_CLASS_TABLE_SIZE = 2 ** 16
+
 
+def _class_table(model, stress, diacritics, cldf):
+    """
+    Return the model along with its table of tokens converted to sound classes.
+
+    Notes
+    -----
+    The tables are stored with the model, separately for each combination of
+    stress symbols, diacritics, and the cldf flag, since these determine how
+    unknown tokens are resolved.
+    """
     # check whether model is passed as real model or as string
-    if str(model) == model:
+    if isinstance(model, str):
         model = rcParams[model]
+    try:
+        tables = model._class_tables
+    except AttributeError:
+        # models without tables (e.g., plain dictionaries) are not memoized
+        return model, {}
+    try:
+        return model, tables[stress, diacritics, cldf]
+    except KeyError:
+        return model, tables.setdefault((stress, diacritics, cldf), {})
+
+
+def _lookup_class(token, model, table, stress, diacritics, cldf):
+    """
+    Convert a token which is not yet in the table and store the result.
+    """
+    if len(table) >= _CLASS_TABLE_SIZE:
+        table.clear()
+    table[token] = _token2class(token, model, stress, diacritics, cldf)
+    return table[token]
+
+
+def _token2class(token, model, stress, diacritics, cldf):
+    # change token if cldf is selected
+    if cldf:
+        token = token.split('/')[1] or '?' if '/' in token else token
 
     try:
         return model[token]
@@ -784,15 +826,70 @@ def tokens2class(tokens, model, stress=None, diacritics=None, cldf=True):
     stress=rcParams['stress']
     diacritics=rcParams['diacritics']
 
-    out = []
-    for token in tokens:
-        out.append(token2class(token, model, stress=stress,
-            diacritics=diacritics, cldf=cldf))
+    model, table = _class_table(model, stress, diacritics, cldf)
+    out = [table[token] if token in table else _lookup_class(
+        token, model, table, stress, diacritics, cldf) for token in tokens]
     if out.count('0') == len(out):
         raise ValueError("[!] your sequence contains only unknown characters")
     return out
 
 
+def tokens2class_many(sequences, model, stress=None, diacritics=None, cldf=True):
+    """
+    Convert many tokenized IPA strings into their respective class strings.
+
+    Parameters
+    ----------
+
+    sequences : iterable
+        An iterable of lists of tokens.
+
+    model : :py:class:`~lingpy.data.model.Model`
+        A :py:class:`~lingpy.data.model.Model` object.
+
+    stress, diacritics, cldf
+        See :py:func:`tokens2class`.
+
+    Returns
+    -------
+
+    classes : list
+        A list with the sound-class representation of each sequence.
+
+    Notes
+    -----
+    The function yields the same results as calling :py:func:`tokens2class`
+    on each sequence, but resolves the model and its table of converted
+    tokens only once, which pays off for large numbers of short sequences.
+
+    Examples
+    --------
+    >>> from lingpy.sequence.sound_classes import tokens2class_many
+    >>> tokens2class_many([['t', 'o', 'x'], ['h', 'a', 'n', 't']], 'sca')
+    [['T', 'U', 'G'], ['H', 'A', 'N', 'T']]
+
+    See also
+    --------
+    tokens2class
+
+    """
+    stress = rcParams['stress']
+    diacritics = rcParams['diacritics']
+    model, table = _class_table(model, stress, diacritics, cldf)
+
+    out = []
+    for tokens in sequences:
+        if not isinstance(tokens, (tuple, list)):
+            raise ValueError("[!] Need tuple or list as input.")
+        classes = [table[token] if token in table else _lookup_class(
+            token, model, table, stress, diacritics, cldf) for token in tokens]
+        if classes.count('0') == len(classes):
+            raise ValueError(
+                "[!] your sequence contains only unknown characters")
+        out.append(classes)
+    return out
+
+
 def prosodic_string(string, _output=True, **keywords):
     """
     Create a prosodic string of the sonority profile of a sequence.
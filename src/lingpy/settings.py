@@ -2,7 +2,7 @@
 Module handels all global parameters used in a LingPy session.
 """
 from lingpy._settings import rcParams
-from lingpy.data.model import Model, load_dvt
+from lingpy.data.model import LazyModel, load_dvt
 
 # load diacritics, vowels, tones
 diacritics, vowels, tones = load_dvt()
@@ -88,17 +88,17 @@ alignments = dict(
 rcParams.update(alignments)
 
 # dictionary stores basic parameters that are used during a LingPy session
+# sound-class models are only loaded when they are used for the first time
 rcParamsUpd = dict(
     schema='qlc',
-    asjp=Model('asjp'),
-    sca=Model('sca'),
-    dolgo=Model('dolgo'),
-    _color=Model('color'),
-    art=Model('art'),
-    cv=Model('cv'),
-    jaeger=Model('jaeger'),
+    asjp=LazyModel('asjp'),
+    sca=LazyModel('sca'),
+    dolgo=LazyModel('dolgo'),
+    _color=LazyModel('color'),
+    art=LazyModel('art'),
+    cv=LazyModel('cv'),
+    jaeger=LazyModel('jaeger'),
     diacritics=diacritics,
-    model=Model('sca'),
     vowels=vowels,
     tones=tones,
     figsize=(10, 10),
@@ -126,6 +126,7 @@ rcParamsUpd = dict(
     word_separator="_",
     word_separators="_#",
 )
+rcParamsUpd['model'] = rcParamsUpd['sca']
 rcParams.update(rcParamsUpd)
 
 # define aliases for parameters
@@ -200,15 +201,15 @@ def rc(rval=None, rcParams_=None, **keywords):
     for key in keywords:
         if key == "schema":
             if keywords[key] in ["qlc", 'ipa']:
-                diacritics, vowels, tones = ('!:|¯ʰʱʲʳʴʵʶʷʸʹʺʻʼʽʾʿˀˀ ˁ˂˃˄˅ˆˈˉˊˋˌˍˎˏːˑ˒˓˔˕˖˗˞˟ˠˡˢˣˤˬ˭ˮ˯˰˱˲˳˴˵˶˷˸˹˺˻˼˽˾˿̀́̂̃̄̅̆̇̈̉̊̋̌̍̎̏̐̑̒ՙٰܑٖ߲߫߬߭߮߯߰߱߳ᴬᴭᴮᴯᴰᴱᴲᴳᴴᴵᴶᴷᴸᴹᴺᴻᴼᴽᴾᴿᵀᵁᵂᵃᵄᵅᵆᵇᵈᵉᵊᵋᵌᵍᵎᵏᵐᵑᵒᵓᵔᵕᵖᵗᵘᵙᵚᵛᵜᵝᵞᵟᵠᵡᵢᵣᵤᵥᵦᵧᵨᵩᵪᵸᶛᶜᶝᶞᶟᶠᶡᶢᶣᶤᶥᶦᶧᶨᶩᶪᶫᶬᶭᶮᶯᶰᶱᶲᶳᶴᶵᶶᶷᶸᶹᶺᶻᶼᶽᶾᶿ᷎᷂᷊᷏᷀᷁᷃᷄᷅᷆᷇᷈᷉᷋᷌ᷓᷔᷕ᷍ⁱ⁺⁻⁼⁽⁾ⁿ₊₋₌₍₎ₐₑₒₓₔₕₖₗₘₙₚₛₜ⃒⃓⃘⃙⃚⃥⃦⃪⃨⃐⃑⃔⃕⃖⃗⃛⃜⃧⃩→⇒⨧ⱼⱽⵯⷠⷡⷢⷣⷤⷥⷦⷧⷨⷩⷪⷫⷬⷭⷮⷯⷰⷱⷲꚜꚝꜛꜜꜝꜞꜟꞈ꞉꞊꣠꣡꣢꣣꣤꣥꣦꣧꣨꣩꣪꣫꣬꣭꣮꣯꣰꣱ꩰꭜꭞ︠︡︢︣︤︥︦\uf1af̲', 'ṍʯεaeiouyáãæíõøúĩıœũūǒǝȇȗɐɑɒɔɘəɚɛɜɞɤɨɪɯɵɶɷɿʅʉʊʌʏᴀᴇᴜẽỹṳ', '¹²³⁴⁵⁶⁷⁸⁹⁰₁₂₃₄₅₆₇₈₉₀0123456789˥˦˧˨˩˪˫-꜈-꜉-꜊-꜋-꜌-꜍-꜎-꜏-꜐-꜑-꜒-꜓-꜔-꜕-꜖-ꜗ-ꜘ-ꜙ-ꜚ-꜀-꜁-꜂-꜃-꜄-꜅-꜆-꜇')
-                rcParams_['asjp'] = Model('asjp')
-                rcParams_['sca'] = Model('sca')
-                rcParams_['dolgo'] = Model('dolgo')
-                rcParams_['art'] = Model('art')
+                diacritics, vowels, tones = load_dvt()
+                rcParams_['asjp'] = LazyModel('asjp')
+                rcParams_['sca'] = LazyModel('sca')
+                rcParams_['dolgo'] = LazyModel('dolgo')
+                rcParams_['art'] = LazyModel('art')
                 rcParams_['diacritics'] = diacritics
                 rcParams_['vowels'] = vowels
                 rcParams_['tones'] = tones
-                rcParams_['_color'] = Model('color')
+                rcParams_['_color'] = LazyModel('color')
                 rcParams_['combiners'] = '\u0361\u035c'
                 rcParams_['breaks'] = '.-'
                 rcParams_['stress'] = "ˈˌ'"
@@ -216,19 +217,19 @@ def rc(rval=None, rcParams_=None, **keywords):
                 rcParams_['basic_orthography'] = 'fuzzy'
 
                 # reset basic model to sca
-                rcParams_['model'] = rcParams['sca']
+                rcParams_['model'] = rcParams_['sca']
 
             elif keywords[key] in ['evolaemp', 'el', 'asjp']:
-                diacritics, vowels, tones = ('*"', 'aeiou3E', '¹²³⁴⁵⁶⁰₁₂₃₄₅₆₀012456789⁻')
-                rcParams_['asjp'] = Model('asjp_el')
-                rcParams_['sca'] = Model('sca_el')
-                rcParams_['dolgo'] = Model('dolgo_el')
-                rcParams_['art'] = Model('art_el')
-                rcParams_['jaeger'] = Model('jaeger_el')
+                diacritics, vowels, tones = load_dvt('el')
+                rcParams_['asjp'] = LazyModel('asjp_el')
+                rcParams_['sca'] = LazyModel('sca_el')
+                rcParams_['dolgo'] = LazyModel('dolgo_el')
+                rcParams_['art'] = LazyModel('art_el')
+                rcParams_['jaeger'] = LazyModel('jaeger_el')
                 rcParams_['diacritics'] = diacritics
                 rcParams_['vowels'] = vowels
                 rcParams_['tones'] = tones
-                rcParams_['_color'] = Model('color_el')
+                rcParams_['_color'] = LazyModel('color_el')
                 rcParams_['combiners'] = '\u0361\u035c'
                 rcParams_['breaks'] = '.-'
                 rcParams_['stress'] = "ˈˌ'"
@@ -236,7 +237,7 @@ def rc(rval=None, rcParams_=None, **keywords):
                 rcParams_['basic_orthography'] = 'asjp'
 
                 # reset the basic model to the asjp model
-                rcParams_['model'] = rcParams['asjp']
+                rcParams_['model'] = rcParams_['asjp']
 
         if key in alias:
             rcParams_[alias[key]] = keywords[key]
@@ -73,6 +73,102 @@ class TreeError(Exception):
     pass
 
 
+class TreeNodeIndex(object):
+    """Index of the nodes of a tree for constant-time queries.
+
+    Notes
+    -----
+    The index is created with TreeNode.buildIndex and shared by all nodes of
+    the tree. It stores the nodes in preorder, so the descendants of a node
+    are a contiguous slice of the nodes, a dictionary of the node names, the
+    tips below each node, and an Euler tour of the tree with a sparse table of
+    its minimal depths, which yields the lowest common ancestor of two nodes
+    in constant time. Mutating the tree marks the index as invalid, and it is
+    built anew when it is used the next time.
+    """
+    def __init__(self, root):
+        self.valid = True
+        self.nodes = list(root.preorder())
+        self.position = dict((node, i) for i, node in enumerate(self.nodes))
+        self.names = {}
+        for i, node in enumerate(self.nodes):
+            self.names.setdefault(node.Name, i)
+
+        # the end of each subtree in preorder, the depth of each node, and
+        # the tips in preorder with the slice of the tips below each node
+        size = len(self.nodes)
+        self.end = [0] * size
+        self.depth = [0] * size
+        for i, node in enumerate(self.nodes):
+            for child in node.Children:
+                self.depth[self.position[child]] = self.depth[i] + 1
+        self.tips = []
+        self.tip_start = [0] * size
+        self.tip_end = [0] * size
+        for i in range(size - 1, -1, -1):
+            children = self.nodes[i].Children
+            if children:
+                last = self.position[children[-1]]
+                self.end[i] = self.end[last]
+            else:
+                self.end[i] = i + 1
+        for i, node in enumerate(self.nodes):
+            self.tip_start[i] = len(self.tips)
+            if not node.Children:
+                self.tips.append(node)
+        for i in range(size):
+            # the last node of a subtree in preorder is always a tip
+            self.tip_end[i] = self.tip_start[self.end[i] - 1] + 1
+
+        # the Euler tour of the tree and the sparse table of its minima
+        self.euler, self.first = [], [0] * size
+        stack = [(0, 0)]
+        while stack:
+            i, k = stack.pop()
+            if k == 0:
+                self.first[i] = len(self.euler)
+            self.euler.append(i)
+            children = self.nodes[i].Children
+            if k < len(children):
+                stack.append((i, k + 1))
+                stack.append((self.position[children[k]], 0))
+        depth = self.depth
+        self.table = [self.euler]
+        width = 1
+        while 2 * width <= len(self.euler):
+            prev = self.table[-1]
+            self.table.append([
+                a if depth[a] <= depth[b] else b
+                for a, b in zip(prev, prev[width:])])
+            width *= 2
+
+    def contains(self, node, i):
+        """Returns True if the node with position i descends from node."""
+        j = self.position[node]
+        return j <= i < self.end[j]
+
+    def find(self, node, name):
+        """Returns the node with the name below node, or None if not indexed.
+        """
+        i = self.names.get(name)
+        if i is not None and self.nodes[i].Name == name and \
+                self.contains(node, i):
+            return self.nodes[i]
+        return None
+
+    def lca(self, i, j):
+        """Returns the position of the lowest common ancestor of i and j."""
+        left, right = sorted([self.first[i], self.first[j]])
+        k = (right - left + 1).bit_length() - 1
+        a, b = self.table[k][left], self.table[k][right - (1 << k) + 1]
+        return a if self.depth[a] <= self.depth[b] else b
+
+    def tipNodes(self, node):
+        """Returns the tips below node in preorder."""
+        i = self.position[node]
+        return self.tips[self.tip_start[i]:self.tip_end[i]]
+
+
 class TreeNode(object):
     """Store information about a tree node. Mutable.
     
@@ -82,7 +178,8 @@ class TreeNode(object):
         Params: dict containing arbitrary parameters for the node.
         NameLoaded: ?
     """
-    _exclude_from_copy = dict.fromkeys(['_parent','Children'])
+    _exclude_from_copy = dict.fromkeys(['_parent','Children','_index'])
+    _index = None
     
     def __init__(
             self, Name=None, Children=None, Parent=None, Params=None, NameLoaded=True, **kwargs):
@@ -140,7 +237,9 @@ class TreeNode(object):
         Cleans up refs from i's original parent, but doesn't give self ref to i.
         """
         c = self.__class__
+        self._invalidateIndex()
         if isinstance(i, c):
+            i._invalidateIndex()
             if i._parent not in (None, self):
                 i._parent.Children.remove(i)
         else:
@@ -164,6 +263,7 @@ class TreeNode(object):
         """Returns and deletes child of self at index (default: -1)"""
         result = self.Children.pop(index)
         result._parent = None
+        self._invalidateIndex()
         return result
     
     def remove(self, target):
@@ -186,6 +286,7 @@ class TreeNode(object):
     
     def __setitem__(self, i, val):
         """Node[i] = x sets the corresponding item in Children."""
+        self._invalidateIndex()
         curr = self.Children[i]
         if isinstance(i, slice):
             for c in curr:
@@ -199,6 +300,7 @@ class TreeNode(object):
     
     def __delitem__(self, i):
         """del node[i] deletes index or slice from self.Children."""
+        self._invalidateIndex()
         curr = self.Children[i]
         if isinstance(i, slice):
             for c in curr:
@@ -286,6 +388,9 @@ class TreeNode(object):
     
     def _set_parent(self, Parent):
         """Mutator for parent: cleans up refs in old parent."""
+        self._invalidateIndex()
+        if Parent is not None:
+            Parent._invalidateIndex()
         if self._parent is not None:
             self._parent.removeNode(self)
         self._parent = Parent
@@ -294,6 +399,38 @@ class TreeNode(object):
     
     Parent = property(_get_parent, _set_parent)
     
+    #support for indexed queries
+    def buildIndex(self):
+        """Indexes the tree of self for fast queries and returns the index.
+
+        Notes
+        -----
+        Once a tree is indexed, tips, names and lowest common ancestors are
+        looked up in the index (see TreeNodeIndex) instead of traversing the
+        tree. Changes to the topology of the tree through the methods of the
+        nodes invalidate the index, which is then rebuilt when it is needed.
+        """
+        index = TreeNodeIndex(self.root())
+        for node in index.nodes:
+            node._index = index
+        return index
+
+    def clearIndex(self):
+        """Removes the index from all nodes of the tree of self."""
+        for node in self.root().traverse():
+            node.__dict__.pop('_index', None)
+
+    def _invalidateIndex(self):
+        if self._index is not None:
+            self._index.valid = False
+
+    def _getIndex(self):
+        """Returns the index of the tree of self, or None if not indexed."""
+        index = self._index
+        if index is not None and not index.valid:
+            index = self.buildIndex()
+        return index
+
     def indexInParent(self):
         """Returns index of self in parent."""
         return self._parent.Children.index(self)
@@ -536,6 +673,10 @@ class TreeNode(object):
                 return 
             except:
                 raise StopIteration
+        index = self._getIndex()
+        if index is not None:
+            yield from index.tipNodes(self)
+            return
         #use stack-based method: robust to large trees
         stack = [self]
         while stack:
@@ -607,6 +748,10 @@ class TreeNode(object):
         
         Always tests by identity.
         """
+        index = self._getIndex()
+        if index is not None and other._getIndex() is index:
+            return index.nodes[index.lca(
+                index.position[self], index.position[other])]
         my_lineage = set([str(node) for node in [self] + self.ancestors()])
         curr = other
         while curr is not None:
@@ -618,49 +763,54 @@ class TreeNode(object):
     def lowestCommonAncestor(self, tipnames):
         """Lowest common ancestor for a list of tipnames
 
-        This should be around O(H sqrt(n)), where H is height and n is the
-        number of tips passed in.
+        Notes
+        -----
+        Only the tips below self are considered, and None is returned if none
+        of the names matches one of them. If only one of several names matches
+        a tip, the parent of the tip is returned. If the tree is indexed (see
+        buildIndex), the ancestor is found in time linear in the number of
+        tips passed, otherwise in O(H n), where H is the height of the tree
+        and n is the number of tips passed.
         """
         if len(tipnames) == 1:
             return self.getNodeMatchingName(tipnames[0])
 
         tipnames = set(tipnames)
-        tips = [tip for tip in self.tips() if tip.Name in tipnames]
+        index = self._getIndex()
+        if index is not None and self.Children:
+            nodes = [index.find(self, name) for name in tipnames]
+            if None in nodes:
+                nodes = [tip for tip in index.tipNodes(self) if tip.Name in tipnames]
+            positions = [index.position[node] for node in nodes if not node.Children]
+            if not positions:
+                return None
+            if len(positions) == 1:
+                return index.nodes[positions[0]]._parent
+            return index.nodes[index.lca(
+                min(positions, key=index.first.__getitem__),
+                max(positions, key=index.first.__getitem__))]
 
-        if len(tips) == 0:
+        tips = [tip for tip in self.tips() if tip.Name in tipnames]
+        if not tips:
             return None
-
-        for t in tips:
-            prev = t
-            curr = t.Parent
-
-            while curr and not hasattr(curr,'black'):
-                setattr(curr,'black',[prev])
-                prev = curr
-                curr = curr.Parent
-
-            # increase black count, multiple children lead to here
-            if curr:
-                curr.black.append(prev)
-                
-        curr = self
-        while len(curr.black) == 1:
-            
-            # curr = curr.black[0]
-            # changed above statement in order to check for missing attribute
-            # in lower node JML
-            currX = curr.black[0]
-            if not hasattr(currX,'black'): return curr
-            else: curr = currX
-
-        # clear all black attributes from the tree, added by JML
-        for n,t in self.getNodesDict().items():
-            try:
-                delattr(t,'black')
-            except:
-                pass
-
-        return curr
+        if len(tips) == 1:
+            return tips[0]._parent
+
+        # climb from the first tip to self, and from all other tips to the
+        # first node on this lineage
+        lineage = [tips[0]]
+        while lineage[-1] is not self and lineage[-1]._parent is not None:
+            lineage.append(lineage[-1]._parent)
+        rank = dict((node, i) for i, node in enumerate(lineage))
+        top = 0
+        for tip in tips[1:]:
+            curr = tip
+            while curr not in rank:
+                curr = curr._parent
+            top = max(top, rank[curr])
+        if top == len(lineage) - 1:
+            return self
+        return lineage[top]
 
     lca = lastCommonAncestor #for convenience
     
@@ -777,6 +927,7 @@ class TreeNode(object):
         
         Internal nodes are often unnamed and so this function assigns a
         value for referencing."""
+        self._invalidateIndex()
         #make a list of the names that are already in the tree
         names_in_use = []
         for node in self.traverse():
@@ -1381,7 +1532,11 @@ class TreeNode(object):
         be listed in the natural traverse order.
         """
         if tipsonly:
-            nodes = self.traverse(self_before=False, self_after=False)
+            index = self._getIndex()
+            if index is not None:
+                nodes = index.tipNodes(self)
+            else:
+                nodes = self.traverse(self_before=False, self_after=False)
         else:
             nodes = list(self.traverse())
             if not includeself:
@@ -1407,7 +1562,10 @@ class TreeNode(object):
         return None
     
     def getNodeMatchingName(self, name):
-        node = self._getNodeMatchingName(name)
+        index = self._getIndex()
+        node = index.find(self, name) if index is not None else None
+        if node is None:
+            node = self._getNodeMatchingName(name)
         if node is None:  # pragma: no cover
             raise TreeError("No node named '%s' in %s" % (name, self.getTipNames()))
         return node
@@ -1456,6 +1614,7 @@ class TreeNode(object):
         mapping : dict, old_name -> new_name
         nodes : specific nodes for renaming (such as just tips, etc...)
         """
+        self._invalidateIndex()
         if nodes is None:
             nodes = self.traverse()
 
@@ -1552,6 +1711,17 @@ class PhyloNode(TreeNode):
         #never any length between self and other
         if self is other:
             return 0
+        index = self._getIndex()
+        if index is not None and other._getIndex() is index:
+            lca = index.nodes[index.lca(
+                index.position[self], index.position[other])]
+            count = 0
+            for curr in (self, other):
+                while curr is not lca:
+                    if curr.Length:
+                        count += curr.Length
+                    curr = curr._parent
+            return count
         #otherwise, find self's ancestors and find the first ancestor of
         #other that is in the list
         self_anc = self.ancestors()
@@ -5,6 +5,7 @@ import unicodedata
 import logging
 from tempfile import NamedTemporaryFile
 from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import itertools
 import types
 from pathlib import Path
@@ -218,6 +219,48 @@ def identity(x):
     return x
 
 
+def parallel_map(function, iterable, processes=1, executor=None):
+    """
+    Apply a function to all items of an iterable, optionally in parallel.
+
+    Parameters
+    ----------
+    function : callable
+        The function to apply. When working with a process pool, this must be
+        a module-level function, and items and results must be picklable.
+    iterable : iterable
+        The items to which the function is applied.
+    processes : int (default=1)
+        The number of worker processes. If set to 1, the items are processed
+        serially in the current process, if set to None, all available cores
+        are used.
+    executor : :py:class:`concurrent.futures.Executor` (default=None)
+        An existing executor, e.g. a process or thread pool, which shall be
+        used instead of a new process pool.
+
+    Returns
+    -------
+    results : iterator
+        The results, in the order of the items passed.
+
+    Notes
+    -----
+    Items are sent to process pools in chunks. Objects which are shared by
+    all items of a chunk are thus only pickled once per chunk.
+    """
+    if executor is None and processes == 1:
+        yield from map(function, iterable)
+        return
+    items = list(iterable)
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            yield from parallel_map(function, items, executor=pool)
+        return
+    workers = getattr(executor, '_max_workers', None) or 1
+    yield from executor.map(
+        function, items, chunksize=max(1, len(items) // (4 * workers)))
+
+
 def nexus_slug(s):
     """
     Converts a string to a nexus "safe" representation (i.e. removes
@@ -1,11 +1,12 @@
 import os
+from random import Random
 
 import pytest
 
 
 from lingpy.algorithm.clustering import best_threshold, check_taxon_names, \
     find_threshold, flat_cluster, link_clustering, matrix2groups, matrix2tree, \
-    neighbor, partition_density, upgma
+    mcl, neighbor, partition_density, upgma
 
 
 @pytest.fixture
@@ -42,6 +43,34 @@ def test_neighbor(matrix, taxa):
         neighbor([[0, 1], [1, 0]], ['Eng:lish', 'Ger)man'])
 
 
+def test_tree_ties():
+    matrix = [
+        [0.0, 0.2, 0.2, 0.5, 0.7],
+        [0.2, 0.0, 0.2, 0.5, 0.7],
+        [0.2, 0.2, 0.0, 0.6, 0.6],
+        [0.5, 0.5, 0.6, 0.0, 0.2],
+        [0.7, 0.7, 0.6, 0.2, 0.0]]
+    taxa = ['a', 'b', 'c', 'd', 'e']
+    assert upgma(matrix, taxa) == \
+        '((c:0.10,(a:0.10,b:0.10):0.00):0.20,(d:0.10,e:0.10):0.20);'
+    assert neighbor(matrix, taxa) == \
+        '(((a:0.10,b:0.10):0.00,c:0.10):0.20,(d:0.03,e:0.17):0.20);'
+    assert upgma([[0]], ['a']) == neighbor([[0]], ['a']) == 'a;'
+
+
+def test_tree_large():
+    random = Random(1234)
+    points = [(random.random(), random.random()) for i in range(1100)]
+    matrix = [[((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 for x2, y2 in points]
+              for x1, y1 in points]
+    taxa = ['t{0}'.format(i) for i in range(len(points))]
+    for algorithm in [upgma, neighbor]:
+        tree = algorithm(matrix, taxa, distances=False)
+        assert tree.count('(') == len(taxa) - 1
+        assert sorted(tree.strip('();').replace('(', '').replace(
+            ')', '').split(',')) == sorted(taxa)
+
+
 def test_fuzzy(matrix, taxa):
     from lingpy.algorithm.clustering import fuzzy
     for method in 'upgma simple complete'.split():
@@ -105,3 +134,49 @@ def test_flat_cluster(matrix, taxa):
         flat_cluster(method, 0.5, matrix, taxa, revert=True)
         flat_cluster(method, 0.5, matrix, taxa, revert=False)
         flat_cluster(method, 0.5, matrix, False, revert=False)
+
+
+def test_flat_cluster_ties():
+    from lingpy.algorithm.cython._cluster import _flat_upgma
+
+    matrix = [
+        [0.0, 0.2, 0.2, 0.5, 0.7],
+        [0.2, 0.0, 0.2, 0.5, 0.7],
+        [0.2, 0.2, 0.0, 0.6, 0.6],
+        [0.5, 0.5, 0.6, 0.0, 0.2],
+        [0.7, 0.7, 0.6, 0.2, 0.0]]
+    for method in ['upgma', 'complete']:
+        assert flat_cluster(method, 0.55, matrix) == {
+            0: [0, 1, 2], 3: [3, 4]}
+    assert flat_cluster('single', 0.55, matrix) == {0: [0, 1, 2, 3, 4]}
+    assert flat_cluster('upgma', 0.1, matrix, revert=True) == {
+        i: i + 1 for i in range(5)}
+
+    clusters = {4: [0], 2: [3, 1], 7: [2], 1: [4]}
+    _flat_upgma(clusters, matrix, 0.45)
+    assert list(clusters.items()) == [(4, [0, 2, 3, 1]), (1, [4])]
+
+
+def test_mcl(matrix, taxa):
+    def partition(clusters):
+        return sorted(sorted(cluster) for cluster in clusters.values())
+
+    clusters = partition(mcl(0.5, [row[:] for row in matrix], taxa))
+    assert clusters == [['Dutch', 'English', 'German'], ['Icelandic', 'Swedish']]
+    assert mcl(0.5, [row[:] for row in matrix], taxa, revert=True) == \
+        {0: 1, 1: 2, 2: 2, 3: 1, 4: 1}
+    assert partition(mcl(0.5, [row[:] for row in matrix], taxa,
+                         prune=1e-5)) == clusters
+    assert mcl(0.5, [row[:] for row in matrix], taxa,
+               logs=lambda x: 1 - x, add_self_loops=lambda x: 1)
+
+    similarities = [[1 - cell for cell in row] for row in matrix]
+    assert partition(mcl(0.5, similarities, taxa, matrix_type='similarities',
+                         logs=False)) == clusters
+    with pytest.raises(ValueError):
+        mcl(0.5, [row[:] for row in matrix], taxa, matrix_type='ranks')
+
+    pytest.importorskip('scipy')
+    for prune in [0, 1e-5]:
+        assert partition(mcl(0.5, [row[:] for row in matrix], taxa,
+                             sparse=True, prune=prune)) == clusters
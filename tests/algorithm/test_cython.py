@@ -1,6 +1,17 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
-from lingpy.algorithm.cython import _talign, _calign, _malign
+import pathlib
+import pickle
+import subprocess
+import sys
+
+import lingpy
+from lingpy.algorithm.cython import _talign, _calign, _malign, _misc
+
+try:
+    from lingpy.algorithm.cython import calign, misc
+except ImportError:  # pragma: no cover
+    calign, misc = None, None
 
 
 class Tests(TestCase):
@@ -399,3 +410,133 @@ class Tests(TestCase):
                                      mode, '1')
             assert corr1[0]['b', 'b'] == 2
             assert corr2[0]['a', 'a'] == 2
+
+    def test_pair_distances(self):
+        seqs = [self.seqA, self.seqB, self.seqA2, self.seqB2, ['c']]
+        gops = [self.weightA, self.weightB, self.weightA2, self.weightB2, [1]]
+        pros = [self.proA, self.proB, self.proA2, self.proB2, 'a']
+        pairs = [(0, 1), (2, 3), (1, 2), (3, 0)]
+        scorer = dict(self.scorer)
+        scorer['c', 'c'] = 0
+        for mode in ['global', 'local', 'dialign', 'overlap']:
+            distances = _calign.pair_distances(
+                seqs, gops, pros, pairs + [(4, 4)], self.gop, self.scale,
+                self.factor, scorer, mode, '1')
+            assert distances[-1] is None
+            sims = [sum((1 + self.factor) * scorer[c, c] for c in seq)
+                    for seq in seqs]
+            assert _calign.pair_distances(
+                seqs, gops, pros, pairs + [(4, 4)], self.gop, self.scale,
+                self.factor, scorer, mode, '1', None, sims) == distances
+            for (i, j), d in zip(pairs, distances):
+                assert d == _calign.align_pair(
+                    seqs[i], seqs[j], gops[i], gops[j], pros[i], pros[j],
+                    self.gop, self.scale, self.factor, self.scorer, mode, '1',
+                    1)[2]
+
+            # gap opening penalties depending on the group of the other
+            # sequence
+            distances = _calign.pair_distances(
+                seqs[:2], [{'x': self.weightA, 'y': self.gopA},
+                           {'x': self.weightB, 'y': self.gopB}],
+                pros[:2], [(0, 1)], self.gop, self.scale, self.factor,
+                self.scorer, mode, '1', ['x', 'y'])
+            assert distances[0] == _calign.align_pair(
+                self.seqA, self.seqB, self.gopA, self.weightB, self.proA,
+                self.proB, self.gop, self.scale, self.factor, self.scorer,
+                mode, '1', 1)[2]
+
+
+@skipUnless(calign, 'compiled alignment kernels are not built')
+class TestCompiledCalign(TestCase):
+    """Make sure the compiled kernels behave exactly like the Python ones."""
+    setUp = Tests.setUp
+
+    def _compare(self, name, *args):
+        assert getattr(calign, name)(*args) == getattr(_calign, name)(*args)
+
+    def test_kernels(self):
+        for a, b, ga, gb, pa, pb in [
+                (self.seqA, self.seqB, self.gopA, self.gopB, self.proA, self.proB),
+                (self.seqB, self.seqA, self.gopB, self.gopA, self.proB, self.proA)]:
+            for name in ['globalign', 'semi_globalign', 'localign']:
+                self._compare(
+                    name, a, b, ga, gb, pa, pb, len(a), len(b), self.scale,
+                    self.factor, self.scorer)
+            self._compare(
+                'dialign', a, b, pa, pb, len(a), len(b), self.scale,
+                self.factor, self.scorer)
+
+        for name in ['secondary_globalign', 'secondary_semi_globalign',
+                     'secondary_localign']:
+            self._compare(
+                name, self.seqA2, self.seqB2, self.gopA2, self.gopB2,
+                self.proA2, self.proB2, len(self.seqA2), len(self.seqB2),
+                self.scale, self.factor, self.scorer, '1')
+        self._compare(
+            'secondary_dialign', self.seqA2, self.seqB2, self.proA2,
+            self.proB2, len(self.seqA2), len(self.seqB2), self.scale,
+            self.factor, self.scorer, '1')
+
+    def test_align_pairs(self):
+        for mode in ['global', 'overlap', 'local', 'dialign']:
+            self._compare(
+                'align_pairs', [[self.seqA, self.seqB], [self.seqA2, self.seqB2]],
+                [[self.weightA, self.weightB], [self.weightA2, self.weightB2]],
+                [[self.proA, self.proB], [self.proA2, self.proB2]], self.gop,
+                self.scale, self.factor, self.scorer, mode, '1', 1)
+            self._compare(
+                'corrdist', 10.0, [[self.seqA2, self.seqB2]],
+                [[self.weightA2, self.weightB2]], [[self.proA2, self.proB2]],
+                self.gop, self.scale, self.factor, self.scorer, mode, '1')
+
+    def test_pair_distances(self):
+        for mode in ['global', 'overlap', 'local', 'dialign']:
+            self._compare(
+                'pair_distances', [self.seqA, self.seqB, self.seqA2, self.seqB2],
+                [self.weightA, self.weightB, self.weightA2, self.weightB2],
+                [self.proA, self.proB, self.proA2, self.proB2],
+                [(0, 1), (2, 3), (1, 2)], self.gop, self.scale, self.factor,
+                self.scorer, mode, '1')
+
+    def test_score_dict(self):
+        chars = ['a', 'b', '1']
+        matrix = [[self.scorer[a, b] for b in chars] for a in chars]
+        scorer = misc.ScoreDict(chars, [list(row) for row in matrix])
+        py_scorer = _misc.ScoreDict(chars, [list(row) for row in matrix])
+        for a in chars + ['X']:
+            for b in chars:
+                assert scorer[a, b] == py_scorer[a, b]
+        scorer['a', 'b'] = 0.5
+        assert scorer['b', 'a'] == 0.5
+
+        # pickled scorers are rebuilt with the scorer class in use
+        restored = pickle.loads(pickle.dumps(scorer))
+        assert isinstance(restored, misc.ScoreDict)
+        assert restored['b', 'a'] == 0.5
+        assert restored.chars2int == scorer.chars2int
+
+        self._compare(
+            'align_pair', self.seqA, self.seqB, self.weightA, self.weightB,
+            self.proA, self.proB, self.gop, self.scale, self.factor, scorer,
+            'global', '1', 1)
+
+
+def test_pure_python_fallback():
+    # lingpy is importable and uses the pure-Python modules if the compiled
+    # modules are missing
+    script = '\n'.join([
+        'import sys',
+        "sys.modules['lingpy.algorithm.cython.calign'] = None",
+        "sys.modules['lingpy.algorithm.cython.misc'] = None",
+        'import pickle',
+        'from lingpy import rc',
+        'from lingpy.algorithm import calign, misc',
+        "assert calign.__name__.endswith('_calign')",
+        "assert misc.__name__.endswith('_misc') and not rc('cmodules')",
+        "scorer = pickle.loads(pickle.dumps(misc.ScoreDict(['a'], [[1]])))",
+        "assert scorer['a', 'a'] == 1",
+    ])
+    subprocess.run(
+        [sys.executable, '-c', script], check=True,
+        cwd=str(pathlib.Path(lingpy.__file__).parent.parent))
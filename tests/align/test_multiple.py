@@ -41,6 +41,18 @@ def test_lib_align(msa):
     assert msa.alm_matrix[0] == list('w-aldemar-')
 
 
+def test_lib_align_anchors(msa, seqs):
+    msa.lib_align(anchors=1)
+    assert len(msa.library) == len(msa._residues) ** 2
+    assert msa.library['1.1', '2.1'] == msa._library[0, 8]
+    assert msa.alm_matrix[0] == list('w-aldemar-')
+
+    other = Multiple(seqs)
+    other.lib_align(anchors=3)
+    msa.lib_align()
+    assert other.library == msa.library
+
+
 def test_get_pid(msa):
     msa.prog_align()
     pid = int(msa.get_pid() * 100)
@@ -1,6 +1,7 @@
 """
 Test the SCA module.
 """
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 
 import pytest
@@ -84,6 +85,27 @@ def test_align(alm):
         assert msa_a == msa_b
 
 
+def test_align_parallel(alm):
+    alignments = alm.get_entries('alignment')
+    alm.align(processes=2)
+    assert alm.get_entries('alignment') == alignments
+    with ThreadPoolExecutor(2) as executor:
+        alm.align(method='library', alignment='alignment2', executor=executor)
+    alm.align(method='library', alignment='alignment3')
+    assert alm.get_entries('alignment2') == alm.get_entries('alignment3')
+
+
+def test_snapshot(alm, tmp_path):
+    alm.save_snapshot(str(tmp_path / 'alm.snapshot'))
+    alm2 = Alignments.from_snapshot(str(tmp_path / 'alm.snapshot'))
+    assert isinstance(alm2, Alignments)
+    assert alm2.msa == alm.msa
+    assert alm2.get_entries('alignment') == alm.get_entries('alignment')
+    for obj in [alm, alm2]:
+        obj.get_consensus(consensus='consensus')
+    assert alm2.get_entries('consensus') == alm.get_entries('consensus')
+
+
 def test_get_consensus(alm):
     # align all sequences using standard params
     alm.get_consensus(consensus="consensus", classes=True)
@@ -1,6 +1,8 @@
 """
 Test wordlist module.
 """
+import itertools
+
 import pytest
 
 from lingpy import Wordlist, Alignments
@@ -49,6 +51,25 @@ def test_wl2dst(wordlist):
     assert dst[0][2] == 1
 
 
+def test_wl2dst_scores(wordlist):
+    from lingpy.basic.ops import get_score
+
+    # add synonyms and missing entries to the word list
+    for idx in list(wordlist)[::7]:
+        wordlist[idx, 'concept'] = wordlist[idx + 1, 'concept']
+    for mode in ['shared', 'jaccard', 'swadesh']:
+        dst = wl2dst(wordlist, mode=mode, refB='glossid')
+        for (i, taxA), (j, taxB) in itertools.product(
+                enumerate(wordlist.taxa), repeat=2):
+            if i != j:
+                assert dst[i][j] == get_score(
+                    wordlist, 'cogid' if i < j else 'glossid', mode,
+                    taxA, taxB)
+        if mode == 'shared':
+            assert dst[0][0] == len(wordlist.get_list(
+                col=wordlist.taxa[0], flat=True))
+
+
 def test_wl2qlc(tmp_path, test_data, wordlist):
     stamp = 'test-stamp'
     out = tmp_path / 'test'
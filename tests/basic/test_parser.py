@@ -90,3 +90,24 @@ def test_add_entries(parser, mocker):
 
     parser.add_entries('tg', defaultdict(int), lambda i: i + 1, override=True)
     parser.add_entries('tg', 'doculect,concept', lambda v, id_: 'abc', override=True)
+
+
+def test_add_entries_batch(parser):
+    parser.add_entries('ltaxon', 'doculect', lambda t: t.lower())
+    parser.add_entries(
+        'btaxon', 'doculect', lambda col: [t.lower() for t in col], batch=True)
+    assert [parser[k, 'btaxon'] for k in parser] == \
+        [parser[k, 'ltaxon'] for k in parser]
+
+    parser.add_entries(
+        'dc', 'doculect,concept', lambda col, sep: [sep.join(v) for v in col],
+        batch=True, sep='-')
+    key = list(parser)[0]
+    assert parser[key, 'dc'] == parser[key, 'doculect'] + '-' + parser[key, 'concept']
+
+    parser.add_entries(
+        'btaxon', {k: k for k in parser}, lambda col: col, override=True,
+        batch=True)
+    assert parser[key, 'btaxon'] == key
+    with pytest.raises(ValueError):
+        parser.add_entries('x', 'doculect', lambda col: col[1:], batch=True)
@@ -0,0 +1,62 @@
+import pytest
+
+from lingpy import basictypes
+from lingpy.basic.storage import ColumnStore
+from lingpy.basic.wordlist import Wordlist
+
+
+@pytest.fixture
+def store():
+    return ColumnStore({
+        1: ['a', 1, 0.5, basictypes.lists('t a + x'), None],
+        2: ['b', 2, 1.5, basictypes.lists('k'), 'x'],
+        4: ['a', 3, 2.5, basictypes.lists(''), []],
+    })
+
+
+def test_ColumnStore(store):
+    assert len(store) == 3 and list(store) == [1, 2, 4]
+    assert 3 not in store and 4 in store
+    assert store[1] == ['a', 1, 0.5, ['t', 'a', '+', 'x'], None]
+    assert store[1][-2].n == [['t', 'a'], ['x']]
+    assert type(store[2][1]) is int
+    assert store[4][1:3] == [3, 2.5]
+    assert store[1] + ['y'] == list(store[1]) + ['y']
+    assert store.column(0) == ['a', 'b', 'a']
+    assert dict(store) == {1: store[1], 2: store[2], 4: store[4]}
+
+    store[2][0] = 'c'
+    store[2][3] = basictypes.lists('k a')
+    assert store[2][:1] == ['c'] and store[2][3] == ['k', 'a']
+    # values which do not fit the column are stored as well
+    store[1][1] = 'x'
+    assert store.column(1) == ['x', 2, 3]
+
+    with pytest.raises(TypeError):
+        store[1].append('x')
+    store.set_column(store.width, [1, 2, 3])
+    assert store[4][-1] == 3
+    with pytest.raises(ValueError):
+        store.set_column(0, [1])
+
+
+def test_wordlist(test_data):
+    wl = Wordlist(str(test_data / 'KSL.qlc'))
+    wlc = Wordlist(str(test_data / 'KSL.qlc'), storage='columns')
+    assert wlc[1] == wl[1]
+    assert wlc.get_list(col='English', entry='tokens', flat=True) == \
+        wl.get_list(col='English', entry='tokens', flat=True)
+    assert wlc.get_dict(row='hand', entry='ipa') == \
+        wl.get_dict(row='hand', entry='ipa')
+    assert wlc.get_etymdict(ref='cogid') == wl.get_etymdict(ref='cogid')
+
+    for w in [wl, wlc]:
+        w.add_entries('tokens2', 'tokens', lambda x: x[:1])
+        w.add_entries('cogid', 'cogid', lambda x: x + 1, override=True)
+    assert wlc.get_entries('tokens2') == wl.get_entries('tokens2')
+    assert wlc.get_entries('cogid') == wl.get_entries('cogid')
+
+    wl2 = Wordlist(wlc)
+    assert wl2[1] == wl[1]
+    with pytest.raises(ValueError):
+        Wordlist(str(test_data / 'KSL.qlc'), storage='x')
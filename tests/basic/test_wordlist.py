@@ -80,6 +80,50 @@ def test_get_dict(wordlist):
         wordlist.get_dict(**{"row": "Hand"})
 
 
+def test_index(wordlist):
+    idx = wordlist.get_dict(col='German')['hand'][0]
+    wordlist[idx, 'doculect'] = 'Low German'
+    assert 'Low German' in wordlist.cols and wordlist.width == 8
+    assert wordlist.get_dict(col='Low German') == {'hand': [idx]}
+    assert idx not in wordlist.get_dict(col='German')['hand']
+    assert idx in wordlist.get_list(row='hand', flat=True)
+
+    wordlist[idx, 'concept'] = 'paw'
+    assert 'paw' in wordlist.rows and wordlist.height == 201
+    assert wordlist.get_list(col='Low German', flat=True) == [idx]
+    assert wordlist.get_dict(row='paw')['Low German'] == [idx]
+    assert wordlist.get_etymdict(ref='cogid')[wordlist[idx, 'cogid']][5] == [idx]
+
+    wordlist[idx, 'doculect'] = 'German'
+    assert 'Low German' not in wordlist.cols and wordlist.width == 7
+    assert wordlist.get_list(row='paw', flat=False) == [
+        [0, 0, 0, idx, 0, 0, 0]]
+
+    wordlist.add_entries('concept', 'concept', lambda x: x.upper(), override=True)
+    assert 'PAW' in wordlist.rows and 'paw' not in wordlist.rows
+
+
+def test_index_rename(wordlist):
+    for idx in wordlist.get_list(row='hand', flat=True):
+        wordlist[idx, 'concept'] = 'Paw'
+    for idx in wordlist.get_list(col='German', flat=True):
+        wordlist[idx, 'doculect'] = 'Allemand'
+    rows = sorted(set(wordlist[idx, 'concept'] for idx in wordlist),
+                  key=lambda x: x.lower())
+    cols = sorted(set(wordlist[idx, 'doculect'] for idx in wordlist),
+                  key=lambda x: x.lower())
+    assert wordlist.rows == rows and wordlist.height == 200
+    assert wordlist.cols == cols and wordlist.width == 7
+    assert 'hand' not in wordlist.rows and 'German' not in wordlist.cols
+    assert cols.index('Allemand') == 1
+    assert wordlist.get_dict(col='Allemand') == {
+        concept: [idx for idx in wordlist if wordlist[idx, 'doculect'] ==
+                  'Allemand' and wordlist[idx, 'concept'] == concept]
+        for concept in set(wordlist[idx, 'concept'] for idx in wordlist
+                           if wordlist[idx, 'doculect'] == 'Allemand')}
+    assert len(wordlist.get_dict(col='Allemand')['Paw']) == 1
+
+
 def test_renumber(wordlist):
     wordlist.renumber('cogid', 'dummy')
 
@@ -154,6 +198,26 @@ def test_export(tmp_path, wordlist):
         wordlist.export(fmt, filename=fn)
 
 
+def test_snapshot(tmp_path, wordlist, mocker):
+    from lingpy.basic import wordlist as module
+    from lingpy.compare.lexstat import LexStat
+
+    wordlist.add_entries('tokens2', 'tokens', lambda x: x[:1])
+    wordlist.save_snapshot(str(tmp_path / 'wl.snapshot'))
+    wl = Wordlist.from_snapshot(str(tmp_path / 'wl.snapshot'))
+    assert wl.get_entries('tokens2') == wordlist.get_entries('tokens2')
+    assert wl._class['tokens'] == wordlist._class['tokens']
+    with pytest.raises(TypeError):
+        LexStat.from_snapshot(str(tmp_path / 'wl.snapshot'))
+
+    mocker.patch.object(module, 'SNAPSHOT_FORMAT', 0)
+    with pytest.raises(ValueError):
+        Wordlist.from_snapshot(str(tmp_path / 'wl.snapshot'))
+    (tmp_path / 'x.tsv').write_text('ID\tDOCULECT', encoding='utf8')
+    with pytest.raises(ValueError):
+        Wordlist.from_snapshot(str(tmp_path / 'x.tsv'))
+
+
 def test_get_wordlist(test_data):
     from lingpy.basic.wordlist import get_wordlist
     wl1 = get_wordlist(str(test_data / 'mycsvwordlist.csv'))
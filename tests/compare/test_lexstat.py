@@ -1,5 +1,6 @@
 import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from clldutils import jsonlib
@@ -113,6 +114,48 @@ def test_init3(test_data, lextstat_factory):  # with kw check=True
         LexStat({0: ['concept', 'language', 'ipa']})
 
 
+def test_preprocess(lex, lextstat_factory):
+    columns = ['doculect', 'concept', 'ipa', 'tokens', 'langid', 'classes']
+    data = {0: columns}
+    data.update({key: [lex[key, c] for c in columns] for key in lex})
+    data[1][-1] = 'X' * len(data[1][3])
+    lex2 = lextstat_factory({k: list(v) for k, v in data.items()})
+    assert lex2[1, 'classes'] == data[1][-1]
+    for key in list(lex)[1:]:
+        for column in ['sonars', 'prostrings', 'numbers', 'weights']:
+            assert lex2[key, column] == lex[key, column]
+
+    data[1][3] = None
+    with pytest.raises(ValueError, match='item ID: 1'):
+        lextstat_factory(data)
+
+
+def test_pairs(lex):
+    assert len(lex.pairs) == lex.width * (lex.width + 1) // 2
+    assert ('German', 'English') not in lex.pairs
+    with pytest.raises(KeyError):
+        lex.pairs['German', 'English']
+
+    pairs = lex.pairs['English', 'German']
+    assert pairs == list(lex.pairs.iter_pairs('English', 'German'))
+    assert all(lex[a, 'concept'] == lex[b, 'concept'] for a, b in pairs)
+    segments = [(''.join(lex[a, 'tokens']), ''.join(lex[b, 'tokens']))
+                for a, b in pairs]
+    assert len(set(segments)) == len(segments)
+    assert all(a == b for a, b in lex.pairs['German', 'German'])
+
+
+def test_snapshot(lex, tmp_path, get_scorer_kw):
+    lex.get_scorer(**get_scorer_kw)
+    lex.save_snapshot(str(tmp_path / 'lex.snapshot'))
+    lex2 = LexStat.from_snapshot(str(tmp_path / 'lex.snapshot'))
+    assert lex2.pairs == lex.pairs and lex2.chars == lex.chars
+    assert lex2.cscorer.matrix == lex.cscorer.matrix
+    for obj in [lex, lex2]:
+        obj.cluster(method='lexstat', threshold=0.6, ref='lexid')
+    assert lex2.get_entries('lexid') == lex.get_entries('lexid')
+
+
 def test_getitem(lex):
     assert lex['xyz'] is None
 
@@ -128,6 +171,65 @@ def test_get_scorer(lex, mocker, get_scorer_kw, log):
     lex.get_scorer(method='markov', **get_scorer_kw)
 
 
+def test_get_corrdist_parallel(lex):
+    corrdist = lex._get_corrdist()
+    included = dict(lex._included)
+    assert lex._get_corrdist(processes=2) == corrdist
+    assert lex._included == included
+    with ThreadPoolExecutor(2) as executor:
+        assert lex._get_corrdist(executor=executor) == corrdist
+
+
+def test_get_randist_parallel(lex, get_scorer_kw):
+    lex._get_corrdist()
+    for method in ['shuffle', 'markov']:
+        randist = lex._get_randist(method=method, seed=1, **get_scorer_kw)
+        assert randist == lex._get_randist(
+            method=method, seed=1, processes=2, **get_scorer_kw)
+        assert randist != lex._get_randist(
+            method=method, seed=2, **get_scorer_kw)
+
+
+def test_get_scorer_cache(test_data, lextstat_factory, get_scorer_kw, tmp_path, mocker):
+    lex = lextstat_factory(str(test_data / 'KSL.qlc'))
+    lex.get_scorer(cache=str(tmp_path), seed=1, **get_scorer_kw)
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+
+    lex2 = lextstat_factory(str(test_data / 'KSL.qlc'))
+    mocker.spy(lex2, '_get_corrdist')
+    lex2.get_scorer(cache=str(tmp_path), seed=1, **get_scorer_kw)
+    assert not lex2._get_corrdist.called
+    assert lex2.cscorer.matrix == lex.cscorer.matrix
+    assert lex2._randist == lex._randist
+
+    # different parameters or data lead to a new computation
+    lex2.get_scorer(cache=str(tmp_path), seed=1, force=True, runs=20)
+    assert lex2._get_corrdist.called
+    lex3 = lextstat_factory(str(test_data / 'KSL2.qlc'))
+    assert lex3._get_scorer_key('', **lex3.get_scorer(defaults=True)) != \
+        lex._get_scorer_key('', **lex.get_scorer(defaults=True))
+
+    # all parameters of the distributions enter the key
+    defaults = lex.get_scorer(defaults=True)
+    key = lex._get_scorer_key('', **defaults)
+    for name, value in [
+            ('rands', 10), ('limit', 5), ('preprocessing_method', 'lexstat')]:
+        assert lex._get_scorer_key('', **dict(defaults, **{name: value})) != key
+
+    # so do the cognate sets reused by the preprocessing
+    defaults.update(preprocessing=True, ref='cogid')
+    key = lex._get_scorer_key('', **defaults)
+    lex.add_entries('cogid', 'cogid', lambda x: x + 1, override=True)
+    assert lex._get_scorer_key('', **defaults) != key
+
+    # the pairs included in the distributions are restored from the cache
+    lex4 = lextstat_factory(str(test_data / 'KSL.qlc'))
+    mocker.spy(lex4, '_get_corrdist')
+    lex4.get_scorer(cache=str(tmp_path), seed=1, **get_scorer_kw)
+    assert not lex4._get_corrdist.called
+    assert lex4._included == lex._included
+
+
 def test_cluster(lex, mocker, get_scorer_kw):
     lex.get_scorer(**get_scorer_kw)
     lex.cluster(method="lexstat", threshold=0.7)
@@ -140,6 +242,44 @@ def test_cluster(lex, mocker, get_scorer_kw):
     assert all(x in lex.header for x in 'scaid lexstatid editid turchinid'.split())
 
 
+def test_cluster_parallel(lex, get_scorer_kw):
+    lex.get_scorer(**get_scorer_kw)
+    for method in ['lexstat', 'sca', 'edit-dist']:
+        kw = dict(method=method, threshold=0.6, override=True)
+        lex.cluster(ref='serial', **kw)
+        lex.cluster(ref='parallel', processes=2, **kw)
+        assert lex.get_entries('parallel') == lex.get_entries('serial')
+        with ThreadPoolExecutor(2) as executor:
+            lex.cluster(ref='threads', executor=executor, **kw)
+        assert lex.get_entries('threads') == lex.get_entries('serial')
+
+
+def test_self_scores(lex, get_scorer_kw):
+    lex.cluster(method='sca', threshold=0.45)
+    assert lex.self_scores.misses == len(lex) and lex.self_scores.hits == 0
+    lex.cluster(method='sca', threshold=0.45, ref='scaid2')
+    assert lex.self_scores.hits == len(lex)
+    assert lex.get_entries('scaid2') == lex.get_entries('scaid')
+
+    lex.get_scorer(**get_scorer_kw)
+    lex.cluster(method='lexstat', threshold=0.6)
+    assert lex.self_scores.misses == 2 * len(lex)
+    # a new scorer invalidates the scores computed with the old one
+    lex.get_scorer(force=True, **get_scorer_kw)
+    lex.align_pairs(1, 2, method='lexstat', pprint=False)
+    assert lex.self_scores.misses == 2 * len(lex) + 2
+    assert len(lex.self_scores) == len(lex) + 2
+
+    # scores are computed anew for changed sequences
+    score = lex._self_score('cscorer', 1, lex[1, 'numbers'], 0.3)
+    lex.add_entries(
+        'numbers', 'numbers', lambda x: x[:1], override=True)
+    assert lex._self_score('cscorer', 1, lex[1, 'numbers'], 0.3) != score
+
+    lex.self_scores.clear()
+    assert lex.self_scores.hits == lex.self_scores.misses == 0
+
+
 def test_align_pairs(lex):
     assert not lex.align_pairs('English', 'German', method='sca', pprint=False)
     assert lex.align_pairs(1, 2, method='sca', pprint=False)[-1] > 0.5
@@ -153,6 +293,19 @@ def test__get_matrices(lex):
     assert matrix[0][1] == 1
 
 
+def test__pair_distances(lex, get_scorer_kw):
+    lex.get_scorer(**get_scorer_kw)
+    indices = lex.get_list(row='hand', flat=True)
+    pairs = [(0, 1), (2, 5), (6, 3)]
+    kw = dict(scale=0.5, factor=0.3, restricted_chars='_T', mode='overlap',
+              gop=-2, restriction='')
+    for method in ['sca', 'lexstat', 'edit-dist']:
+        function = lex._distance_method(method, **kw)
+        distances = lex._pair_distances(indices, pairs, method, **kw)
+        assert distances.tolist() == [
+            function(indices[i], indices[j]) for i, j in pairs]
+
+
 def test_get_subset(test_data, lex):
     lex.get_subset([])
     assert [v for v in lex.subsets.values() if v] == []
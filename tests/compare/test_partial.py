@@ -37,6 +37,20 @@ def test_get_partial_matrices(part):
             assert [x[0] for x in tracer]
 
 
+def test_snapshot(part2, tmp_path):
+    part2.get_partial_scorer(runs=10, seed=1, force=True)
+    part2.save_snapshot(str(tmp_path / 'part.snapshot'))
+    part3 = Partial.from_snapshot(str(tmp_path / 'part.snapshot'))
+    assert isinstance(part3, Partial)
+    assert part3.pairs == part2.pairs
+    assert part3.cscorer.matrix == part2.cscorer.matrix
+    for obj in [part2, part3]:
+        obj.partial_cluster(
+            method='lexstat', threshold=0.6, cluster_method='upgma',
+            ref='parts')
+    assert part3.get_entries('parts') == part2.get_entries('parts')
+
+
 def test_partial_cluster(part, part2):
     with pytest.raises(ValueError):
         part.partial_cluster(cluster_method='upgmu')
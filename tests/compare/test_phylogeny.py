@@ -2,11 +2,13 @@
 Test the TreBor borrowing detection algorithm.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 import lingpy
-from lingpy.compare.phylogeny import PhyBo
+from lingpy.compare.phylogeny import PhyBo, TreeIndex, get_gls
+from lingpy.thirdparty import cogent as cg
 
 
 @pytest.fixture
@@ -69,6 +71,34 @@ def test_get_GLS(inputfile, tmp_path, test_data):
     phy.get_stats(glm)
 
 
+def test_TreeIndex(inputfile, tmp_path):
+    tree = cg.LoadTree(treestring='((a,b)x,(c,d,e)y)r;')
+    index = TreeIndex(tree, ['e', 'd', 'c', 'b', 'a'])
+    assert index.tips(index.index['y']) == ['c', 'd', 'e']
+    assert index.tips(index.index['a']) == ['a']
+    assert [index.names[n] for n in index.nontips(index.index['r'])] == ['x', 'y']
+    assert index.ntips[index.index['r']] == 5
+
+    assert index.lowest_common_ancestor(0) is None
+    for taxa, node in [('a', 'a'), ('ab', 'x'), ('cd', 'y'), ('ae', 'r')]:
+        assert index.names[index.lowest_common_ancestor(index.mask(taxa))] == node
+    assert [index.names[n] if n is not None else None
+            for n in TreeIndex(tree, 'abcde').lowest_common_ancestors(
+                [[1, 1, 0, 0, 0], [0, 0, 1, 0, 1], [0, 0, 0, 0, 0],
+                 [0, 0, 0, 1, 0], [1, 0, 0, 0, 1]])] == ['x', 'y', None, 'd', 'r']
+
+    assert get_gls([1, 1, 0, 0, 0], 'abcde', tree) == [('x', 1)]
+    assert get_gls([1, 1, 0, 0, 0], 'abcde', index) == [('x', 1)]
+
+    # top-down scenarios do not depend on previous analyses
+    phy = PhyBo(inputfile, output_dir=str(tmp_path))
+    phy.get_GLS(mode='topdown', restriction=2)
+    gls = phy.gls['t-2']
+    phy.get_GLS(mode='weighted')
+    phy.get_GLS(mode='topdown', restriction=2, force=True)
+    assert phy.gls['t-2'] == gls
+
+
 def test_plot(inputfile, mocker, Bmp, Sp, Plt, tmp_path):
     mocker.patch('lingpy.compare.phylogeny.mpl', new=mocker.MagicMock())
     mocker.patch('lingpy.compare.phylogeny.gls2gml', new=mocker.MagicMock())
@@ -102,3 +132,17 @@ def test_plot(inputfile, mocker, Bmp, Sp, Plt, tmp_path):
     phy.get_edge(phy.best_model, edge1, edge2, msn=True)
     phy.get_PDC('w-2-1', aligned_output=True)
     phy.plot_concept_evolution(phy.best_model, concept="I")
+
+
+def test_analyze_parallel(inputfile, mocker, Sp, tmp_path):
+    mocker.patch('lingpy.compare.phylogeny.sp', new=Sp)
+    runs = [('weighted', (2, 1)), ('restriction', 3), ('topdown', 2)]
+
+    phy = PhyBo(inputfile, output_dir=str(tmp_path))
+    phy.analyze(runs=runs)
+    with ThreadPoolExecutor(2) as executor:
+        for kw in [dict(processes=2), dict(executor=executor)]:
+            phy2 = PhyBo(inputfile, output_dir=str(tmp_path))
+            phy2.analyze(runs=runs, **kw)
+            assert phy2.gls == phy.gls
+            assert phy2.stats['r-3'] == phy.stats['r-3']
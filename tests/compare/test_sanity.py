@@ -31,6 +31,29 @@ def test_mutual_coverage_subset(wl):
     assert b[0][1][0] == 'Albanian'
 
 
+def test_mutual_coverage_thresholds(wl):
+    coverage = sn.mutual_coverage(wl)
+    minimum = min(len(v) for values in coverage.values()
+                  for v in values.values())
+    assert sn.mutual_coverage_check(wl, minimum)
+    assert not sn.mutual_coverage_check(wl, minimum + 1)
+    assert sn.average_coverage(wl) == sum(
+        len(v) for values in coverage.values() for v in values.values()
+    ) / (wl.width * (wl.width - 1)) / wl.height
+    assert sn.mutual_coverage_subset(wl, wl.height + 1) == (0, [])
+
+
+def test__maximum_cliques():
+    edges = [(0, 1), (0, 2), (1, 2), (2, 3), (3, 4), (3, 5), (4, 5), (5, 6)]
+    neighbors = [0] * 7
+    for a, b in edges:
+        neighbors[a] |= 1 << b
+        neighbors[b] |= 1 << a
+    assert sorted(sorted(c) for c in sn._maximum_cliques(neighbors)) == [
+        [0, 1, 2], [3, 4, 5]]
+    assert sorted(sn._maximum_cliques([0, 0])) == [[0], [1]]
+
+
 def test_synonymy(wl):
     syns = sn.synonymy(wl)
     assert max(syns.values()) == 1
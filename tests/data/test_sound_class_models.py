@@ -14,3 +14,21 @@ def test_model(model):
     values = list(_model.converter.keys())
     for segment in set(seg for seg in _model.converter):
         assert (segment in values) or (segment == '-')
+
+
+def test_lazy_model():
+    from lingpy.data.model import LazyModel
+
+    model = LazyModel('dolgo')
+    assert not model.loaded
+    assert repr(model) == repr(Model('dolgo'))
+    assert model == Model('dolgo')
+    assert not model.loaded
+    assert model['a'] == 'V'
+    assert model.loaded
+    assert model.converter == Model('dolgo').converter
+    assert not hasattr(model, 'missing')
+    assert not hasattr(LazyModel('color'), 'scorer')
+
+    with pytest.raises(OSError):
+        LazyModel('unknown').converter
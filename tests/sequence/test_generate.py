@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from lingpy.sequence.generate import MCPhon
@@ -31,6 +33,13 @@ def test_get_string(gen, words):
     assert ''.join([x[1] for x in string2]) not in words
 
 
+def test_rng(words):
+    strings = [
+        [MCPhon(words, rng=random.Random(seed)).get_string() for _ in range(5)]
+        for seed in [1, 1]]
+    assert strings[0] == strings[1]
+
+
 def test_evaluate_string(gen):
     scores = gen.evaluate_string('hatze')
     assert scores[1] < 0
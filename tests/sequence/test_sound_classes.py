@@ -5,7 +5,7 @@ import pytest
 
 from lingpy import rc, csv2list
 from lingpy.sequence.sound_classes import ipa2tokens, token2class, \
-    tokens2class, prosodic_string, prosodic_weights, class2tokens, pid, \
+    tokens2class, tokens2class_many, prosodic_string, prosodic_weights, class2tokens, pid, \
     check_tokens, sampa2uni, pgrams, syllabify, tokens2morphemes, ono_parse, \
     clean_string, _get_brackets, codepoint
 
@@ -76,6 +76,27 @@ def test_tokens2class():
         tokens2class('bla', 'sca')
 
 
+def test_tokens2class_many(mocker):
+    seqs = ['tʰ ɔ x ˈth ə r A ˈI ʲ'.split(' '), 'th o ?/x a'.split(' ')]
+    assert tokens2class_many(seqs, 'dolgo') == [
+        tokens2class(seq, 'dolgo') for seq in seqs]
+    assert tokens2class_many(seqs, 'cv', cldf=False)[1][2] == '0'
+    assert tokens2class_many(seqs, 'cv')[1][2] == 'C'
+
+    # converted tokens are stored with the model
+    model = rc('dolgo')
+    assert 'ˈth' in model._class_tables[rc('stress'), rc('diacritics'), True]
+    assert tokens2class(['x'], {'x': 'K'}) == ['K']
+    mocker.patch('lingpy.sequence.sound_classes._CLASS_TABLE_SIZE', 2)
+    tokens2class(list('abcde'), model)
+    assert len(model._class_tables[rc('stress'), rc('diacritics'), True]) <= 2
+
+    with pytest.raises(ValueError):
+        tokens2class_many([['A']], 'dolgo')
+    with pytest.raises(ValueError):
+        tokens2class_many(['bla'], 'sca')
+
+
 def test_prosodic_string():
     seq = 'tʰ ɔ x t ə r'.split(' ')
     assert prosodic_string(seq) == 'AXMBYN'
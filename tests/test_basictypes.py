@@ -51,3 +51,15 @@ def test_all():
     app = strings('1 2 3')
     app[1] = 2
     assert app[1] == '2'
+
+
+def test_pickle():
+    import pickle
+    from lingpy.basictypes import aligned
+
+    for value in [strings('a b'), ints('1 2'), lists('a b + c', sep=' + '),
+                  aligned('a - b')]:
+        copy = pickle.loads(pickle.dumps(value))
+        assert copy == value and type(copy) == type(value)
+        assert getattr(copy, 'n', None) == getattr(value, 'n', None)
+    assert pickle.loads(pickle.dumps(ints('1 2')))._type == int
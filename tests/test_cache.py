@@ -1,3 +1,7 @@
+import os
+
+import pytest
+
 from lingpy import cache
 
 
@@ -6,3 +10,48 @@ def test_cache(tmp_path):
     filename = 'lingpy_test.CSV'
     cache.dump(d, filename, d=tmp_path / 'cache')
     assert cache.load(filename, d=tmp_path / 'cache') == d
+
+
+def test_LRUCache(tmp_path):
+    lru = cache.LRUCache(tmp_path / 'lru', max_entries=2)
+    key = cache.LRUCache.key('a', 1)
+    assert key == cache.LRUCache.key('a', 1)
+    assert key != cache.LRUCache.key('a1')
+    assert lru.get(key) is None
+
+    lru.set(key, [1, 2])
+    assert key in lru
+    assert lru.get(key) == [1, 2]
+    os.utime(str(lru._path(key)), (1, 1))
+    lru.set('b', 'b')
+    os.utime(str(lru._path('b')), (2, 2))
+    lru.set('c', 'c')
+    assert len(lru) == 2
+    assert key not in lru
+
+    # reading an object marks it as recently used
+    os.utime(str(lru._path('c')), (3, 3))
+    lru.get('b')
+    lru.set('d', 'd')
+    assert 'b' in lru and 'c' not in lru
+
+    lru.max_size = lru.size - 1
+    lru.evict()
+    assert len(lru) == 1
+    lru.clear()
+    assert len(lru) == 0
+
+
+def test_cache_sources(tmp_path):
+    source = tmp_path / 'model.txt'
+    source.write_text('a : b', encoding='utf8')
+    cache.dump('data', 'model', d=tmp_path / 'cache', sources=[source])
+    assert cache.load('model', d=tmp_path / 'cache', sources=[source]) == 'data'
+
+    source.write_text('a : c', encoding='utf8')
+    with pytest.raises(ValueError):
+        cache.load('model', d=tmp_path / 'cache', sources=[source])
+    # adding a new source file invalidates the object as well
+    cache.dump('data', 'model', d=tmp_path / 'cache', sources=[source])
+    with pytest.raises(ValueError):
+        cache.load('model', d=tmp_path / 'cache', sources=[source, tmp_path / 'x'])
@@ -20,3 +20,11 @@ def test_rc(key, val, test):
     d = {}
     rc(rcParams_=d, **{key: val})
     assert test(d)
+
+
+def test_rc_lazy_models():
+    d = {}
+    rc(rcParams_=d, schema='el')
+    assert d['model'] is d['asjp']
+    assert d['model'].name == 'asjp_el'
+    assert not d['dolgo'].loaded
@@ -42,6 +42,12 @@ def test_combinations2():
         assert list(util.multicombinations2(ch)) == list(fm(ch))
 
 
+def test_parallel_map():
+    items = list(range(10))
+    assert list(util.parallel_map(abs, items)) == items
+    assert list(util.parallel_map(abs, items, processes=2)) == items
+
+
 def test_join():
     assert util.join('.') == ''
     assert util.join('.', 1) == '1'
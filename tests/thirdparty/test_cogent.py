@@ -79,6 +79,39 @@ def test_Tree():
     tree[0] = tree[0]
 
 
+def test_buildIndex(test_data):
+    plain = LoadTree(str(test_data / 'phylogeny.tre'))
+    tree = LoadTree(str(test_data / 'phylogeny.tre'))
+    index = tree.buildIndex()
+    assert tree._index is index and tree[0]._index is index
+
+    for node in plain.traverse():
+        other = tree.getNodeMatchingName(node.Name)
+        assert other.Name == node.Name
+        assert other.getTipNames() == node.getTipNames()
+    for names in [['Beijing', 'Xiangtan'], ['Shanghai', 'Suzhou', 'Wenzhou'],
+                  ['Beijing', 'Unknown'], ['Unknown', 'Nowhere']]:
+        node = plain.lowestCommonAncestor(names)
+        other = tree.lowestCommonAncestor(names)
+        assert getattr(node, 'Name', None) == getattr(other, 'Name', None)
+    assert tree.getConnectingEdges('Beijing', 'Xiangtan') == [
+        tree.getNodeMatchingName(node.Name) for node in
+        plain.getConnectingEdges('Beijing', 'Xiangtan')]
+    assert tree.getNodeMatchingName('Beijing').distance(
+        tree.getNodeMatchingName('Fuzhou')) == plain.getNodeMatchingName(
+            'Beijing').distance(plain.getNodeMatchingName('Fuzhou'))
+
+    # changes of the topology invalidate the index
+    tree.removeNode(tree[0])
+    plain.removeNode(plain[0])
+    assert not index.valid
+    assert tree.getTipNames() == plain.getTipNames()
+    assert tree._index is not index and tree._index.valid
+    assert all(node._index is None for node in tree.copy().traverse())
+    tree.clearIndex()
+    assert tree._index is None
+
+
 def test_more_trees():
     tree = LoadTree('((a:1,b:1):2,(c:3,d:4):5);')
     tree2 = LoadTree('((a,b),(c,d));')